@@ -10,6 +10,12 @@ from typing import List, Tuple, Optional
 from lunaengine.core import Scene, LunaEngine, Renderer
 from lunaengine.ui import *
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 class Leaderboard2048:
     """Leaderboard handler for 2048 game"""
     
@@ -875,6 +881,8 @@ def main():
             fullscreen = True
     
     engine = LunaEngine("2048 - LunaEngine", 1024, 768, fullscreen=fullscreen)
+    if luna_telemetry:
+        luna_telemetry.connect_from_env(engine)
     
     pygame.display.set_icon(pygame.image.load(f"{os.path.dirname(__file__)}/icon.png"))
     
@@ -3,6 +3,12 @@ from lunaengine.ui import *
 from lunaengine.graphics import SpriteSheet, Animation, Camera, CameraMode, ParticleConfig, ParticleType
 import pygame, os, random, time, json
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 path_assets = os.path.dirname(__file__) + '/assets/'
 path_font_jersey = os.path.join(path_assets, 'Jersey.ttf')
 path_font_roboto = os.path.join(path_assets, 'RobotoMono.ttf')
@@ -797,6 +803,8 @@ def main():
             fullscreen = True
     
     engine = LunaEngine("Farming", 1280, 720, fullscreen=fullscreen)
+    if luna_telemetry:
+        luna_telemetry.connect_from_env(engine)
     pygame.display.set_icon(pygame.image.load(f"{os.path.dirname(__file__)}/assets/icon.png"))
     engine.initialize()
     
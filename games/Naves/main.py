@@ -3,6 +3,12 @@ from lunaengine.graphics import SpriteSheet, Animation, Camera, CameraMode, Part
 from lunaengine.ui import *
 import pygame, os, json, time, random, argparse, sys
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 parser = argparse.ArgumentParser()
 parser.add_argument('--debug', action='store_true', help='Enable debug mode')
 args = parser.parse_args()
@@ -484,6 +490,8 @@ def main():
             fullscreen = True
     data.started = time.time()
     engine = LunaEngine("Naves", width=1024, height=768, fullscreen=fullscreen)
+    if luna_telemetry:
+        luna_telemetry.connect_from_env(engine)
     pygame.display.set_icon(pygame.image.load(f"{assets_path}/icon.png"))
     engine.initialize()
     
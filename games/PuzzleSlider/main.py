@@ -4,6 +4,12 @@ from lunaengine.ui import *
 from lunaengine.backend import OpenGLRenderer
 from typing import Literal, Optional, Tuple
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 class _Data:
     screen_width = 1024
     screen_height = 768
@@ -610,6 +616,8 @@ def main():
             fullscreen = True
     
     engine = LunaEngine("Puzzle Slider", 1024, 768, fullscreen=fullscreen)
+    if luna_telemetry:
+        luna_telemetry.connect_from_env(engine)
     pygame.display.set_icon(pygame.image.load(f"{os.path.dirname(__file__)}/icon.png"))
     engine.initialize()
     
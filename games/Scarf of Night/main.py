@@ -3,6 +3,12 @@ from lunaengine.ui import *
 from lunaengine.graphics import SpriteSheet, Animation, Camera, CameraMode, ParticleConfig, ParticleType
 import pygame, os, random, time, json, sys
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 path_assets = os.path.dirname(__file__) + '/assets/'
 path_font_ninja = os.path.join(path_assets, 'ninja_font.ttf')
 
@@ -1269,6 +1275,8 @@ def main():
             if sys.argv[1] == "--fullscreen":
                 fullscreen = True
         engine = LunaEngine("Scarf of Night", 1280, 720, fullscreen=fullscreen)
+        if luna_telemetry:
+            luna_telemetry.connect_from_env(engine)
         pygame.display.set_icon(pygame.image.load(f"{os.path.dirname(__file__)}/assets/icon.png"))
         engine.initialize()
         
@@ -8,6 +8,12 @@ from lunaengine.core import Scene, LunaEngine, Renderer
 from lunaengine.ui import *
 import pygame
 
+# Frame-time telemetry, provided by the launcher when the game is started from it
+try:
+    import luna_telemetry
+except ImportError:
+    luna_telemetry = None
+
 class Leaderboard:
     def __init__(self, filename="snake_leaderboard.json"):
         self.filename = filename
@@ -588,6 +594,8 @@ def main():
             if sys.argv[1] == "--fullscreen":
                 fullscreen = True
         engine = LunaEngine("Snake Game", 1024, 720, fullscreen=fullscreen)
+        if luna_telemetry:
+            luna_telemetry.connect_from_env(engine)
         pygame.display.set_icon(pygame.image.load(f"{os.path.dirname(__file__)}/icon.png"))
         engine.initialize()
         
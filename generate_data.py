@@ -3,7 +3,7 @@ This file will generate data for games/
 Also will make the zipped version
 """
 
-import os, sys, json, shutil, stat
+import os, sys, json, shutil, stat, hashlib, zipfile
 
 path_root = os.path.dirname(os.path.abspath(__file__))
 path_games = path_root + '\\games'
@@ -25,9 +25,12 @@ class game_info:
     game_description:str
     game_main_file:str
     game_icon:str
+    game_icon_hash:str
     total_files:int
     total_size:float
     requirements:list[str]
+    game_manifest:list[dict]
+    game_archive_hash:str
     
 
 def count_files(game_path:str) -> tuple[int, float]:
@@ -51,6 +54,32 @@ def count_files(game_path:str) -> tuple[int, float]:
         
     return count, size
 
+def hash_file(file_path:str) -> str:
+    """
+    Returns the SHA-256 hex digest of a file
+    """
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(65536), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+def build_manifest(zip_path:str) -> list[dict]:
+    """
+    Returns the path, size and SHA-256 of every file inside the zip, the launcher verifies installs with it
+    """
+    manifest = []
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        for member in zf.infolist():
+            if member.is_dir():
+                continue
+            sha = hashlib.sha256()
+            with zf.open(member) as f:
+                for block in iter(lambda: f.read(65536), b''):
+                    sha.update(block)
+            manifest.append({'path': member.filename, 'size': member.file_size, 'sha256': sha.hexdigest()})
+    return manifest
+
 def fix_string(text:bytes, is_list:bool = False) -> str:
     if is_list:
         return [str(tag).replace('\r', '').replace('\n', '').replace(' ', '') for tag in list(text.decode('utf-8').split(','))]
@@ -72,6 +101,9 @@ def get_game_info(game_path) -> game_info:
         gi.game_icon = fix_string(f.readline(-1))
         gi.game_compact_file = f'{gi.game_name}-{gi.game_version}'
         
+    # Lets the launcher icon cache skip revalidation while the icon is unchanged
+    icon_path = game_path + '\\' + gi.game_icon.replace('/', '\\')
+    gi.game_icon_hash = hash_file(icon_path) if os.path.isfile(icon_path) else None
         
     return gi
     
@@ -120,6 +152,11 @@ def loop_through_games():
                 info.requirements = f.read().split('\n')
             
             create_zip(info, game_path)
+            
+            # Manifest and archive hash come from the zip itself, exactly what the launcher downloads
+            zip_path = path_root + '\\games\\' + info.game_compact_file + '.zip'
+            info.game_manifest = build_manifest(zip_path)
+            info.game_archive_hash = hash_file(zip_path)
             games.append(info)
         
     with open(path_root + '\\games\\data.json', 'w+') as f:
@@ -0,0 +1,296 @@
+import os, hashlib, shutil, struct, threading, time, zipfile, zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+LOCAL_HEADER = b'PK\x03\x04'
+CENTRAL_HEADER = b'PK\x01\x02'
+END_OF_CENTRAL_DIR = b'PK\x05\x06'
+LOCAL_HEADER_STRUCT = struct.Struct('<4sHHHHHIIIHH')
+
+def safe_join(root: str, name: str) -> Optional[str]:
+    """Join an archive member name to root, None if it would escape root (absolute path, '..')"""
+    parts = [part for part in name.replace('\\', '/').split('/') if part not in ('', '.')]
+    if not parts or '..' in parts or ':' in parts[0] or name.startswith(('/', '\\')):
+        return None
+    return os.path.join(root, *parts)
+
+def hash_file(file_path: str) -> str:
+    """SHA-256 hex digest of a file"""
+    sha = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+class StreamingZipExtractor:
+    """
+    Extracts a zip archive while it is being downloaded, as a download_file sink.
+    Entries are read from their local file headers, so the central directory at the end of the archive is never
+    needed: stored and deflated entries are written straight to extract_to and CRC checked.
+    Archives that cannot be streamed (data descriptors, encryption, zip64, other methods) or that fail a check
+    stop the extractor instead of raising: `ok` is then False and the caller extracts the complete file instead.
+    The SHA-256 of the whole archive (archive_hash) and of every extracted file (hashes) is computed in the same pass.
+    """
+    def __init__(self, extract_to: str, progress_callback: Optional[Callable[[int], None]] = None):
+        self.extract_to = extract_to
+        self.progress_callback = progress_callback
+        self.reset()
+
+    def reset(self):
+        """Start over from the first byte of the archive (the download restarted or is being replayed)"""
+        self._close_entry()
+        self.buffer = bytearray()
+        self.state = 'header'
+        self.error: Optional[str] = None
+        self.files = 0
+        self.entry = None
+        self.archive_hash = hashlib.sha256()
+        self.hashes: Dict[str, str] = {}
+
+    @property
+    def finished(self) -> bool:
+        """True once every entry was extracted and verified"""
+        return self.state == 'done'
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def feed(self, data: bytes):
+        """Consume the next bytes of the archive"""
+        self.archive_hash.update(data)
+        if self.state in ('done', 'failed'):
+            return
+        self.buffer += data
+        try:
+            pos = self._process()
+            del self.buffer[:pos]
+        except Exception as e:
+            self._fail(str(e))
+
+    def _fail(self, reason: str):
+        self._close_entry()
+        self.buffer = bytearray()
+        self.state = 'failed'
+        self.error = reason
+        print(f"Streaming extraction stopped: {reason}")
+
+    def _process(self) -> int:
+        pos = 0
+        buffer = self.buffer
+        while True:
+            if self.state == 'header':
+                if len(buffer) - pos < 4:
+                    return pos
+                signature = bytes(buffer[pos:pos + 4])
+                if signature in (CENTRAL_HEADER, END_OF_CENTRAL_DIR):
+                    # Every entry is out, the rest is the central directory
+                    self.state = 'done'
+                    return len(buffer)
+                if signature != LOCAL_HEADER:
+                    raise ValueError("unexpected data between entries")
+                if len(buffer) - pos < LOCAL_HEADER_STRUCT.size:
+                    return pos
+                (_, _, flags, method, _, _, crc, compressed_size, size,
+                 name_length, extra_length) = LOCAL_HEADER_STRUCT.unpack_from(buffer, pos)
+                header_end = pos + LOCAL_HEADER_STRUCT.size + name_length + extra_length
+                if len(buffer) < header_end:
+                    return pos
+                raw_name = bytes(buffer[pos + LOCAL_HEADER_STRUCT.size:pos + LOCAL_HEADER_STRUCT.size + name_length])
+                self._open_entry(raw_name, flags, method, crc, compressed_size, size)
+                pos = header_end
+
+            elif self.state == 'data':
+                entry = self.entry
+                take = min(entry['remaining'], len(buffer) - pos)
+                if take:
+                    chunk = bytes(buffer[pos:pos + take])
+                    pos += take
+                    entry['remaining'] -= take
+                    self._write(entry['decompressor'].decompress(chunk) if entry['decompressor'] else chunk)
+                if entry['remaining']:
+                    return pos
+                if entry['decompressor']:
+                    self._write(entry['decompressor'].flush())
+                self._finish_entry()
+
+            else:
+                return len(buffer)
+
+    def _open_entry(self, raw_name: bytes, flags: int, method: int, crc: int, compressed_size: int, size: int):
+        if flags & 0x1:
+            raise ValueError("encrypted entries are not supported")
+        if flags & 0x8:
+            raise ValueError("entry sizes are in a data descriptor, the archive cannot be streamed")
+        if method not in (0, 8):
+            raise ValueError(f"compression method {method} is not supported")
+        if 0xFFFFFFFF in (compressed_size, size):
+            raise ValueError("zip64 entries are not supported")
+
+        name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+        path = safe_join(self.extract_to, name)
+        if path is None:
+            raise ValueError(f"unsafe entry name: {name}")
+
+        is_dir = name.endswith(('/', '\\'))
+        if is_dir:
+            os.makedirs(path, exist_ok=True)
+            file = None
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            file = open(path, 'wb')
+
+        self.entry = {
+            'name': name,
+            'file': file,
+            'crc': crc,
+            'size': size,
+            'written': 0,
+            'running_crc': 0,
+            'sha': hashlib.sha256(),
+            'remaining': compressed_size,
+            'decompressor': zlib.decompressobj(-zlib.MAX_WBITS) if method == 8 else None,
+            'is_dir': is_dir
+        }
+        self.state = 'data'
+
+    def _write(self, data: bytes):
+        if not data:
+            return
+        entry = self.entry
+        entry['running_crc'] = zlib.crc32(data, entry['running_crc'])
+        entry['sha'].update(data)
+        entry['written'] += len(data)
+        if entry['file']:
+            entry['file'].write(data)
+
+    def _finish_entry(self):
+        entry = self.entry
+        self._close_entry()
+        if entry['written'] != entry['size'] or entry['running_crc'] != entry['crc']:
+            raise ValueError(f"CRC check failed for {entry['name']}")
+        if not entry['is_dir']:
+            self.hashes[entry['name']] = entry['sha'].hexdigest()
+            self.files += 1
+            if self.progress_callback:
+                self.progress_callback(self.files)
+        self.state = 'header'
+
+    def _close_entry(self):
+        entry = getattr(self, 'entry', None)
+        if entry and entry['file']:
+            entry['file'].close()
+            entry['file'] = None
+
+def extract_parallel(zip_path: str, extract_to: str, progress_callback: Optional[Callable[[int, int], None]] = None,
+                     workers: Optional[int] = None, progress_interval: float = 0.1, hashes: Optional[Dict[str, str]] = None) -> bool:
+    """
+    Extract a zip file with a pool of threads, each reading through its own ZipFile handle.
+    Members are scheduled largest first so one big asset does not end up last on a single thread,
+    output files are preallocated to their final size, and progress_callback(done, total) is called at most
+    every progress_interval seconds (and once at the end).
+    If hashes is given it is filled with the SHA-256 of every extracted member, computed while writing it.
+    Returns False if any member failed (CRC, disk...), the others are still extracted.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = zip_ref.infolist()
+
+    # Directories (and every parent) are created up front, workers only write files
+    files: List[zipfile.ZipInfo] = []
+    for info in members:
+        path = safe_join(extract_to, info.filename)
+        if path is None:
+            print(f"Skipping unsafe entry: {info.filename}")
+            continue
+        if info.is_dir():
+            os.makedirs(path, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            files.append(info)
+    files.sort(key=lambda info: info.file_size, reverse=True)
+
+    total = len(files)
+    lock = threading.Lock()
+    local = threading.local()
+    handles: List[zipfile.ZipFile] = []
+    state = {'done': 0, 'failed': 0, 'last_report': 0.0}
+
+    def report(force: bool = False):
+        now = time.monotonic()
+        with lock:
+            if not force and now - state['last_report'] < progress_interval:
+                return
+            state['last_report'] = now
+            done = state['done']
+        if progress_callback:
+            progress_callback(done, total)
+        else:
+            print(f"\rExtracting: {(done / total) * 100 if total else 100:.1f}% ({done}/{total} files)", end='', flush=True)
+
+    def extract_member(info: zipfile.ZipInfo):
+        handle = getattr(local, 'zip_ref', None)
+        if handle is None:
+            handle = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+            with lock:
+                handles.append(handle)
+        try:
+            with handle.open(info) as source, open(safe_join(extract_to, info.filename), 'wb') as target:
+                # Reserve the final size at once instead of growing the file chunk by chunk
+                if info.file_size:
+                    target.truncate(info.file_size)
+                if hashes is None:
+                    shutil.copyfileobj(source, target, 1024 * 1024)
+                else:
+                    sha = hashlib.sha256()
+                    for block in iter(lambda: source.read(1024 * 1024), b''):
+                        sha.update(block)
+                        target.write(block)
+                    with lock:
+                        hashes[info.filename] = sha.hexdigest()
+        except Exception as e:
+            print(f"\nError extracting {info.filename}: {e}")
+            with lock:
+                state['failed'] += 1
+        with lock:
+            state['done'] += 1
+        report()
+
+    workers = workers or min(8, os.cpu_count() or 4)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, total)), thread_name_prefix='extract') as executor:
+            list(executor.map(extract_member, files))
+    finally:
+        for handle in handles:
+            handle.close()
+
+    report(force=True)
+    if not progress_callback:
+        print()  # New line after progress
+    return state['failed'] == 0
+
+def verify_manifest(root: str, manifest: List[Dict], hashes: Optional[Dict[str, str]] = None,
+                    workers: Optional[int] = None) -> List[str]:
+    """
+    Check the files under root against a manifest ([{'path', 'size', 'sha256'}...]) on a thread pool.
+    hashes: digests already computed while writing the files, those files are not read again.
+    Returns the paths that are missing or whose size/SHA-256 differ, an empty list when everything matches.
+    """
+    hashes = hashes or {}
+
+    def check(entry: Dict) -> bool:
+        known = hashes.get(entry['path'])
+        if known is not None:
+            return known == entry['sha256']
+        path = safe_join(root, entry['path'])
+        try:
+            # A size mismatch is caught without reading the file
+            if path is None or os.path.getsize(path) != entry['size']:
+                return False
+            return hash_file(path) == entry['sha256']
+        except OSError:
+            return False
+
+    workers = workers or min(8, os.cpu_count() or 4)
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='verify') as executor:
+        results = list(executor.map(check, manifest))
+    return [entry['path'] for entry, ok in zip(manifest, results) if not ok]
@@ -0,0 +1,311 @@
+import os, re, json, threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from http_client import HttpClient
+
+class CatalogCache:
+    """
+    Last good copy of the remote data.json, stored in cache/ with its ETag/Last-Modified,
+    so the launcher can paint from disk and revalidate with a conditional GET in the background.
+    """
+    def __init__(self, cache_dir: str, url: str, http: HttpClient):
+        self.url = url
+        self.http = http
+        self.data_path = os.path.join(cache_dir, 'data.json')
+        self.meta_path = os.path.join(cache_dir, 'data.meta.json')
+
+    def load(self) -> Optional[Dict]:
+        """Return the cached catalog, or None if there is no usable copy"""
+        try:
+            with open(self.data_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) and 'games' in data else None
+        except Exception:
+            return None
+
+    def load_meta(self) -> Dict:
+        """Return the validators saved with the cached catalog"""
+        try:
+            with open(self.meta_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def save(self, data: Dict, etag: Optional[str], last_modified: Optional[str]):
+        """Persist a freshly downloaded catalog with its validators"""
+        os.makedirs(os.path.dirname(self.data_path), exist_ok=True)
+        temp_path = self.data_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, self.data_path)
+
+        with open(self.meta_path, 'w') as f:
+            json.dump({'url': self.url, 'etag': etag, 'last_modified': last_modified}, f, indent=2)
+
+    def revalidate(self) -> Tuple[bool, Optional[Dict]]:
+        """
+        Conditional GET of the remote catalog.
+        Returns: (changed, data) - (False, None) when the server answered 304 Not Modified
+        """
+        headers = {}
+        if self.load() is not None:
+            meta = self.load_meta()
+            if meta.get('url') == self.url:
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('last_modified'):
+                    headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.http.get(self.url, headers=headers)
+        if response.status_code == 304:
+            return (False, None)
+        response.raise_for_status()
+
+        data = response.json()
+        self.save(data, response.headers.get('etag'), response.headers.get('last-modified'))
+        return (True, data)
+
+def bits_to_ids(bits: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a bitset, lowest first"""
+    digits = bin(bits)[:1:-1]
+    i = digits.find('1')
+    while i != -1:
+        yield i
+        i = digits.find('1', i + 1)
+
+def ids_to_bits(ids: Iterable[int], size: int) -> int:
+    """Build a bitset from game ids"""
+    bitmap = bytearray((size >> 3) + 1)
+    for i in ids:
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bitmap, 'little')
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """Parse a [v]x.y.z version for ordering, parts without leading digits (e.g. 'beta') count as 0"""
+    parts = []
+    for part in str(version).split('.'):
+        match = re.match(r'\s*[vV]?(\d+)', part)
+        parts.append(int(match.group(1)) if match else 0)
+    # Trailing zeros do not change the version: 1.0 == 1.0.0
+    while len(parts) > 1 and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+class CatalogIndex:
+    """
+    Search and filter index, built once per catalog load, off the Tk thread (see Catalog.set_data).
+    Every game is a bit (its position in the catalog) and filters are set intersections on int bitsets:
+    category, author and tag values map to bitsets, and text fields are indexed by trigram postings,
+    so search-as-you-type matches prefixes and infixes without scanning the catalog.
+    """
+    GRAM = 3
+
+    def __init__(self, games: List[Dict]):
+        self.games = games
+        self.size = len(games)
+        self.all_bits = (1 << self.size) - 1
+        self.name_to_id: Dict[str, int] = {}
+
+        category_ids: Dict[str, List[int]] = {}
+        author_ids: Dict[str, List[int]] = {}
+        tag_ids: Dict[str, List[int]] = {}
+        # Lowercase searchable text of each game: name, description, author, category, tags
+        self.texts: List[Tuple[str, ...]] = []
+
+        for i, game in enumerate(games):
+            self.name_to_id[game['game_name']] = i
+            category_ids.setdefault(game['game_category'].lower(), []).append(i)
+            author_ids.setdefault(game['game_author'].lower(), []).append(i)
+            tags = [tag.lower() for tag in game['game_tags']]
+            for tag in set(tags):
+                tag_ids.setdefault(tag, []).append(i)
+            self.texts.append((game['game_name'].lower(), game['game_description'].lower(),
+                               game['game_author'].lower(), game['game_category'].lower(), *tags))
+
+        self.category_bits = {key: ids_to_bits(ids, self.size) for key, ids in category_ids.items()}
+        self.author_bits = {key: ids_to_bits(ids, self.size) for key, ids in author_ids.items()}
+        self.tag_bits = {key: ids_to_bits(ids, self.size) for key, ids in tag_ids.items()}
+
+        # Sort keys, parsed once per catalog
+        self.sort_names = [game['game_name'].casefold() for game in games]
+        self.sort_authors = [game['game_author'].casefold() for game in games]
+        self.versions = [parse_version(game['game_version']) for game in games]
+        # sort mode -> (registry version it was computed for, None if independent of it; game ids in order)
+        self._orders: Dict[str, Tuple[Optional[int], List[int]]] = {}
+
+        # Built with the rest so the first keystroke does not pay for it
+        self._gram_bits: Dict[str, int] = self._build_grams()
+        self._short_bits: Dict[str, int] = {}
+
+    def _build_grams(self) -> Dict[str, int]:
+        gram_ids: Dict[str, List[int]] = defaultdict(list)
+        for i, fields in enumerate(self.texts):
+            # Fields are joined and padded with NUL: every character ends up in some trigram, and grams
+            # crossing a field boundary contain NUL so they can never match a query
+            text = '\0' + '\0'.join(fields) + '\0'
+            for gram in {text[j:j + self.GRAM] for j in range(len(text) - self.GRAM + 1)}:
+                gram_ids[gram].append(i)
+        return {gram: ids_to_bits(ids, self.size) for gram, ids in gram_ids.items()}
+
+    def _term_bits(self, term: str) -> int:
+        """Bitset of the games with term as a substring of one of their text fields"""
+        if len(term) < self.GRAM:
+            # Short terms are the union of the trigrams containing them, computed once per term
+            bits = self._short_bits.get(term)
+            if bits is None:
+                bits = 0
+                for gram, gram_bits in self._gram_bits.items():
+                    if term in gram:
+                        bits |= gram_bits
+                self._short_bits[term] = bits
+            return bits
+
+        if len(term) == self.GRAM:
+            return self._gram_bits.get(term, 0)
+
+        # Candidates contain every trigram of the term, confirm the full term on them only
+        bits = self.all_bits
+        for j in range(len(term) - self.GRAM + 1):
+            bits &= self._gram_bits.get(term[j:j + self.GRAM], 0)
+            if not bits:
+                return 0
+        return ids_to_bits((i for i in bits_to_ids(bits)
+                            if any(term in text for text in self.texts[i])), self.size)
+
+    def search(self, query: str) -> int:
+        """Bitset of the games whose text fields contain every whitespace separated term of query"""
+        result = self.all_bits
+        for term in query.lower().split():
+            result &= self._term_bits(term)
+            if not result:
+                break
+        return result
+
+    def sort_order(self, sort_by: str, installed: Iterable[str] = (), registry_version: int = 0) -> Optional[List[int]]:
+        """
+        Game ids of the whole catalog in sort_by order, or None for an unknown mode.
+        Orders are computed once per catalog, the installed-first ones again only when registry_version changes.
+        """
+        depends_on_registry = sort_by in ('installed', 'not_installed')
+        version = registry_version if depends_on_registry else None
+        cached = self._orders.get(sort_by)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        ids = range(self.size)
+        names = self.sort_names
+        if depends_on_registry:
+            installed_ids = {self.name_to_id[name] for name in installed if name in self.name_to_id}
+            first = sort_by == 'installed'
+            order = sorted(ids, key=lambda i: ((i in installed_ids) is not first, names[i]))
+        elif sort_by in ('name', 'name_desc'):
+            order = sorted(ids, key=names.__getitem__, reverse=sort_by == 'name_desc')
+        elif sort_by in ('author', 'author_desc'):
+            order = sorted(ids, key=self.sort_authors.__getitem__, reverse=sort_by == 'author_desc')
+        elif sort_by in ('size', 'size_desc'):
+            order = sorted(ids, key=lambda i: self.games[i]['total_size'], reverse=sort_by == 'size_desc')
+        elif sort_by in ('files', 'files_desc'):
+            order = sorted(ids, key=lambda i: self.games[i]['total_files'], reverse=sort_by == 'files_desc')
+        elif sort_by in ('version', 'version_desc'):
+            order = sorted(ids, key=self.versions.__getitem__, reverse=sort_by == 'version_desc')
+        else:
+            return None
+
+        self._orders[sort_by] = (version, order)
+        return order
+
+    def bits_for_names(self, names: Iterable[str]) -> int:
+        """Bitset of the given game names (unknown names are ignored)"""
+        return ids_to_bits((self.name_to_id[name] for name in names if name in self.name_to_id), self.size)
+
+    def games_for_bits(self, bits: int) -> List[Dict]:
+        """Games of a bitset, in catalog order"""
+        return [self.games[i] for i in bits_to_ids(bits)]
+
+class Catalog:
+    """
+    The loaded games catalog (data.json), shared by the launcher, the filters and the downloader.
+    Games are indexed by name and their derived fields (download URL, parsed version) are computed once per load.
+    Subscribers are called with the catalog every time new data is set.
+    The CatalogIndex of new data is built by a background thread unless the loader built it already,
+    index is None until it is ready.
+    """
+    BASE_URL = 'https://github.com/MrJuaumBR/LunaEngine-Games/raw/refs/heads/main/games/'
+
+    def __init__(self, data: Optional[Dict] = None):
+        self.subscribers: List[Callable[['Catalog'], None]] = []
+        self._load(data)
+
+    def _load(self, data: Optional[Dict], index: Optional[CatalogIndex] = None):
+        self.data: Dict = data if data is not None else {}
+        self.games: List[Dict] = self.data.get('games', [])
+        self.by_name: Dict[str, Dict] = {game['game_name']: game for game in self.games}
+        self.compact_urls: Dict[str, str] = {name: self.BASE_URL + game['game_compact_file'] + '.zip'
+                                             for name, game in self.by_name.items() if 'game_compact_file' in game}
+        self.versions: Dict[str, Tuple[int, ...]] = {name: parse_version(game.get('game_version', '0'))
+                                                     for name, game in self.by_name.items()}
+        # game name -> (installed version, needs update)
+        self._update_flags: Dict[str, Tuple[str, bool]] = {}
+        self._index = index if index is not None and index.games is self.games else None
+        self._index_ready = threading.Event()
+        if self._index is not None:
+            self._index_ready.set()
+        else:
+            threading.Thread(target=self._build_index, args=(self.games, self._index_ready), daemon=True,
+                             name='catalog-index').start()
+
+    def _build_index(self, games: List[Dict], ready: threading.Event):
+        self._index = CatalogIndex(games)
+        ready.set()
+
+    def set_data(self, data: Optional[Dict], index: Optional[CatalogIndex] = None):
+        """
+        Replace the catalog and notify the subscribers, data equal to the loaded catalog is ignored.
+        index: CatalogIndex(data['games']) when the caller built it in its own worker thread.
+        """
+        if data is not None and data == self.data:
+            # Same content (e.g. data.json read again by refresh_games), the index and its orders stay valid
+            return
+        self._load(data, index)
+        for callback in list(self.subscribers):
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"Error notifying catalog subscriber: {e}")
+
+    def subscribe(self, callback: Callable[['Catalog'], None]):
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[['Catalog'], None]):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    @property
+    def index(self) -> Optional[CatalogIndex]:
+        """Search/sort index of this catalog, None while it is being built (callers scan the games instead)"""
+        index = self._index
+        # An index finished after other data was set belongs to the old games
+        return index if index is not None and index.games is self.games else None
+
+    def wait_index(self, timeout: Optional[float] = None) -> Optional[CatalogIndex]:
+        """The index, waiting up to timeout seconds for it to be built"""
+        self._index_ready.wait(timeout)
+        return self.index
+
+    def get(self, game_name: str) -> Optional[Dict]:
+        return self.by_name.get(game_name)
+
+    def compact_url(self, game_name: str) -> Optional[str]:
+        return self.compact_urls.get(game_name)
+
+    def needs_update(self, game_name: str, installed_version: Optional[str]) -> bool:
+        """True if the catalog has a newer version than installed_version (or nothing is installed)"""
+        if not installed_version:
+            return True
+        if game_name not in self.versions:
+            return False
+        cached = self._update_flags.get(game_name)
+        if cached is None or cached[0] != installed_version:
+            cached = (installed_version, parse_version(installed_version) < self.versions[game_name])
+            self._update_flags[game_name] = cached
+        return cached[1]
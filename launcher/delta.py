@@ -0,0 +1,217 @@
+import os, hashlib, struct, zlib
+from typing import Callable, Dict, List, Optional, Tuple
+from http_client import HttpClient
+from archive import safe_join
+from scheduler import DownloadControl
+
+CENTRAL_HEADER_STRUCT = struct.Struct('<4sHHHHHHIIIHHHHHII')
+END_OF_CENTRAL_DIR_STRUCT = struct.Struct('<4sHHHHIIH')
+LOCAL_HEADER_SIZE = 30
+# Largest end of central directory record: fixed part + 64KB comment
+TAIL_SIZE = END_OF_CENTRAL_DIR_STRUCT.size + 0xFFFF
+
+class DeltaError(Exception):
+    """The delta update cannot be done, the caller falls back to a full download"""
+
+class RemoteZip:
+    """
+    Random access to a zip on an HTTP server that supports Range requests.
+    The central directory is read from the tail of the file, then only the wanted entries are fetched,
+    with neighbouring entries merged into a single request when the gap between them is small.
+    control: checked around every request (pause/cancel, bandwidth limit).
+    """
+    MERGE_GAP = 64 * 1024
+
+    def __init__(self, url: str, http: HttpClient, control: Optional[DownloadControl] = None):
+        self.url = url
+        self.http = http
+        self.control = control
+        self.size = 0
+        # name -> (local header offset, compressed size, size, method, crc)
+        self.entries: Dict[str, Tuple[int, int, int, int, int]] = {}
+        self.central_dir_offset = 0
+
+    def _get_range(self, start: int, end: Optional[int] = None, suffix: Optional[int] = None) -> bytes:
+        byte_range = f"bytes=-{suffix}" if suffix is not None else f"bytes={start}-{end}"
+        if self.control is not None:
+            self.control.checkpoint()
+        response = self.http.get(self.url, headers={'Range': byte_range, 'Accept-Encoding': 'identity'})
+        try:
+            response.raise_for_status()
+            if response.status_code != 206:
+                raise DeltaError("server does not support range requests")
+            total = response.headers.get('content-range', '').rsplit('/', 1)[-1]
+            if total.isdigit():
+                self.size = int(total)
+            content = response.content
+        finally:
+            response.close()
+        if self.control is not None:
+            self.control.checkpoint(len(content))
+        return content
+
+    def read_central_directory(self):
+        # Small tail first (no archive comment, central directory of a typical game), the largest only if needed
+        for tail_size in (16 * 1024, TAIL_SIZE):
+            tail = self._get_range(0, suffix=tail_size)
+            eocd = tail.rfind(b'PK\x05\x06')
+            if eocd != -1 and len(tail) - eocd >= END_OF_CENTRAL_DIR_STRUCT.size:
+                break
+            if len(tail) < tail_size:
+                # Already the whole file
+                break
+        if eocd == -1 or len(tail) - eocd < END_OF_CENTRAL_DIR_STRUCT.size:
+            raise DeltaError("end of central directory not found")
+        (_, _, _, _, count, cd_size, cd_offset, _) = END_OF_CENTRAL_DIR_STRUCT.unpack_from(tail, eocd)
+        if 0xFFFFFFFF in (cd_size, cd_offset) or count == 0xFFFF:
+            raise DeltaError("zip64 archives are not supported")
+
+        tail_start = self.size - len(tail)
+        if cd_offset >= tail_start:
+            central_dir = tail[cd_offset - tail_start:cd_offset - tail_start + cd_size]
+        else:
+            central_dir = self._get_range(cd_offset, cd_offset + cd_size - 1)
+
+        pos = 0
+        for _ in range(count):
+            (signature, _, _, flags, method, _, _, crc, compressed_size, size, name_length, extra_length,
+             comment_length, _, _, _, offset) = CENTRAL_HEADER_STRUCT.unpack_from(central_dir, pos)
+            if signature != b'PK\x01\x02':
+                raise DeltaError("corrupted central directory")
+            start = pos + CENTRAL_HEADER_STRUCT.size
+            name = central_dir[start:start + name_length].decode('utf-8' if flags & 0x800 else 'cp437')
+            if not (flags & 0x1) and method in (0, 8):
+                self.entries[name] = (offset, compressed_size, size, method, crc)
+            pos = start + name_length + extra_length + comment_length
+        self.central_dir_offset = cd_offset
+
+    def _spans(self, names: List[str]) -> List[Tuple[int, int, List[str]]]:
+        """Byte ranges (start, end inclusive, names) covering the entries, merged when close together"""
+        offsets = sorted(entry[0] for entry in self.entries.values()) + [self.central_dir_offset]
+        next_offset = {offsets[i]: offsets[i + 1] for i in range(len(offsets) - 1)}
+
+        spans: List[Tuple[int, int, List[str]]] = []
+        for name in sorted(names, key=lambda n: self.entries[n][0]):
+            start = self.entries[name][0]
+            # An entry ends where the next one (or the central directory) starts
+            end = next_offset[start] - 1
+            if spans and start - spans[-1][1] <= self.MERGE_GAP:
+                spans[-1] = (spans[-1][0], end, spans[-1][2] + [name])
+            else:
+                spans.append((start, end, [name]))
+        return spans
+
+    def fetch(self, names: List[str], on_entry: Callable[[str, bytes], None],
+              progress_callback: Optional[Callable[[int, int], None]] = None):
+        """Download, inflate and CRC check the given entries, on_entry(name, data) is called for each"""
+        missing = [name for name in names if name not in self.entries]
+        if missing:
+            raise DeltaError(f"entries not in the archive: {missing[:3]}")
+
+        spans = self._spans(names)
+        total = sum(end - start + 1 for start, end, _ in spans)
+        fetched = 0
+        for start, end, span_names in spans:
+            data = self._get_range(start, end)
+            for name in span_names:
+                offset, compressed_size, size, method, crc = self.entries[name]
+                header = offset - start
+                if data[header:header + 4] != b'PK\x03\x04':
+                    raise DeltaError(f"bad local header for {name}")
+                name_length, extra_length = struct.unpack_from('<HH', data, header + 26)
+                data_start = header + LOCAL_HEADER_SIZE + name_length + extra_length
+                raw = data[data_start:data_start + compressed_size]
+                content = zlib.decompress(raw, -zlib.MAX_WBITS) if method == 8 else raw
+                if len(content) != size or zlib.crc32(content) != crc:
+                    raise DeltaError(f"CRC check failed for {name}")
+                on_entry(name, content)
+            fetched += end - start + 1
+            if progress_callback:
+                progress_callback(fetched, total)
+
+def diff_manifests(old_manifest: List[Dict], new_manifest: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """Split the new manifest in (entries whose content is already installed, entries to download)"""
+    old_hashes = {entry['path']: entry['sha256'] for entry in old_manifest}
+    unchanged = [entry for entry in new_manifest if old_hashes.get(entry['path']) == entry['sha256']]
+    changed = [entry for entry in new_manifest if old_hashes.get(entry['path']) != entry['sha256']]
+    return unchanged, changed
+
+def copy_verified(source: str, target: str) -> str:
+    """Copy a file, returning the SHA-256 of what was written (hashed in the same pass)"""
+    sha = hashlib.sha256()
+    with open(source, 'rb') as src, open(target, 'wb') as dst:
+        for block in iter(lambda: src.read(1024 * 1024), b''):
+            sha.update(block)
+            dst.write(block)
+    return sha.hexdigest()
+
+def build_from_delta(remote: RemoteZip, installed_folder: Optional[str], staging_folder: str, old_manifest: List[Dict],
+                     new_manifest: List[Dict], max_changed_ratio: float = 0.6,
+                     progress_callback: Optional[Callable[[int, int], None]] = None, store=None) -> Dict[str, str]:
+    """
+    Build the new version in staging_folder: files found in the content store (store) are linked from it,
+    unchanged files are copied from the installed version and the others are fetched from the remote zip.
+    Returns the SHA-256 of every written file (path -> hash).
+    Raises DeltaError when a delta is not possible or not worth it (too much changed).
+    """
+    unchanged, changed = diff_manifests(old_manifest, new_manifest)
+    stored = [entry for entry in new_manifest if store is not None and store.has(entry['sha256'], entry['size'])]
+    stored_paths = {entry['path'] for entry in stored}
+    unchanged = [entry for entry in unchanged if entry['path'] not in stored_paths]
+    changed = [entry for entry in changed if entry['path'] not in stored_paths]
+    hashes: Dict[str, str] = {}
+
+    total_size = sum(entry['size'] for entry in new_manifest) or 1
+    if sum(entry['size'] for entry in changed) / total_size > max_changed_ratio:
+        raise DeltaError("most of the game changed, a full download is cheaper")
+
+    # Stored blobs were verified when they were added and are unchanged since (size and mtime),
+    # a blob deleted or written meanwhile is downloaded instead
+    for entry in stored:
+        target = safe_join(staging_folder, entry['path'])
+        if target is None:
+            raise DeltaError(f"unsafe path in manifest: {entry['path']}")
+        if store.materialize(entry['sha256'], target, entry['size']):
+            hashes[entry['path']] = entry['sha256']
+        else:
+            changed.append(entry)
+
+    # Copy what is already installed, a file that no longer matches its hash is downloaded instead
+    for entry in unchanged:
+        source = safe_join(installed_folder, entry['path'])
+        target = safe_join(staging_folder, entry['path'])
+        if source is None or target is None:
+            raise DeltaError(f"unsafe path in manifest: {entry['path']}")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        try:
+            digest = copy_verified(source, target)
+        except OSError:
+            digest = None
+        if digest == entry['sha256']:
+            hashes[entry['path']] = digest
+        else:
+            changed.append(entry)
+
+    changed_size = sum(entry['size'] for entry in changed)
+    print(f"Delta update: {len(stored)} files from the store, {len(unchanged)} copied, "
+          f"{len(changed)} to download ({changed_size / (1024 ** 2):.2f}MB)")
+    if not changed:
+        return hashes
+
+    remote.read_central_directory()
+    expected = {entry['path']: entry['sha256'] for entry in changed}
+
+    def write_entry(name: str, content: bytes):
+        digest = hashlib.sha256(content).hexdigest()
+        if digest != expected[name]:
+            raise DeltaError(f"hash mismatch for {name}")
+        target = safe_join(staging_folder, name)
+        if target is None:
+            raise DeltaError(f"unsafe path in manifest: {name}")
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(content)
+        hashes[name] = digest
+
+    remote.fetch(list(expected), write_entry, progress_callback)
+    return hashes
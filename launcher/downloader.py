@@ -1,16 +1,47 @@
-import os, sys, requests, json, shutil, hashlib
-from typing import Dict, List, Optional, Tuple, Callable, Literal
+import os, sys, requests, json, shutil, hashlib, threading, time
+from typing import Dict, List, Optional, Tuple, Callable, Literal, Union
 import zipfile
 from pathlib import Path as PathLib
 import tempfile
+from http_client import HttpClient
+from icon_cache import IconCache
+from catalog import Catalog, parse_version
+from archive import StreamingZipExtractor, extract_parallel, verify_manifest
+from delta import RemoteZip, build_from_delta
+from store import ContentStore, remove_tree
+from scheduler import DownloadControl, DownloadInterrupted, DownloadCancelled, DOWNLOAD_DONE, DOWNLOAD_PAUSED, DOWNLOAD_CANCELLED, DOWNLOAD_FAILED
 
 class Downloader:
-    def __init__(self, games_data:dict):
+    def __init__(self, games_data: Union[dict, Catalog], http: Optional[HttpClient] = None, icon_cache: Optional[IconCache] = None,
+                 store: Optional[ContentStore] = None):
         self.check_files()
-        self.games_data = games_data
+        # Catalog shared with the launcher, a plain data.json dict gets its own
+        self.catalog = games_data if isinstance(games_data, Catalog) else Catalog(games_data)
+        # Shared pooled HTTP client, injected by the launcher
+        self.http = http or HttpClient()
+        self.icon_cache = icon_cache or IconCache(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'cache'), self.http)
+        # Game files are read-only hardlinks to store/<sha256>, a file shared by several games is stored and downloaded once
+        self.store = store or ContentStore(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'store'))
+        # Guards installed_games and config/installed_games.json, downloads run in parallel
+        self.registry_lock = threading.RLock()
+        # Bumped on every registry change, lets cached installed-first orderings know they are stale
+        self.registry_version = 0
         self.installed_games = self.load_installed_games()
         
-        self.get_games()
+        # Staging/trash folders of an interrupted session are deleted without delaying startup
+        self._purge_leftovers()
+    
+    @property
+    def games_data(self) -> Dict:
+        return self.catalog.data
+    
+    @games_data.setter
+    def games_data(self, data: Dict):
+        self.catalog.set_data(data)
+    
+    @property
+    def games_urls(self) -> Dict[str, str]:
+        return self.catalog.compact_urls
         
     def check_files(self):
         """Create necessary directories"""
@@ -48,8 +79,34 @@ class Downloader:
     def save_installed_games(self):
         """Save installed games registry"""
         registry_path = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'config', 'installed_games.json')
-        with open(registry_path, 'w') as f:
-            json.dump(self.installed_games, f, indent=2)
+        with self.registry_lock:
+            # Write to a temp file first so a crash never leaves a half-written registry
+            temp_path = registry_path + '.tmp'
+            with open(temp_path, 'w') as f:
+                json.dump(self.installed_games, f, indent=2)
+            os.replace(temp_path, registry_path)
+    
+    def update_installed_game(self, game_name: str, game_info: Optional[Dict]):
+        """
+        Add, replace or remove (game_info=None) a single registry entry.
+        Re-reads the registry under the lock so parallel installs never clobber each other.
+        """
+        with self.registry_lock:
+            registry = self.load_installed_games()
+            registry.setdefault("games", {})
+            if game_info is None:
+                registry["games"].pop(game_name, None)
+            else:
+                registry["games"][game_name] = game_info
+            self.installed_games = registry
+            self.registry_version += 1
+            self.save_installed_games()
+    
+    def reload_installed_games(self):
+        """Re-read the registry from disk (e.g. after another thread installed a game)"""
+        with self.registry_lock:
+            self.installed_games = self.load_installed_games()
+            self.registry_version += 1
     
     def is_game_installed(self, game_name: str) -> bool:
         """Check if game is installed"""
@@ -66,11 +123,8 @@ class Downloader:
         Compare version strings (format: x.y.z)
         Returns: -1 if current < new, 0 if equal, 1 if current > new
         """
-        def parse_version(v: str) -> List[int]:
-            return [int(part) for part in v.split('.')]
-        
-        current_parts = parse_version(current_version)
-        new_parts = parse_version(new_version)
+        current_parts = list(parse_version(current_version))
+        new_parts = list(parse_version(new_version))
         
         # Pad with zeros if lengths differ
         max_len = max(len(current_parts), len(new_parts))
@@ -102,79 +156,176 @@ class Downloader:
         else:
             return (False, current_version)
     
-    def get_games(self):
-        base_url = 'https://github.com/MrJuaumBR/LunaEngine-Games/raw/refs/heads/main/games/'
-        if self.games_data is None:
-            return []
-        self.games_urls = {}
-        for value in self.games_data['games']:
-            if 'game_compact_file' in value:
-                self.games_urls[value['game_name']] =base_url + value['game_compact_file'] + '.zip'
-
     def get_game_icon(self, game_data: dict, is_local:Literal['--local', '--remote']='--remote') -> str:
         if is_local == '--remote':
             if 'game_icon' in game_data:
                 base = f'https://raw.githubusercontent.com/MrJuaumBR/LunaEngine-Games/refs/heads/main/games/{game_data["game_name"]}/{game_data["game_icon"]}'
-                file_path = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'cache', f'{game_data["game_name"]}-icon.png')
-                if os.path.exists(file_path):
-                    try:
-                        os.remove(file_path)
-                        self.download_file(base, file_path)
-                    except PermissionError: pass
-                else: self.download_file(base, file_path)
-                return file_path
+                # Served from cache/icons/ unless missing or not yet revalidated this session
+                return self.icon_cache.get(base, game_data.get('game_icon_hash'))
         elif is_local == '--local':
             if 'game_icon' in game_data:
                 base = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), '..', 'games', str(game_data['game_name']), str(game_data['game_icon']))
                 if os.path.exists(base):
-                    # Just copy and move to cache
+                    # Just copy and move to cache, only when the source changed
                     file_path = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'cache', f'{game_data["game_name"]}-icon.png')
                     try:
-                        shutil.copyfile(base, file_path)
+                        source_stat = os.stat(base)
+                        if not os.path.exists(file_path) or os.path.getsize(file_path) != source_stat.st_size or os.path.getmtime(file_path) < source_stat.st_mtime:
+                            shutil.copy2(base, file_path)
                     except PermissionError: pass
                     return file_path
         return None
     
-    def download_file(self, url: str, save_path: str, progress_callback=None) -> bool:
+    def _load_partial_info(self, save_path: str, url: str) -> Optional[Dict]:
         """
-        Download a file from URL with progress tracking
+        Load the sidecar of a partial download, only if it still matches the file on disk
         """
+        part_path = save_path + '.part'
+        info_path = save_path + '.part.json'
+        if not (os.path.exists(part_path) and os.path.exists(info_path)):
+            return None
         try:
+            with open(info_path, 'r') as f:
+                info = json.load(f)
+        except Exception:
+            return None
+        
+        if info.get('url') != url or not (info.get('etag') or info.get('last_modified')):
+            return None
+        info['size'] = os.path.getsize(part_path)
+        return info
+    
+    def _save_partial_info(self, save_path: str, info: Dict):
+        """Write the sidecar describing a partial download"""
+        with open(save_path + '.part.json', 'w') as f:
+            json.dump(info, f, indent=2)
+    
+    def _discard_partial(self, save_path: str):
+        """Remove a partial download and its sidecar"""
+        for path in (save_path + '.part', save_path + '.part.json'):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+    
+    def download_file(self, url: str, save_path: str, progress_callback=None, retries: int = 4, backoff: float = 1.0, sink=None,
+                      control: Optional[DownloadControl] = None) -> bool:
+        """
+        Download a file from URL with progress tracking.
+        Partial data is kept in '<save_path>.part' with a '.part.json' sidecar (ETag/Last-Modified, size),
+        so retries and later calls resume with a Range request instead of starting over.
+        sink: optional consumer of the file bytes as they arrive (reset() + feed(data)), e.g. a StreamingZipExtractor.
+        control: checked after every chunk for the bandwidth limit, raises DownloadInterrupted when paused/cancelled.
+        """
+        # Create parent directory if it doesn't exist
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        
+        for attempt in range(retries + 1):
+            try:
+                self._download_attempt(url, save_path, progress_callback, sink, control)
+                return True
+            
+            except DownloadInterrupted:
+                raise
+            except requests.exceptions.HTTPError as e:
+                # Client errors (404, 403...) will not fix themselves
+                status = e.response.status_code if e.response is not None else 0
+                if 400 <= status < 500 and status not in (408, 429):
+                    print(f"\nDownload failed: {e}")
+                    return False
+                print(f"\nDownload failed: {e}")
+            except requests.exceptions.RequestException as e:
+                print(f"\nDownload failed: {e}")
+            except Exception as e:
+                print(f"\nError during download: {e}")
+                return False
+            
+            if attempt < retries:
+                delay = backoff * (2 ** attempt)
+                print(f"Retrying in {delay:.0f}s ({attempt + 1}/{retries})...")
+                time.sleep(delay)
+        
+        return False
+    
+    def _download_attempt(self, url: str, save_path: str, progress_callback=None, sink=None, control: Optional[DownloadControl] = None):
+        """
+        Single download attempt, resuming from the partial file when the server allows it.
+        Raises on network errors, the partial file is kept for the next attempt.
+        """
+        part_path = save_path + '.part'
+        partial = self._load_partial_info(save_path, url)
+        
+        # Ranges refer to the bytes on the wire, so ask for them unencoded
+        headers = {'Accept-Encoding': 'identity'}
+        if partial and partial['size'] > 0:
+            headers['Range'] = f"bytes={partial['size']}-"
+            # If-Range makes the server send the full file when our partial data is stale
+            headers['If-Range'] = partial.get('etag') or partial['last_modified']
+            print(f"Resuming from byte {partial['size']}: {url}")
+        else:
             print(f"Downloading from: {url}")
-            response = requests.get(url, stream=True, timeout=30)
+        
+        response = self.http.get(url, stream=True, headers=headers)
+        try:
+            if response.status_code == 416 and partial:
+                # Our range is invalid for the current file, start over on the next attempt
+                self._discard_partial(save_path)
+                raise requests.exceptions.RequestException("Requested range not satisfiable, restarting download")
             response.raise_for_status()
             
-            # Get total file size
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
+            if response.status_code == 206 and partial:
+                downloaded = partial['size']
+                content_range = response.headers.get('content-range', '')
+                total_size = int(content_range.rsplit('/', 1)[-1]) if content_range.rsplit('/', 1)[-1].isdigit() else 0
+                mode = 'ab'
+            else:
+                # Server ignored the range (or the file changed), full download
+                downloaded = 0
+                total_size = int(response.headers.get('content-length', 0))
+                mode = 'wb'
+                self._save_partial_info(save_path, {
+                    'url': url,
+                    'etag': response.headers.get('etag'),
+                    'last_modified': response.headers.get('last-modified'),
+                    'total_size': total_size
+                })
             
-            # Create parent directory if it doesn't exist
-            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            if sink is not None:
+                # The sink always sees the file from its first byte, replay what a resume skips
+                sink.reset()
+                if mode == 'ab':
+                    with open(part_path, 'rb') as file:
+                        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                            sink.feed(chunk)
             
-            with open(save_path, 'wb') as file:
+            with open(part_path, mode) as file:
                 for chunk in response.iter_content(chunk_size=8192):
                     if chunk:
                         file.write(chunk)
+                        if sink is not None:
+                            sink.feed(chunk)
                         downloaded += len(chunk)
+                        if control is not None:
+                            control.checkpoint(len(chunk))
                         
                         # Calculate progress percentage if total_size is known
                         if total_size > 0 and progress_callback:
                             percent = (downloaded / total_size) * 100
                             # Call progress callback if provided
                             progress_callback(percent, downloaded, total_size)
-            
-            return True
-            
-        except requests.exceptions.RequestException as e:
-            print(f"\nDownload failed: {e}")
-            return False
-        except Exception as e:
-            print(f"\nError during download: {e}")
-            return False
+        finally:
+            response.close()
+        
+        if total_size > 0 and downloaded < total_size:
+            raise requests.exceptions.ConnectionError(f"Connection closed at {downloaded}/{total_size} bytes")
+        
+        os.replace(part_path, save_path)
+        self._discard_partial(save_path)
     
-    def extract_zip(self, zip_path: str, extract_to: str, progress_callback=None) -> bool:
+    def extract_zip(self, zip_path: str, extract_to: str, progress_callback=None, hashes: Optional[Dict[str, str]] = None) -> bool:
         """
-        Extract ZIP file with progress tracking
+        Extract ZIP file with progress tracking, using a pool of threads
+        hashes: filled with the SHA-256 of every extracted file, computed while writing it
         """
         try:
             if not os.path.exists(zip_path):
@@ -184,28 +335,8 @@ class Downloader:
             # Create extraction directory
             os.makedirs(extract_to, exist_ok=True)
             
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Get total number of files
-                file_list = zip_ref.namelist()
-                total_files = len(file_list)
-                
-                for i, file in enumerate(file_list, 1):
-                    try:
-                        zip_ref.extract(file, extract_to)
-                        
-                        # Update progress
-                        if progress_callback:
-                            progress_callback(i, total_files)
-                        else:
-                            percent = (i / total_files) * 100
-                            print(f"\rExtracting: {percent:.1f}% ({i}/{total_files} files)", end='', flush=True)
-                    
-                    except Exception as e:
-                        print(f"\nError extracting {file}: {e}")
-                        # Continue with other files
-            
-            print()  # New line after progress
-            return True
+            # Members are extracted in parallel, progress is throttled
+            return extract_parallel(zip_path, extract_to, progress_callback, hashes=hashes)
             
         except zipfile.BadZipFile:
             print(f"Invalid ZIP file: {zip_path}")
@@ -214,14 +345,23 @@ class Downloader:
             print(f"Error extracting ZIP: {e}")
             return False
     
-    def verify_download(self, game_name: str, game_folder: str) -> bool:
+    def verify_download(self, game_name: str, game_folder: str, manifest: Optional[List[Dict]] = None,
+                        hashes: Optional[Dict[str, str]] = None) -> bool:
         """
         Verify downloaded game integrity
+        With a catalog manifest every file is checked by size and SHA-256, hashes computed during extraction
+        are used as is so verifying does not read the files again.
         """
         # Check if game folder exists
         if not os.path.exists(game_folder):
             return False
         
+        if manifest:
+            corrupted = verify_manifest(game_folder, manifest, hashes)
+            for path in corrupted:
+                print(f"Corrupted file: {path}")
+            return not corrupted
+        
         # Check for essential files (customize based on your game structure)
         essential_files = ['game.json', 'main.py']  # Add your essential files
         
@@ -232,10 +372,238 @@ class Downloader:
         
         return True
     
-    def download_game(self, game_data: Dict, progress_callback: Callable[[float, str], None]=None, is_local:Literal['--local', '--remote']='--remote') -> bool:
+    def _games_path(self) -> str:
+        return os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'games')
+    
+    def get_staging_folder(self, game_name: str, game_version: str) -> str:
+        """games/.staging/<game>-<version>, on the same volume as the install so it can be renamed into place"""
+        return os.path.join(self._games_path(), '.staging', f"{game_name}-{game_version}")
+    
+    def _discard_folder(self, folder: str):
+        """Move a folder out of the way (games/.trash) and delete it in the background"""
+        if not os.path.exists(folder):
+            return
+        trash = os.path.join(self._games_path(), '.trash', f"{os.path.basename(folder)}-{time.time_ns()}")
+        try:
+            os.makedirs(os.path.dirname(trash), exist_ok=True)
+            os.replace(folder, trash)
+        except OSError:
+            trash = folder
+        threading.Thread(target=remove_tree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
+    
+    def _purge_leftovers(self):
+        """Delete staging and trash folders left by an interrupted session"""
+        trash = os.path.join(self._games_path(), '.trash')
+        if os.path.exists(trash):
+            threading.Thread(target=remove_tree, args=(trash,), kwargs={'ignore_errors': True}, daemon=True).start()
+        # Renamed away right now so it never races with a new install
+        self._discard_folder(os.path.join(self._games_path(), '.staging'))
+    
+    def commit_staged_install(self, game_name: str, staging_folder: str) -> str:
+        """
+        Rename a verified staging folder into games/<game>, the game is only unavailable between two renames.
+        The current install is kept as games/<game>.prev for rollback_game, an older .prev is deleted in the background.
+        Returns the game folder.
+        """
+        game_folder = os.path.join(self._games_path(), game_name)
+        prev_folder = game_folder + '.prev'
+        
+        self._discard_folder(prev_folder)
+        if os.path.exists(game_folder):
+            os.replace(game_folder, prev_folder)
+        try:
+            os.replace(staging_folder, game_folder)
+        except OSError:
+            # Put the previous version back
+            if os.path.exists(prev_folder) and not os.path.exists(game_folder):
+                os.replace(prev_folder, game_folder)
+            raise
+        return game_folder
+    
+    def has_previous_version(self, game_name: str) -> bool:
+        return os.path.isdir(os.path.join(self._games_path(), game_name + '.prev'))
+    
+    def rollback_game(self, game_name: str) -> bool:
+        """Swap the installed game with the version it replaced (games/<game>.prev)"""
+        game_folder = os.path.join(self._games_path(), game_name)
+        prev_folder = game_folder + '.prev'
+        swap_folder = game_folder + '.swap'
+        
+        if not os.path.isdir(prev_folder):
+            print(f"No previous version of {game_name} to roll back to")
+            return False
+        
+        try:
+            if os.path.exists(game_folder):
+                os.replace(game_folder, swap_folder)
+            os.replace(prev_folder, game_folder)
+            # The replaced version becomes the .prev, so a rollback can be undone the same way
+            if os.path.exists(swap_folder):
+                os.replace(swap_folder, prev_folder)
+        except OSError as e:
+            print(f"Error rolling back {game_name}: {e}")
+            if not os.path.exists(game_folder) and os.path.exists(swap_folder):
+                os.replace(swap_folder, game_folder)
+            return False
+        
+        try:
+            with open(os.path.join(game_folder, 'game.json'), 'r') as f:
+                game_metadata = json.load(f)
+        except Exception:
+            game_metadata = {"name": game_name}
+        
+        self.update_installed_game(game_name, self._registry_entry(game_metadata, game_folder))
+        print(f"Rolled back {game_name} to v{game_metadata.get('version', '?')}")
+        return True
+    
+    def _registry_entry(self, game_metadata: Dict, game_folder: str) -> Dict:
+        """Installed games registry entry from a game.json"""
+        return {
+            "version": game_metadata.get("version", "0.0.0"),
+            "installed_date": game_metadata.get("installed_date"),
+            "size": game_metadata.get("total_size", 0),
+            "files": game_metadata.get("total_files", 0),
+            "author": game_metadata.get("author", ""),
+            "category": game_metadata.get("category", ""),
+            "tags": game_metadata.get("tags", []),
+            "description": game_metadata.get("description", ""),
+            "path": game_folder
+        }
+    
+    def get_installed_manifest(self, game_name: str) -> Optional[List[Dict]]:
+        """File manifest saved in the game.json of an installed game"""
+        try:
+            with open(os.path.join(self._games_path(), game_name, 'game.json'), 'r') as f:
+                return json.load(f).get("manifest") or None
+        except Exception:
+            return None
+    
+    def verify_installed_game(self, game_name: str) -> Optional[Tuple[int, List[str]]]:
+        """
+        Re-check an installed game against the manifest saved in its game.json (or the catalog one).
+        Returns: (files checked, corrupted or missing paths), None if there is no manifest to check against
+        """
+        game_folder = os.path.join(self._games_path(), game_name)
+        manifest = self.get_installed_manifest(game_name)
+        if not manifest:
+            game = self.catalog.get(game_name)
+            if game is not None and game.get("game_version") == self.get_installed_version(game_name):
+                manifest = game.get("game_manifest")
+        if not manifest:
+            return None
+        return (len(manifest), verify_manifest(game_folder, manifest))
+    
+    def delta_update(self, game_data: Dict, game_url: str, staging_folder: str, progress_callback=None,
+                     control: Optional[DownloadControl] = None) -> Optional[Dict[str, str]]:
+        """
+        Build a game in staging_folder from the files already on disk (content store, installed version) plus the
+        missing ones, fetched from byte ranges of the remote zip. Returns the written files hashes, None if a full download is needed.
+        """
+        game_name = game_data["game_name"]
+        new_manifest = game_data.get("game_manifest")
+        old_manifest = self.get_installed_manifest(game_name) or []
+        if not new_manifest:
+            return None
+        if not old_manifest and not any(self.store.has(entry['sha256'], entry['size']) for entry in new_manifest):
+            # Nothing of this game is on disk yet
+            return None
+        
+        def delta_progress(fetched, total):
+            if progress_callback:
+                # Map to overall progress (0-90% for the changed files)
+                progress_callback((fetched / total) * 90, f"Downloading changes: {fetched / (1024 ** 2):.2f}/{total / (1024 ** 2):.2f}MB",
+                                  fetched, total)
+        
+        try:
+            if progress_callback:
+                progress_callback(0, f"Preparing {game_name}")
+            return build_from_delta(RemoteZip(game_url, self.http, control), os.path.join(self._games_path(), game_name),
+                                    staging_folder, old_manifest, new_manifest, progress_callback=delta_progress,
+                                    store=self.store)
+        except DownloadInterrupted:
+            remove_tree(staging_folder, ignore_errors=True)
+            raise
+        except Exception as e:
+            print(f"Delta update not possible for {game_name}, downloading the full game: {e}")
+            remove_tree(staging_folder, ignore_errors=True)
+            return None
+    
+    def _finalize_install(self, game_data: Dict, staging_folder: str, download_url: str, progress_callback=None,
+                          hashes: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """
+        Write game.json into the staging folder, verify it and rename it into place.
+        Returns the game folder, or None if verification failed (the installed game is untouched).
+        """
+        game_name = game_data["game_name"]
+        
+        # Create or update game.json with metadata
+        game_metadata = {
+            "name": game_name,
+            "version": game_data["game_version"],
+            "author": game_data.get("game_author", ""),
+            "category": game_data.get("game_category", ""),
+            "tags": game_data.get("game_tags", []),
+            "description": game_data.get("game_description", ""),
+            "total_size": game_data.get("total_size", 0),
+            "total_files": game_data.get("total_files", 0),
+            "installed_date": self._get_current_date(),
+            "download_url": download_url,
+            "manifest": game_data.get("game_manifest", [])
+        }
+        
+        metadata_path = os.path.join(staging_folder, 'game.json')
+        with open(metadata_path, 'w') as f:
+            json.dump(game_metadata, f, indent=2)
+        
+        # Verify download
+        if progress_callback:
+            progress_callback(95, f"Verifying {game_name}...")
+        
+        if not self.verify_download(game_name, staging_folder, game_data.get("game_manifest"), hashes):
+            return None
+        
+        if game_metadata["manifest"]:
+            # Deduplicate against the store, the installed version stays referenced as it becomes the .prev
+            previous_manifest = self.get_installed_manifest(game_name) or []
+            self.store.adopt(game_name, staging_folder, game_metadata["manifest"],
+                             keep=[entry['sha256'] for entry in previous_manifest])
+        
+        game_folder = self.commit_staged_install(game_name, staging_folder)
+        
+        # Update registry
+        self.update_installed_game(game_name, self._registry_entry(game_metadata, game_folder))
+        return game_folder
+
+    def get_download_path(self, game_name: str, game_version: str) -> str:
+        """temp/<game>/<game>_<version>.zip, the archive (and its .part while downloading) of a remote install"""
+        return os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'temp', game_name, f"{game_name}_{game_version}.zip")
+    
+    def discard_download(self, game_name: str, game_version: str):
+        """Delete the archive and partial data of a cancelled download"""
+        zip_path = self.get_download_path(game_name, game_version)
+        self._discard_partial(zip_path)
+        try:
+            os.remove(zip_path)
+        except FileNotFoundError:
+            pass
+    
+    def download_game(self, game_data: Dict, progress_callback: Callable[[float, str], None]=None, is_local:Literal['--local', '--remote']='--remote',
+                      control: Optional[DownloadControl] = None) -> str:
         """
         Download and install a game with queue support
+        progress_callback(percent, status) gets two more arguments (bytes done, bytes total) while bytes are downloaded.
+        control: pause/cancel and bandwidth limit of the download, a paused download keeps its partial file.
+        Returns how it ended: DOWNLOAD_DONE, DOWNLOAD_PAUSED, DOWNLOAD_CANCELLED or DOWNLOAD_FAILED.
         """
+        outcome = self._install_game(game_data, progress_callback, is_local, control)
+        if is_local == '--remote' and outcome != DOWNLOAD_PAUSED:
+            # Only a paused download resumes from the partial file, after anything else it is stale
+            self._discard_partial(self.get_download_path(game_data["game_name"], game_data["game_version"]))
+        return outcome
+    
+    def _install_game(self, game_data: Dict, progress_callback=None, is_local: str = '--remote',
+                      control: Optional[DownloadControl] = None) -> str:
+        """download_game() without the cleanup of the partial file"""
         if is_local == '--remote':
             game_name = game_data["game_name"]
             game_version = game_data["game_version"]
@@ -245,7 +613,7 @@ class Downloader:
                 print(f"No download URL found for {game_name}")
                 if progress_callback:
                     progress_callback(100, f"Error: No download URL for {game_name}")
-                return False
+                return DOWNLOAD_FAILED
             
             print(f"Starting download: {game_name} v{game_version}")
             
@@ -255,106 +623,111 @@ class Downloader:
                 print(f"Game {game_name} is already up to date (v{current_version})")
                 if progress_callback:
                     progress_callback(100, f"{game_name} is already up to date")
-                return True
+                return DOWNLOAD_DONE
             
             if current_version:
                 print(f"Updating from v{current_version} to v{game_version}")
             
-            # Create temp directory for download
-            temp_dir = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'temp', game_name)
-            os.makedirs(temp_dir, exist_ok=True)
-            
             # Define paths
-            zip_filename = f"{game_name}_{game_version}.zip"
-            zip_path = os.path.join(temp_dir, zip_filename)
-            game_folder = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'games', game_name)
+            zip_path = self.get_download_path(game_name, game_version)
+            temp_dir = os.path.dirname(zip_path)
+            os.makedirs(temp_dir, exist_ok=True)
+            # Entries are extracted here (while downloading when possible), the installed game is only replaced once verified
+            staging_folder = self.get_staging_folder(game_name, game_version)
             
             try:
-                # Download the game
-                if progress_callback:
-                    progress_callback(0, f"Starting download: {game_name}")
-                
-                def download_progress(percent, downloaded, total):
-                    if progress_callback:
-                        # Map to overall progress (0-50% for download)
-                        overall_percent = percent * 0.5
-                        progress_callback(overall_percent, f"Downloading: {percent:.1f}%")
-                
-                download_success = self.download_file(game_url, zip_path, download_progress)
-                
-                if not download_success:
-                    print(f"Failed to download {game_name}")
-                    if progress_callback:
-                        progress_callback(100, f"Failed to download {game_name}")
-                    return False
-                
-                # Extract the game
-                if progress_callback:
-                    progress_callback(50, f"Extracting {game_name}...")
-                
-                def extract_progress(current, total):
-                    if progress_callback:
-                        # Map to overall progress (50-100% for extraction)
-                        percent = (current / total) * 100
-                        overall_percent = 50 + (percent * 0.5)
-                        progress_callback(overall_percent, f"Extracting: {current}/{total} files")
-                
-                # Remove old game folder if exists (for update)
-                if os.path.exists(game_folder):
-                    shutil.rmtree(game_folder)
-                
-                extract_success = self.extract_zip(zip_path, game_folder, extract_progress)
+                if os.path.exists(staging_folder):
+                    remove_tree(staging_folder)
                 
-                if not extract_success:
-                    print(f"Failed to extract {game_name}")
-                    if progress_callback:
-                        progress_callback(100, f"Failed to extract {game_name}")
-                    return False
-                
-                # Create or update game.json with metadata
-                game_metadata = {
-                    "name": game_name,
-                    "version": game_version,
-                    "author": game_data.get("game_author", ""),
-                    "category": game_data.get("game_category", ""),
-                    "tags": game_data.get("game_tags", []),
-                    "description": game_data.get("game_description", ""),
-                    "total_size": game_data.get("total_size", 0),
-                    "total_files": game_data.get("total_files", 0),
-                    "installed_date": self._get_current_date(),
-                    "download_url": game_url
-                }
+                hashes = None
+                if not os.path.exists(zip_path) and not os.path.exists(zip_path + '.part'):
+                    # Reuse the files already on disk (installed version, other games) and fetch only the missing ones
+                    hashes = self.delta_update(game_data, game_url, staging_folder, progress_callback, control)
                 
-                metadata_path = os.path.join(game_folder, 'game.json')
-                with open(metadata_path, 'w') as f:
-                    json.dump(game_metadata, f, indent=2)
+                if hashes is None:
+                    extractor = None
+                    if os.path.exists(zip_path):
+                        # A previous attempt already downloaded this version, no need to download it again
+                        print(f"Reusing downloaded archive: {zip_path}")
+                    else:
+                        # Download the game
+                        if progress_callback:
+                            progress_callback(0, f"Starting download: {game_name}")
+                        
+                        extractor = StreamingZipExtractor(staging_folder)
+                        
+                        def download_progress(percent, downloaded, total):
+                            if progress_callback:
+                                # Map to overall progress (0-90% for download + streamed extraction)
+                                overall_percent = percent * 0.9
+                                progress_callback(overall_percent, f"Downloading: {percent:.1f}% ({extractor.files} files extracted)",
+                                                  downloaded, total)
+                        
+                        download_success = self.download_file(game_url, zip_path, download_progress, sink=extractor, control=control)
+                        
+                        if not download_success:
+                            print(f"Failed to download {game_name}")
+                            if progress_callback:
+                                progress_callback(100, f"Failed to download {game_name}")
+                            return DOWNLOAD_FAILED
+                        
+                        # The archive was hashed as it arrived
+                        expected_hash = game_data.get("game_archive_hash")
+                        if expected_hash and extractor.archive_hash.hexdigest() != expected_hash:
+                            print(f"Archive hash mismatch for {game_name}, discarding the download")
+                            os.remove(zip_path)
+                            remove_tree(staging_folder, ignore_errors=True)
+                            if progress_callback:
+                                progress_callback(100, f"Corrupted download for {game_name}")
+                            return DOWNLOAD_FAILED
+                    
+                    hashes = extractor.hashes if extractor is not None else {}
+                    if extractor is None or not extractor.finished:
+                        # The archive was not streamed, extract the complete file
+                        print(f"Extracting {game_name} from the downloaded archive")
+                        if progress_callback:
+                            progress_callback(90, f"Extracting {game_name}...")
+                        
+                        def extract_progress(current, total):
+                            if progress_callback:
+                                # Map to overall progress (90-95% for extraction)
+                                percent = (current / total) * 100
+                                overall_percent = 90 + (percent * 0.05)
+                                progress_callback(overall_percent, f"Extracting: {current}/{total} files")
+                        
+                        if os.path.exists(staging_folder):
+                            remove_tree(staging_folder)
+                        
+                        hashes = {}
+                        extract_success = self.extract_zip(zip_path, staging_folder, extract_progress, hashes)
+                        
+                        if not extract_success:
+                            print(f"Failed to extract {game_name}")
+                            # The archive itself is bad, the next attempt downloads it again
+                            try:
+                                os.remove(zip_path)
+                            except OSError:
+                                pass
+                            remove_tree(staging_folder, ignore_errors=True)
+                            if progress_callback:
+                                progress_callback(100, f"Failed to extract {game_name}")
+                            return DOWNLOAD_FAILED
                 
-                # Verify download
-                if progress_callback:
-                    progress_callback(95, f"Verifying {game_name}...")
+                game_folder = self._finalize_install(game_data, staging_folder, game_url, progress_callback, hashes)
                 
-                if not self.verify_download(game_name, game_folder):
+                if not game_folder:
                     print(f"Verification failed for {game_name}")
+                    # Files did not match the manifest, do not reuse this archive
+                    try:
+                        os.remove(zip_path)
+                    except OSError:
+                        pass
+                    remove_tree(staging_folder, ignore_errors=True)
                     if progress_callback:
                         progress_callback(100, f"Verification failed for {game_name}")
-                    return False
-                
-                # Update registry
-                self.installed_games["games"][game_name] = {
-                    "version": game_version,
-                    "installed_date": game_metadata["installed_date"],
-                    "size": game_data.get("total_size", 0),
-                    "files": game_data.get("total_files", 0),
-                    "author": game_data.get("game_author", ""),
-                    "category": game_data.get("game_category", ""),
-                    "tags": game_data.get("game_tags", []),
-                    "description": game_data.get("game_description", ""),
-                    "path": game_folder
-                }
-                
-                self.save_installed_games()
+                    return DOWNLOAD_FAILED
                 
-                # Cleanup temp file
+                # Cleanup temp file, a failed install keeps it so a retry needs no download
                 try:
                     os.remove(zip_path)
                     os.rmdir(temp_dir)
@@ -367,18 +740,28 @@ class Downloader:
                 print(f"\n✓ Successfully installed {game_name} v{game_version}")
                 print(f"  Location: {game_folder}")
                 
-                return True
-                
+                return DOWNLOAD_DONE
+            
+            except DownloadInterrupted as e:
+                remove_tree(staging_folder, ignore_errors=True)
+                if isinstance(e, DownloadCancelled):
+                    self.discard_download(game_name, game_version)
+                    print(f"Download of {game_name} cancelled")
+                    return DOWNLOAD_CANCELLED
+                # The partial file stays, resuming continues from it
+                print(f"Download of {game_name} paused")
+                return DOWNLOAD_PAUSED
+            
             except Exception as e:
                 print(f"\n✗ Error installing {game_name}: {e}")
-                # Cleanup on failure
-                if os.path.exists(game_folder):
-                    shutil.rmtree(game_folder)
+                # Cleanup on failure, the previous install is untouched until the final rename
+                if os.path.exists(staging_folder):
+                    remove_tree(staging_folder, ignore_errors=True)
                 
                 if progress_callback:
                     progress_callback(100, f"Error: {str(e)[:50]}...")
                 
-                return False
+                return DOWNLOAD_FAILED
         elif is_local == '--local':
             # Get zip from ../games/
             games_folder = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), '..', 'games')
@@ -388,13 +771,13 @@ class Downloader:
                 if os.path.exists(game_zip):
                     if progress_callback: progress_callback(6, 'Locally installing game...')
                     game_name = game_data['game_name']
-                    game_folder = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'games', game_name)
                     game_version = game_data['game_version']
+                    staging_folder = self.get_staging_folder(game_name, game_version)
                     print(f"Installing {game_name} from {game_zip}")
                     
-                    # First 
-                    if os.path.exists(game_folder):
-                        shutil.rmtree(game_folder)
+                    # Extract next to the install, the current version stays playable meanwhile
+                    if os.path.exists(staging_folder):
+                        remove_tree(staging_folder)
                         
                     # Extract the game
                     if progress_callback:
@@ -402,69 +785,49 @@ class Downloader:
                     
                     def extract_progress(current, total):
                         if progress_callback:
-                            # Map to overall progress (50-100% for extraction)
+                            # Map to overall progress (50-95% for extraction)
                             percent = (current / total) * 100
-                            overall_percent = 50 + (percent * 0.5)
+                            overall_percent = 50 + (percent * 0.45)
                             progress_callback(overall_percent, f"Extracting: {current}/{total} files")
                     
-                    extract_success = self.extract_zip(game_zip, game_folder, extract_progress)
+                    hashes = {}
+                    extract_success = self.extract_zip(game_zip, staging_folder, extract_progress, hashes)
                     
                     if not extract_success:
                         print(f"Failed to extract {game_name}")
+                        remove_tree(staging_folder, ignore_errors=True)
                         if progress_callback:
                             progress_callback(100, f"Failed to extract {game_name}")
-                        return False
+                        return DOWNLOAD_FAILED
                     
-                    # Create or update game.json with metadata
-                    game_metadata = {
-                        "name": game_name,
-                        "version": game_version,
-                        "author": game_data.get("game_author", ""),
-                        "category": game_data.get("game_category", ""),
-                        "tags": game_data.get("game_tags", []),
-                        "description": game_data.get("game_description", ""),
-                        "total_size": game_data.get("total_size", 0),
-                        "total_files": game_data.get("total_files", 0),
-                        "installed_date": self._get_current_date(),
-                        "download_url": 'None'
-                    }
+                    game_folder = self._finalize_install(game_data, staging_folder, 'None', progress_callback, hashes)
                     
-                    metadata_path = os.path.join(game_folder, 'game.json')
-                    with open(metadata_path, 'w') as f:
-                        json.dump(game_metadata, f, indent=2)
-                    
-                    # Update registry
-                    self.installed_games["games"][game_name] = {
-                        "version": game_version,
-                        "installed_date": game_metadata["installed_date"],
-                        "size": game_data.get("total_size", 0),
-                        "files": game_data.get("total_files", 0),
-                        "author": game_data.get("game_author", ""),
-                        "category": game_data.get("game_category", ""),
-                        "tags": game_data.get("game_tags", []),
-                        "description": game_data.get("game_description", ""),
-                        "path": game_folder
-                    }
-                    
-                    self.save_installed_games()
+                    if not game_folder:
+                        print(f"Verification failed for {game_name}")
+                        remove_tree(staging_folder, ignore_errors=True)
+                        if progress_callback:
+                            progress_callback(100, f"Verification failed for {game_name}")
+                        return DOWNLOAD_FAILED
                     
                     if progress_callback:
                         progress_callback(100, f"Successfully installed {game_name}")
                     
                     print(f"\n✓ Successfully installed {game_name} v{game_version}")
                     print(f"  Location: {game_folder}")
+                    return DOWNLOAD_DONE
                     
                 else:
                     if progress_callback: progress_callback(100, f'Error: Game zip not found: {game_zip}')
                     print(f"Error: Game zip not found: {game_zip}")
+                    return DOWNLOAD_FAILED
             else:
                 if progress_callback: progress_callback(100, f'Error: Games folder not found: {games_folder}')
                 print(f"Error: Games folder not found: {games_folder}")
-                return False
+                return DOWNLOAD_FAILED
         else:
             if progress_callback: progress_callback(100, f'Error: Invalid install type: {is_local}')
             print(f"Error: Invalid install type: {is_local}")
-            return False
+            return DOWNLOAD_FAILED
     
     def _get_current_date(self) -> str:
         """Get current date in YYYY-MM-DD format"""
@@ -482,14 +845,19 @@ class Downloader:
         # Remove game folder
         if os.path.exists(game_folder):
             try:
-                shutil.rmtree(game_folder)
+                remove_tree(game_folder)
             except Exception as e:
                 print(f"Error removing game folder: {e}")
                 return False
         
+        # The version kept for rollback goes too
+        self._discard_folder(game_folder + '.prev')
+        
+        # Blobs no other game uses are deleted
+        self.store.release(game_name)
+        
         # Remove from registry
-        del self.installed_games["games"][game_name]
-        self.save_installed_games()
+        self.update_installed_game(game_name, None)
         
         print(f"Successfully uninstalled {game_name}")
         return True
@@ -499,15 +867,8 @@ class Downloader:
         if self.is_game_installed(game_name):
             game_info = self.installed_games["games"][game_name]
             
-            # Check if needs update (requires comparing with remote version)
-            needs_update = False
-            if self.games_data:
-                for game in self.games_data.get('games', []):
-                    if game.get('game_name') == game_name:
-                        remote_version = game.get('game_version')
-                        if remote_version:
-                            needs_update, _ = self.needs_update(game_name, remote_version)
-                        break
+            # Check if needs update (compared with the parsed catalog version)
+            needs_update = self.catalog.needs_update(game_name, game_info.get("version"))
             
             return {
                 "installed": True,
@@ -538,13 +899,7 @@ class Downloader:
     
     def get_game_info(self, game_name: str) -> Optional[Dict]:
         """Get game information from games_data"""
-        if not self.games_data:
-            return None
-        
-        for game in self.games_data.get('games', []):
-            if game.get('game_name') == game_name:
-                return game
-        return None
+        return self.catalog.get(game_name)
 
 if __name__ == '__main__':
     # Example usage
@@ -572,8 +927,8 @@ if __name__ == '__main__':
     # Example: Download a game
     if sample_games_data["games"]:
         game_to_download = sample_games_data["games"][0]
-        success = downloader.download_game(game_to_download)
-        if success:
+        outcome = downloader.download_game(game_to_download)
+        if outcome == DOWNLOAD_DONE:
             print(f"Successfully downloaded {game_to_download['game_name']}")
         else:
             print(f"Failed to download {game_to_download['game_name']}")
\ No newline at end of file
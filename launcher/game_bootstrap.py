@@ -0,0 +1,73 @@
+"""
+Entry point of the games started by the launcher, spawned or forked from the zygote:
+    python game_bootstrap.py <main.py> [game arguments]
+The game runs as if it was started directly (__main__, sys.argv, sys.path). When LUNA_LAUNCH_T0 (time of the
+Play click) is set, the time to the first window and to the first frame is printed as '[luna-metric] name=ms'.
+"""
+import os, sys, runpy, time
+
+METRIC_PREFIX = '[luna-metric]'
+LAUNCHER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def emit_metric(name: str, value: float):
+    print(f"{METRIC_PREFIX} {name}={value:.1f}", flush=True)
+
+def parse_metric(line: str):
+    """(name, value) of a metric line, None for any other output"""
+    if not line.startswith(METRIC_PREFIX):
+        return None
+    name, _, value = line[len(METRIC_PREFIX):].strip().partition('=')
+    try:
+        return name, float(value)
+    except ValueError:
+        return None
+
+def instrument(launch_time: float):
+    """Wrap pygame.display once: set_mode gives the window time, the first flip/update the first frame time"""
+    try:
+        import pygame
+    except ImportError:
+        return
+    display = pygame.display
+    original_set_mode, original_flip, original_update = display.set_mode, display.flip, display.update
+
+    def set_mode(*args, **kwargs):
+        surface = original_set_mode(*args, **kwargs)
+        display.set_mode = original_set_mode
+        emit_metric('window_ms', (time.time() - launch_time) * 1000)
+        return surface
+
+    reported = []
+
+    def first_frame(original):
+        def present(*args, **kwargs):
+            result = original(*args, **kwargs)
+            if not reported:
+                reported.append(True)
+                # Unwrapped unless something wrapped them since (luna_telemetry), then this stays a pass-through
+                if display.flip is flip:
+                    display.flip = original_flip
+                if display.update is update:
+                    display.update = original_update
+                emit_metric('first_frame_ms', (time.time() - launch_time) * 1000)
+            return result
+        return present
+
+    flip, update = first_frame(original_flip), first_frame(original_update)
+    display.set_mode = set_mode
+    display.flip, display.update = flip, update
+
+def run(main_path: str, args: list):
+    launch_time = float(os.environ.get('LUNA_LAUNCH_T0') or 0)
+    if launch_time:
+        instrument(launch_time)
+    main_path = os.path.abspath(main_path)
+    sys.argv = [main_path, *args]
+    # The game's own folder comes first, as when running 'python main.py', the launcher's modules (luna_telemetry) last
+    sys.path[0] = os.path.dirname(main_path)
+    if LAUNCHER_DIR not in sys.path:
+        sys.path.append(LAUNCHER_DIR)
+    runpy.run_path(main_path, run_name='__main__')
+
+if __name__ == '__main__':
+    run(sys.argv[1], sys.argv[2:])
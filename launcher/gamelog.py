@@ -0,0 +1,122 @@
+import os, threading, time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+class GameLog:
+    """
+    Output of one game session. The pipe reader threads only append to memory: a bounded ring buffer (the recent
+    lines) and a pending batch that a writer thread appends to logs/<game>/<timestamp>.log every flush_interval,
+    so the game is never slowed down by the launcher's console or disk. A log over max_bytes continues in a new
+    part, only the newest keep_files logs of a game are kept.
+    """
+    def __init__(self, logs_root: str, game_name: str, max_lines: int = 2000, max_pending: int = 100000,
+                 flush_interval: float = 0.5, max_bytes: int = 5 * 1024 * 1024, keep_files: int = 10):
+        self.folder = os.path.join(logs_root, game_name)
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.keep_files = keep_files
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self.dropped = 0
+
+        self.lock = threading.Lock()
+        self._pending: List[str] = []
+        self._closed = threading.Event()
+        self._session = time.strftime("%Y%m%d-%H%M%S")
+        self._part = 0
+        self._file = None
+        self.path = ''
+        try:
+            os.makedirs(self.folder, exist_ok=True)
+            self._open_file()
+            self._rotate()
+        except OSError as e:
+            print(f"Game log disabled for {game_name}: {e}")
+        self._writer = threading.Thread(target=self._write_loop, daemon=True, name=f'gamelog-{game_name}')
+        self._writer.start()
+
+    def _open_file(self):
+        suffix = f"-{self._part}" if self._part else ''
+        self.path = os.path.join(self.folder, f"{self._session}{suffix}.log")
+        self._file = open(self.path, 'a', encoding='utf-8', errors='replace')
+
+    def _rotate(self):
+        """Delete the oldest logs of the game beyond keep_files"""
+        logs = [os.path.join(self.folder, name) for name in os.listdir(self.folder) if name.endswith('.log')]
+        logs.sort(key=os.path.getmtime)
+        for path in logs[:-self.keep_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def write(self, stream: str, line: str):
+        """Record a line of the game's output (any thread, never blocks on I/O)"""
+        entry = f"{time.strftime('%H:%M:%S')} [{stream}] {line}"
+        with self.lock:
+            self.lines.append(entry)
+            if len(self._pending) >= self.max_pending:
+                # The disk cannot keep up, drop the oldest pending lines rather than slow the game down
+                drop = len(self._pending) // 2
+                del self._pending[:drop]
+                self.dropped += drop
+            self._pending.append(entry)
+
+    def tail(self, count: int = 200) -> List[str]:
+        with self.lock:
+            return list(self.lines)[-count:]
+
+    def _flush(self):
+        with self.lock:
+            batch, self._pending = self._pending, []
+        if not batch or self._file is None:
+            return
+        try:
+            self._file.write('\n'.join(batch) + '\n')
+            self._file.flush()
+            if self._file.tell() > self.max_bytes:
+                self._file.close()
+                self._part += 1
+                self._open_file()
+                self._rotate()
+        except OSError as e:
+            print(f"Error writing game log: {e}")
+
+    def _write_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            self._flush()
+        self._flush()
+        if self._file is not None:
+            self._file.close()
+
+    def close(self):
+        """Write what is left and close the file"""
+        self._closed.set()
+        self._writer.join(timeout=2)
+
+class LogTail:
+    """Reads what was appended to a log file since the last call, following GameLog to its next part"""
+    def __init__(self, game_log: GameLog, initial_bytes: int = 64 * 1024):
+        self.game_log = game_log
+        self.initial_bytes = initial_bytes
+        self.path: Optional[str] = None
+        self.offset = 0
+
+    def read(self) -> Tuple[str, bool]:
+        """(new text, True if it starts a new file)"""
+        path = self.game_log.path
+        restarted = path != self.path
+        if restarted:
+            self.path = path
+            try:
+                self.offset = max(0, os.path.getsize(path) - self.initial_bytes)
+            except OSError:
+                self.offset = 0
+        try:
+            with open(path, 'rb') as f:
+                f.seek(self.offset)
+                data = f.read()
+                self.offset = f.tell()
+        except OSError:
+            return '', restarted
+        return data.decode('utf-8', errors='replace'), restarted
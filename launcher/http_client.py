@@ -0,0 +1,51 @@
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Dict, Optional, Tuple, Union
+
+class HttpClient:
+    """
+    Launcher-wide HTTP client.
+    A single keep-alive session is shared by catalog, icon and archive traffic,
+    so repeated requests to the same host reuse one TCP+TLS connection.
+    """
+    DEFAULT_CONNECT_TIMEOUT = 5.0
+    DEFAULT_READ_TIMEOUT = 30.0
+    DEFAULT_POOL_SIZE = 6
+
+    def __init__(self, connect_timeout: float = DEFAULT_CONNECT_TIMEOUT, read_timeout: float = DEFAULT_READ_TIMEOUT,
+                 pool_size: int = DEFAULT_POOL_SIZE, user_agent: str = 'LunaLauncher'):
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+
+        # pool_connections: how many hosts keep a pool, pool_maxsize: connections per host.
+        # pool_block makes extra threads wait for a free connection instead of opening new ones.
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.session.headers.update({
+            'User-Agent': user_agent,
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
+        })
+
+    @classmethod
+    def from_settings(cls, settings: Dict) -> 'HttpClient':
+        """Build a client from the launcher settings.json values"""
+        def number(key: str, default: float) -> float:
+            try:
+                return float(settings.get(key, default))
+            except (TypeError, ValueError):
+                return default
+
+        return cls(connect_timeout=number('http_connect_timeout', cls.DEFAULT_CONNECT_TIMEOUT),
+                   read_timeout=number('http_read_timeout', cls.DEFAULT_READ_TIMEOUT),
+                   pool_size=max(1, int(number('http_pool_size', cls.DEFAULT_POOL_SIZE))))
+
+    def get(self, url: str, timeout: Optional[Union[float, Tuple[float, float]]] = None, **kwargs) -> requests.Response:
+        """GET through the shared session, using the client timeout policy unless overridden"""
+        return self.session.get(url, timeout=timeout or self.timeout, **kwargs)
+
+    def close(self):
+        """Close every pooled connection"""
+        self.session.close()
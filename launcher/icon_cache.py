@@ -0,0 +1,205 @@
+import os, json, hashlib, threading, time
+from typing import Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from http_client import HttpClient
+
+class IconCache:
+    """
+    Persistent game icon cache in cache/icons/.
+    Icons are keyed by URL plus the catalog supplied hash (game_icon_hash): a keyed file never goes stale
+    and is served from disk without any request. Icons without a hash are revalidated with a conditional
+    request at most once per session. The folder is kept under max_bytes by evicting least recently used icons.
+    """
+    INDEX_SAVE_INTERVAL = 60.0
+
+    def __init__(self, cache_dir: str, http: HttpClient, max_bytes: int = 32 * 1024 * 1024):
+        self.http = http
+        self.max_bytes = max_bytes
+        self.icons_dir = os.path.join(cache_dir, 'icons')
+        self.index_path = os.path.join(self.icons_dir, 'index.json')
+        self.lock = threading.Lock()
+        self.index: Dict[str, Dict] = self._load_index()
+        self.validated = set()
+        self._last_index_save = time.time()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self):
+        """Write the index (caller holds the lock)"""
+        os.makedirs(self.icons_dir, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(temp_path, self.index_path)
+        self._last_index_save = time.time()
+
+    @staticmethod
+    def key_for(url: str, content_hash: Optional[str] = None) -> str:
+        return hashlib.sha1(f'{url}#{content_hash or ""}'.encode('utf-8')).hexdigest()
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.icons_dir, f'{key}.png')
+
+    def _touch(self, key: str):
+        """Mark an icon as recently used, the index is only flushed every INDEX_SAVE_INTERVAL"""
+        with self.lock:
+            if key in self.index:
+                self.index[key]['last_used'] = time.time()
+                if time.time() - self._last_index_save > self.INDEX_SAVE_INTERVAL:
+                    self._save_index()
+
+    def get(self, url: str, content_hash: Optional[str] = None) -> Optional[str]:
+        """
+        Return the local path of the icon at url, downloading or revalidating only when needed.
+        Returns None if the icon is not cached and cannot be downloaded.
+        """
+        key = self.key_for(url, content_hash)
+        path = self.path_for(key)
+
+        with self.lock:
+            entry = self.index.get(key)
+        cached = entry is not None and os.path.exists(path)
+
+        if cached and (content_hash or key in self.validated):
+            self._touch(key)
+            return path
+
+        headers = {}
+        if cached:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.http.get(url, headers=headers)
+            if response.status_code == 304 and cached:
+                self.validated.add(key)
+                self._touch(key)
+                return path
+            response.raise_for_status()
+            content = response.content
+        except Exception as e:
+            print(f"Error fetching icon {url}: {e}")
+            # A stale icon is better than no icon
+            return path if cached else None
+
+        if content_hash and hashlib.sha256(content).hexdigest() != content_hash:
+            # Bad or partial download, not cached so the next session tries again
+            print(f"Icon hash mismatch for {url}")
+            return path if cached else None
+
+        os.makedirs(self.icons_dir, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+        with self.lock:
+            self.index[key] = {
+                'url': url,
+                'hash': content_hash,
+                'size': len(content),
+                'etag': response.headers.get('etag'),
+                'last_modified': response.headers.get('last-modified'),
+                'last_used': time.time()
+            }
+            self.validated.add(key)
+            self._evict(keep=key)
+            self._save_index()
+        return path
+
+    def _evict(self, keep: Optional[str] = None):
+        """Delete least recently used icons until the cache fits max_bytes (caller holds the lock)"""
+        total = sum(entry.get('size', 0) for entry in self.index.values())
+        for key, entry in sorted(self.index.items(), key=lambda item: item[1].get('last_used', 0)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            try:
+                os.remove(self.path_for(key))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"Error evicting icon {key}: {e}")
+                continue
+            total -= entry.get('size', 0)
+            del self.index[key]
+
+class IconLoader:
+    """
+    Resolves (cache/network) and decodes game icons on a background pool.
+    Every icon is decoded and downscaled once, later requests for the same icon are answered from memory.
+    """
+    def __init__(self, resolve: Callable[[Dict], Optional[str]], size: Tuple[int, int] = (64, 64), workers: int = 4):
+        self.resolve = resolve
+        self.size = size
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='icon-loader')
+        self.lock = threading.Lock()
+        self.images: Dict[Tuple, Image.Image] = {}
+        # Requests made while paused, submitted on resume()
+        self.paused = False
+        self._held: List[Tuple] = []
+
+    @staticmethod
+    def key_for(game_data: Dict) -> Tuple:
+        return (game_data.get('game_name'), game_data.get('game_icon'), game_data.get('game_icon_hash'))
+
+    def get_loaded(self, game_data: Dict) -> Optional[Image.Image]:
+        """Return the decoded icon if it was already loaded"""
+        with self.lock:
+            return self.images.get(self.key_for(game_data))
+
+    def request(self, game_data: Dict, callback: Callable[[Optional[Image.Image]], None]):
+        """
+        Load the icon of game_data in the background.
+        callback(image) runs on a loader thread (image is None on failure), marshal it to Tk with after().
+        """
+        with self.lock:
+            if self.paused:
+                self._held.append((game_data, callback))
+                return
+        self.executor.submit(self._load, game_data, callback)
+
+    def pause(self):
+        """Hold new requests (e.g. while a game runs), already decoded icons are still answered by get_loaded()"""
+        with self.lock:
+            self.paused = True
+
+    def resume(self):
+        with self.lock:
+            self.paused = False
+            held, self._held = self._held, []
+        for game_data, callback in held:
+            self.executor.submit(self._load, game_data, callback)
+
+    def _load(self, game_data: Dict, callback: Callable[[Optional[Image.Image]], None]):
+        key = self.key_for(game_data)
+        image = self.get_loaded(game_data)
+        if image is None:
+            try:
+                icon_file = self.resolve(game_data)
+                if icon_file:
+                    with Image.open(icon_file) as source:
+                        image = source.convert('RGBA').resize(self.size, Image.LANCZOS)
+                    with self.lock:
+                        self.images[key] = image
+            except Exception as e:
+                print(f"Error loading icon for {game_data.get('game_name')}: {e}")
+                image = None
+        callback(image)
+
+    def forget(self):
+        """Drop decoded icons (e.g. after clearing the cache)"""
+        with self.lock:
+            self.images.clear()
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,108 @@
+import os, sys, json, shutil, subprocess, threading
+from typing import Dict, List, Optional, Tuple
+
+class InterpreterCache:
+    """
+    Python interpreter used to run games from the frozen launcher, found once and cached in config/interpreter.json
+    (absolute path, version, mtime and size). A cached interpreter is revalidated with a stat, the probing
+    (one process per candidate) only runs again when it changed or disappeared.
+    """
+    def __init__(self, cache_path: str, launcher_dir: str):
+        self.cache_path = cache_path
+        self.launcher_dir = launcher_dir
+        # Held during discovery, a launch waits for the background discovery instead of probing again
+        self.lock = threading.Lock()
+        self.entry: Optional[Dict] = self._load()
+
+    def _load(self) -> Optional[Dict]:
+        try:
+            with open(self.cache_path, 'r') as f:
+                entry = json.load(f)
+            return entry if entry.get('path') else None
+        except Exception:
+            return None
+
+    def _save(self, entry: Dict):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(self.cache_path, 'w') as f:
+                json.dump(entry, f, indent=2)
+        except OSError as e:
+            print(f"Error saving interpreter cache: {e}")
+
+    @staticmethod
+    def _stat(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return None
+
+    def candidates(self) -> List[Tuple[str, List[str]]]:
+        """(absolute path, extra arguments) to try in order: bundled Python, system Python, the Windows py launcher"""
+        bundled = []
+        for base in (self.launcher_dir, os.path.dirname(sys.executable)):
+            bundled += [os.path.join(base, 'python', 'pythonw.exe'), os.path.join(base, 'python', 'python.exe')]
+        found = [(path, []) for path in bundled if os.path.isfile(path)]
+
+        # On Windows, try pythonw.exe first (no console window)
+        names = ['pythonw.exe', 'python.exe'] if sys.platform == 'win32' else ['python3', 'python']
+        for name in names:
+            path = shutil.which(name)
+            if path:
+                found.append((os.path.abspath(path), []))
+        if sys.platform == 'win32':
+            path = shutil.which('py')
+            if path:
+                # The py launcher needs -3 to pick a Python 3
+                found.append((os.path.abspath(path), ['-3']))
+        return found
+
+    @staticmethod
+    def probe(path: str, args: List[str]) -> Optional[str]:
+        """Version of a Python 3 interpreter, None if it does not run"""
+        try:
+            result = subprocess.run([path, *args, '-c', 'import sys; print(sys.version.split()[0])'],
+                                    capture_output=True, text=True, timeout=5)
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        version = result.stdout.strip()
+        if result.returncode != 0 or not version.startswith('3'):
+            return None
+        return version
+
+    def discover(self) -> Optional[Dict]:
+        """Probe the candidates and cache the first working interpreter"""
+        for path, args in self.candidates():
+            version = self.probe(path, args)
+            if version is None:
+                continue
+            mtime, size = self._stat(path)
+            entry = {'path': path, 'args': args, 'version': version, 'mtime': mtime, 'size': size}
+            print(f"Found Python {version}: {path}")
+            self._save(entry)
+            return entry
+        return None
+
+    def _valid(self, entry: Optional[Dict]) -> bool:
+        return bool(entry) and self._stat(entry['path']) == (entry.get('mtime'), entry.get('size'))
+
+    def get(self) -> Optional[Dict]:
+        """Cached interpreter ({'path', 'args', 'version'...}) if it is unchanged, otherwise discovered again"""
+        entry = self.entry
+        if self._valid(entry):
+            return entry
+        with self.lock:
+            # Discovered by another thread while we waited
+            if self._valid(self.entry):
+                return self.entry
+            self.entry = self.discover()
+            return self.entry
+
+    def warm(self):
+        """Validate or discover the interpreter in the background at startup"""
+        threading.Thread(target=self.get, daemon=True, name='interpreter-discovery').start()
+
+    @staticmethod
+    def command(entry: Dict) -> List[str]:
+        return [entry['path'], *entry.get('args', [])]
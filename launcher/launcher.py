@@ -2,10 +2,23 @@ import os, sys, json, requests, shutil, threading, subprocess, time
 from typing import Literal, Optional, List, Dict, Set, Tuple
 from threading import Thread
 import customtkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, TclError
 from PIL import Image, ImageTk
 import io
 from downloader import Downloader
+from http_client import HttpClient
+from catalog import Catalog, CatalogCache, CatalogIndex
+from icon_cache import IconCache, IconLoader
+from progress import ProgressChannel, format_rate
+from scheduler import DownloadScheduler, PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH, DOWNLOAD_PAUSED
+from interpreter import InterpreterCache
+from zygote import GameZygote, BOOTSTRAP_SCRIPT
+from game_bootstrap import parse_metric
+from supervisor import ProcessSupervisor
+from gamelog import GameLog, LogTail
+from resmon import ResourceMonitor
+from luna_telemetry import TelemetryServer
+from priority import LauncherPriority, apply_game_priority, reserved_cpus, affinity_supported, io_priority_supported
 
 run_mode: Literal['--local', '--remote'] = '--remote'
 
@@ -22,6 +35,7 @@ class Path:
     temp = os.path.join(this_path, 'temp')
     cache = os.path.join(this_path, 'cache')
     config = os.path.join(this_path, 'config')
+    logs = os.path.join(this_path, 'logs')
     github = 'https://api.github.com/repos/MrJuaumBR/LunaEngine-Games/contents/games'
     data_remote = 'https://raw.githubusercontent.com/MrJuaumBR/LunaEngine-Games/refs/heads/main/games/data.json'
     
@@ -210,9 +224,25 @@ class FilterManager:
         'updates': 'Updates Available'
     }
     
+    # Game field each sort depends on ('*_desc' sorts use the same field, installed/not_installed sort by name)
+    SORT_FIELDS = {
+        'name': 'game_name', 'installed': 'game_name', 'not_installed': 'game_name',
+        'author': 'game_author', 'size': 'total_size', 'files': 'total_files', 'version': 'game_version'
+    }
+    
     @staticmethod
-    def sort_games(games: List[Dict], sort_by: str, downloader: Downloader) -> List[Dict]:
+    def sort_games(games: List[Dict], sort_by: str, downloader: Downloader, catalog: Optional[Catalog] = None) -> List[Dict]:
         """Sort games with installation awareness"""
+        index = catalog.index if catalog is not None else None
+        if index is not None:
+            # Walk the cached catalog order and keep the filtered games, O(n) instead of a sort
+            order = index.sort_order(sort_by, downloader.get_all_installed_games(), downloader.registry_version)
+            if order is not None:
+                selected = {id(game) for game in games}
+                sorted_games = [index.games[i] for i in order if id(index.games[i]) in selected]
+                if len(sorted_games) == len(games):
+                    return sorted_games
+        
         if sort_by == 'installed':
             return sorted(games, key=lambda x: (not downloader.is_game_installed(x['game_name']), x['game_name'].lower()))
         elif sort_by == 'not_installed':
@@ -241,19 +271,21 @@ class FilterManager:
         return games
     
     @staticmethod
-    def filter_games(games: List[Dict], filters: Dict, downloader: Downloader) -> List[Dict]:
+    def filter_games(games: List[Dict], filters: Dict, downloader: Downloader, catalog: Optional[Catalog] = None) -> List[Dict]:
         """Filter games based on multiple criteria"""
+        if catalog is not None and catalog.games is games and catalog.index is not None:
+            return FilterManager.filter_games_indexed(catalog, filters, downloader)
+        
         filtered = games
         
-        # Search filter
+        # Search filter, every whitespace separated term must be found (as CatalogIndex.search)
         if filters.get('search'):
-            search_lower = filters['search'].lower()
-            filtered = [g for g in filtered if 
-                    search_lower in g['game_name'].lower() or 
-                    search_lower in g['game_description'].lower() or
-                    search_lower in g['game_author'].lower() or
-                    search_lower in g['game_category'].lower() or  # Added category
-                    any(search_lower in tag.lower() for tag in g['game_tags'])]  # Already includes tags
+            terms = filters['search'].lower().split()
+            def matches(g):
+                texts = [g['game_name'].lower(), g['game_description'].lower(), g['game_author'].lower(),
+                         g['game_category'].lower(), *(tag.lower() for tag in g['game_tags'])]
+                return all(any(term in text for text in texts) for term in terms)
+            filtered = [g for g in filtered if matches(g)]
         
         # Category filter
         if filters.get('category') and filters['category'] != 'all':
@@ -281,6 +313,45 @@ class FilterManager:
                     downloader.needs_update(g['game_name'], g['game_version'])[0]]
         
         return filtered
+    
+    @staticmethod
+    def filter_games_indexed(catalog: Catalog, filters: Dict, downloader: Downloader) -> List[Dict]:
+        """Same as filter_games, answered with bitset intersections on the catalog index"""
+        index = catalog.index
+        bits = index.all_bits
+        
+        # Search filter
+        if filters.get('search'):
+            bits &= index.search(filters['search'])
+        
+        # Category filter
+        if filters.get('category') and filters['category'] != 'all':
+            bits &= index.category_bits.get(filters['category'].lower(), 0)
+        
+        # Tags filter, any of the selected tags
+        if filters.get('tags') and len(filters['tags']) > 0:
+            tag_bits = 0
+            for tag in filters['tags']:
+                tag_bits |= index.tag_bits.get(tag.lower(), 0)
+            bits &= tag_bits
+        
+        # Author filter
+        if filters.get('author') and filters['author'] != 'all':
+            bits &= index.author_bits.get(filters['author'].lower(), 0)
+        
+        # Installation status filter, only the (few) installed games are looked up
+        installation_filter = filters.get('installation', 'all')
+        if installation_filter != 'all' and bits:
+            installed = downloader.get_all_installed_games()
+            if installation_filter == 'installed':
+                bits &= index.bits_for_names(installed)
+            elif installation_filter == 'not_installed':
+                bits &= ~index.bits_for_names(installed)
+            elif installation_filter == 'updates':
+                bits &= index.bits_for_names(
+                    name for name in installed if catalog.needs_update(name, downloader.get_installed_version(name)))
+        
+        return index.games_for_bits(bits)
 
 class TagManager:
     """Manages tag selection and display"""
@@ -348,175 +419,228 @@ class TagManager:
 
 class ResponsiveGameCard(tk.CTkFrame):
     mom: 'App'
-    def __init__(self, master, game_data, game_id, theme: dict, downloader: Downloader, refresh_callback, **kwargs):
+    def __init__(self, master, game_data, game_id, theme: dict, downloader: Downloader, refresh_callback, icon_loader: IconLoader = None, **kwargs):
         super().__init__(master, **kwargs)
-        self.game_data = game_data
+        self.game_data = None
         self.game_id = game_id
         self.theme = theme
         self.downloader = downloader
         self.refresh_callback = refresh_callback
-        self.install_status = downloader.get_installation_status(game_data['game_name'])
+        self.icon_loader = icon_loader
+        self.button_state = None
         
         self.configure(fg_color=theme['card_bg'], 
                       corner_radius=12, 
                       border_width=1, 
                       border_color=theme['card_border'])
         
+        # Keep the configured size, cards are recycled in a fixed-size grid
+        self.pack_propagate(False)
+        
         self.create_widgets()
+        self.bind_game(game_data, game_id)
     
     def create_widgets(self):
+        """Create the card widgets once, bind_game() fills them for a game"""
         # Main container
         main_frame = tk.CTkFrame(self, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=12, pady=12)
         
         # Status badge
-        self.create_status_badge(main_frame)
+        status_frame = tk.CTkFrame(main_frame, fg_color="transparent", height=24)
+        status_frame.pack(fill="x", pady=(0, 8))
+        self.status_badge = tk.CTkLabel(status_frame,
+                                       text="",
+                                       font=("RobotoMono", 9, "bold"),
+                                       corner_radius=10,
+                                       padx=8, pady=2)
+        self.status_badge.pack(side="left")
         
         # Title and version
         title_frame = tk.CTkFrame(main_frame, fg_color="transparent", height=30)
         title_frame.pack(fill="x", pady=(0, 8))
         
-        # Image/Logo
-        if self.game_data['game_icon'] is not None:
-            icon_file = self.downloader.get_game_icon(self.game_data, is_local=run_mode)
-            if icon_file:
-                icon = tk.CTkImage(Image.open(icon_file), Image.open(icon_file), size=(64,64))
-                if icon:
-                    icon_label = tk.CTkLabel(title_frame, image=icon, text="")
-                    icon_label.image = icon
-                    icon_label.pack(side="left", padx=(0, 5))
+        # Image/Logo, a placeholder is swapped for the icon once the loader has it
+        self.icon_label = tk.CTkLabel(title_frame,
+                                     text="",
+                                     width=64,
+                                     height=64,
+                                     fg_color=self.theme['tag_bg'],
+                                     corner_radius=8)
+        self.icon_label.pack(side="left", padx=(0, 5))
         
         # Title
-        title_label = tk.CTkLabel(title_frame, 
-                                 text=self.game_data["game_name"], 
-                                 font=("RobotoSerif", 16, "bold"),
-                                 text_color=self.theme['text_primary'],
-                                 anchor="w")
-        title_label.pack(side="left", fill="x", expand=False)
-        
-        
+        self.title_label = tk.CTkLabel(title_frame, 
+                                      text="", 
+                                      font=("RobotoSerif", 16, "bold"),
+                                      text_color=self.theme['text_primary'],
+                                      anchor="w")
+        self.title_label.pack(side="left", fill="x", expand=False)
         
         # Version with update indicator
-        version_text = f"v{self.game_data['game_version']}"
-        if self.install_status['installed']:
-            needs_update, current_version = self.downloader.needs_update(
-                self.game_data['game_name'], 
-                self.game_data['game_version']
-            )
-            if needs_update:
-                version_text = f"v{current_version} → v{self.game_data['game_version']}"
-        
-        version_label = tk.CTkLabel(title_frame, 
-                                   text=version_text,
-                                   font=("RobotoMono", 10),
-                                   text_color=self.theme['text_secondary'])
-        version_label.pack(side="right")
+        self.version_label = tk.CTkLabel(title_frame, 
+                                        text="",
+                                        font=("RobotoMono", 10),
+                                        text_color=self.theme['text_secondary'])
+        self.version_label.pack(side="right")
         
         # Tags (compact)
         tags_frame = tk.CTkFrame(main_frame, fg_color="transparent", height=24)
         tags_frame.pack(fill="x", pady=(0, 8))
         
-        for i, tag in enumerate(self.game_data["game_tags"][:2]):
-            tk.CTkLabel(tags_frame, 
-                       text=tag,
-                       font=("RobotoMono", 9),
-                       text_color=self.theme['text_accent'],
-                       fg_color=self.theme['tag_bg'],
-                       corner_radius=10,
-                       padx=6, pady=2).pack(side="left", padx=(0, 4))
+        self.tag_labels = [tk.CTkLabel(tags_frame, 
+                                      text="",
+                                      font=("RobotoMono", 9),
+                                      text_color=self.theme['text_accent'],
+                                      fg_color=self.theme['tag_bg'],
+                                      corner_radius=10,
+                                      padx=6, pady=2) for _ in range(2)]
         
         # Description
-        desc_text = tk.CTkTextbox(main_frame, 
-                                 height=50,
-                                 fg_color=self.theme['fg'], 
-                                 text_color=self.theme['text_secondary'], 
-                                 border_width=0,
-                                 font=("RobotoMono", 10), 
-                                 wrap="word")
-        desc_text.insert("1.0", self.game_data["game_description"][:100] + 
-                        ("..." if len(self.game_data["game_description"]) > 100 else ""))
-        desc_text.configure(state="disabled")
-        desc_text.pack(fill="x", pady=(0, 8))
+        self.desc_text = tk.CTkTextbox(main_frame, 
+                                      height=50,
+                                      fg_color=self.theme['fg'], 
+                                      text_color=self.theme['text_secondary'], 
+                                      border_width=0,
+                                      font=("RobotoMono", 10), 
+                                      wrap="word")
+        self.desc_text.pack(fill="x", pady=(0, 8))
         
         # Info bar
         info_frame = tk.CTkFrame(main_frame, fg_color="transparent")
         info_frame.pack(fill="x", pady=(0, 8))
         
         # Author
-        tk.CTkLabel(info_frame,
-                   text=self.game_data['game_author'][:15],
-                   font=("RobotoMono", 9),
-                   text_color=self.theme['text_secondary'],
-                   anchor="w").pack(side="left", fill="x", expand=True)
+        self.author_label = tk.CTkLabel(info_frame,
+                                       text="",
+                                       font=("RobotoMono", 9),
+                                       text_color=self.theme['text_secondary'],
+                                       anchor="w")
+        self.author_label.pack(side="left", fill="x", expand=True)
         
         # Size
-        tk.CTkLabel(info_frame,
-                   text=f"{self.game_data['total_size']:.1f}MB",
-                   font=("RobotoMono", 9),
-                   text_color=self.theme['text_secondary']).pack(side="right")
+        self.size_label = tk.CTkLabel(info_frame,
+                                     text="",
+                                     font=("RobotoMono", 9),
+                                     text_color=self.theme['text_secondary'])
+        self.size_label.pack(side="right")
         
         # Files
-        tk.CTkLabel(info_frame,
-                   text=f"{self.game_data['total_files']} files",
-                   font=("RobotoMono", 9),
-                   text_color=self.theme['text_secondary']).pack(side="right", padx=(0, 8))
+        self.files_label = tk.CTkLabel(info_frame,
+                                      text="",
+                                      font=("RobotoMono", 9),
+                                      text_color=self.theme['text_secondary'])
+        self.files_label.pack(side="right", padx=(0, 8))
+        
+        # Action buttons, rebuilt only when the installation state changes
+        self.button_frame = tk.CTkFrame(main_frame, fg_color="transparent")
+        self.button_frame.pack(fill="x")
+    
+    def bind_game(self, game_data, game_id):
+        """Show game_data on this card, reusing its widgets"""
+        icon_changed = self.game_data is None or IconLoader.key_for(self.game_data) != IconLoader.key_for(game_data)
+        self.game_data = game_data
+        self.game_id = game_id
+        self.install_status = self.downloader.get_installation_status(game_data['game_name'])
+        
+        # Installation status already carries the catalog's needs-update flag, no second lookup
+        needs_update = self.install_status.get('needs_update', False)
+        current_version = self.install_status.get('version')
+        
+        self.update_status_badge(needs_update)
+        
+        if icon_changed:
+            has_icon = self.game_data.get('game_icon') is not None
+            self.icon_label.configure(image=None, fg_color=self.theme['tag_bg'] if has_icon else "transparent")
+            self.icon_label.image = None
+            if has_icon:
+                self.load_icon()
+        
+        self.title_label.configure(text=self.game_data["game_name"])
+        
+        version_text = f"v{self.game_data['game_version']}"
+        if needs_update:
+            version_text = f"v{current_version} → v{self.game_data['game_version']}"
+        self.version_label.configure(text=version_text)
+        
+        tags = self.game_data["game_tags"][:2]
+        for label in self.tag_labels:
+            label.pack_forget()
+        for label, tag in zip(self.tag_labels, tags):
+            label.configure(text=tag)
+            label.pack(side="left", padx=(0, 4))
+        
+        self.desc_text.configure(state="normal")
+        self.desc_text.delete("1.0", "end")
+        self.desc_text.insert("1.0", self.game_data["game_description"][:100] + 
+                             ("..." if len(self.game_data["game_description"]) > 100 else ""))
+        self.desc_text.configure(state="disabled")
+        
+        self.author_label.configure(text=self.game_data['game_author'][:15])
+        self.size_label.configure(text=f"{self.game_data['total_size']:.1f}MB")
+        self.files_label.configure(text=f"{self.game_data['total_files']} files")
         
         # Action buttons based on installation status
-        self.create_action_buttons(main_frame)
+        if not self.install_status['installed']:
+            button_state = 'not_installed'
+        else:
+            button_state = 'update' if needs_update else 'installed'
+        if button_state != self.button_state:
+            self.button_state = button_state
+            for child in self.button_frame.winfo_children():
+                child.destroy()
+            self.create_action_buttons(self.button_frame)
     
-    def create_status_badge(self, parent):
-        """Create installation status badge"""
-        status_frame = tk.CTkFrame(parent, fg_color="transparent", height=24)
-        status_frame.pack(fill="x", pady=(0, 8))
+    def load_icon(self):
+        """Show the icon now if it is already decoded, otherwise ask the background loader"""
+        if self.icon_loader is None:
+            return
+        image = self.icon_loader.get_loaded(self.game_data)
+        if image is not None:
+            self.set_icon(image)
+            return
         
+        icon_key = IconLoader.key_for(self.game_data)
+        def on_loaded(image):
+            try:
+                self.after(0, self.set_icon, image, icon_key)
+            except (RuntimeError, TclError):
+                pass  # Card or window already gone
+        self.icon_loader.request(self.game_data, on_loaded)
+    
+    def set_icon(self, image, icon_key: tuple = None):
+        """Swap the placeholder for the loaded icon (main thread)"""
+        if image is None or not self.winfo_exists():
+            return
+        if icon_key is not None and icon_key != IconLoader.key_for(self.game_data):
+            return  # Card was rebound to another game meanwhile
+        icon = tk.CTkImage(image, image, size=(64,64))
+        self.icon_label.configure(image=icon, fg_color="transparent")
+        self.icon_label.image = icon
+    
+    def update_status_badge(self, needs_update: bool):
+        """Update installation status badge"""
         if self.install_status['installed']:
-            needs_update, current_version = self.downloader.needs_update(
-                self.game_data['game_name'], 
-                self.game_data['game_version']
-            )
-            
             if needs_update:
                 # Update available
-                badge = tk.CTkLabel(status_frame,
-                                   text="UPDATE AVAILABLE",
-                                   font=("RobotoMono", 9, "bold"),
-                                   text_color="#ffffff",
-                                   fg_color=self.theme['update_badge'],
-                                   corner_radius=10,
-                                   padx=8, pady=2)
-                badge.pack(side="left")
+                self.status_badge.configure(text="UPDATE AVAILABLE",
+                                           text_color="#ffffff",
+                                           fg_color=self.theme['update_badge'])
             else:
                 # Installed and up to date
-                badge = tk.CTkLabel(status_frame,
-                                   text="INSTALLED",
-                                   font=("RobotoMono", 9, "bold"),
-                                   text_color="#ffffff",
-                                   fg_color=self.theme['installed_badge'],
-                                   corner_radius=10,
-                                   padx=8, pady=2)
-                badge.pack(side="left")
+                self.status_badge.configure(text="INSTALLED",
+                                           text_color="#ffffff",
+                                           fg_color=self.theme['installed_badge'])
         else:
             # Not installed
-            badge = tk.CTkLabel(status_frame,
-                               text="NOT INSTALLED",
-                               font=("RobotoMono", 9, "bold"),
-                               text_color=self.theme['text_secondary'],
-                               fg_color=self.theme['tag_bg'],
-                               corner_radius=10,
-                               padx=8, pady=2)
-            badge.pack(side="left")
-    
-    def create_action_buttons(self, parent):
+            self.status_badge.configure(text="NOT INSTALLED",
+                                       text_color=self.theme['text_secondary'],
+                                       fg_color=self.theme['tag_bg'])
+    
+    def create_action_buttons(self, button_frame):
         """Create action buttons based on installation status"""
-        button_frame = tk.CTkFrame(parent, fg_color="transparent")
-        button_frame.pack(fill="x")
-        if self.install_status['installed']:
-            needs_update, current_version = self.downloader.needs_update(
-                self.game_data['game_name'], 
-                self.game_data['game_version']
-            )
-            
-            if needs_update:
+        if self.button_state in ('installed', 'update'):
+            if self.button_state == 'update':
                 # Update button
                 update_btn = tk.CTkButton(button_frame,
                                         text="UPDATE",
@@ -620,6 +744,43 @@ class ResponsiveGameCard(tk.CTkFrame):
         if success and self.refresh_callback:
             self.refresh_callback()
     
+    def verify_files(self, button=None):
+        """Check the installed files in the background and report the corrupted ones"""
+        game_name = self.game_data['game_name']
+        if button is not None:
+            button.configure(state="disabled", text="Verifying...")
+        
+        def show_result(result):
+            try:
+                if button is not None:
+                    button.configure(state="normal", text="Verify files")
+            except TclError:
+                pass  # Dialog closed meanwhile
+            if result is None:
+                messagebox.showinfo("Verify files", f"No file manifest available for {game_name}")
+            elif not result[1]:
+                messagebox.showinfo("Verify files", f"All {result[0]} files of {game_name} are intact")
+            else:
+                corrupted = result[1]
+                listing = "\n".join(corrupted[:20]) + (f"\n... and {len(corrupted) - 20} more" if len(corrupted) > 20 else "")
+                messagebox.showwarning("Verify files", f"{len(corrupted)} corrupted or missing files in {game_name}:\n\n{listing}\n\nUpdate or reinstall the game to repair it.")
+        
+        def verify():
+            result = self.downloader.verify_installed_game(game_name)
+            self.after(0, show_result, result)
+        
+        Thread(target=verify, daemon=True).start()
+    
+    def rollback_game(self, dialog=None):
+        print(f"Rolling back: {self.game_data['game_name']}")
+        if self.downloader.rollback_game(self.game_data['game_name']):
+            if dialog is not None:
+                dialog.destroy()
+            if self.refresh_callback:
+                self.refresh_callback()
+        else:
+            messagebox.showerror("Rollback failed", f"Could not roll back {self.game_data['game_name']}, is the game running?")
+    
     def play_game(self):
         # First things first
         if hasattr(self, 'mom'):
@@ -668,6 +829,27 @@ class ResponsiveGameCard(tk.CTkFrame):
                    font=("RobotoMono", 11, "bold"),
                    text_color=status_color).pack(anchor="w", pady=(0, 15))
         
+        # Re-hash the installed files against the catalog manifest
+        if self.install_status['installed']:
+            verify_btn = tk.CTkButton(scroll_frame,
+                                     text="Verify files",
+                                     fg_color=self.theme['button_secondary'],
+                                     hover_color=self.theme['button_secondary_hover'],
+                                     font=("RobotoMono", 11),
+                                     height=28)
+            verify_btn.configure(command=lambda: self.verify_files(verify_btn))
+            verify_btn.pack(anchor="w", pady=(0, 10))
+        
+        # The version replaced by the last update is kept for a one-step rollback
+        if self.install_status['installed'] and self.downloader.has_previous_version(self.game_data['game_name']):
+            tk.CTkButton(scroll_frame,
+                        text="Rollback to previous version",
+                        fg_color=self.theme['button_secondary'],
+                        hover_color=self.theme['button_secondary_hover'],
+                        font=("RobotoMono", 11),
+                        height=28,
+                        command=lambda: self.rollback_game(dialog)).pack(anchor="w", pady=(0, 15))
+        
         # Game info
         info_grid = [
             ("Name", self.game_data['game_name']),
@@ -749,14 +931,203 @@ class ResponsiveGameCard(tk.CTkFrame):
                                 hover_color=self.theme['button_secondary_hover'])
         close_btn.pack(pady=(0, 20))
 
+class VirtualGameGrid(tk.CTkFrame):
+    """
+    Scrollable grid of game cards that only instantiates cards for the visible rows (plus overscan).
+    Cards scrolled out of view are recycled by rebinding them to other games, so the widget count
+    depends on the window size and not on the catalog size.
+    """
+    CARD_WIDTH = 280
+    CARD_HEIGHT = 340
+    SPACING = 20
+    OVERSCAN_ROWS = 1
+    SCROLL_STEP = 60
+    
+    def __init__(self, master, create_card, bind_card, theme: dict, **kwargs):
+        super().__init__(master, **kwargs)
+        # create_card(master, game, index) -> card, bind_card(card, game, index)
+        self.create_card = create_card
+        self.bind_card = bind_card
+        
+        self.items: List[Dict] = []
+        self.cards: Dict[str, ResponsiveGameCard] = {}  # game name -> card currently showing it
+        self.free_cards: List[ResponsiveGameCard] = []
+        self.offset = 0.0
+        self.columns = 1
+        self._render_pending = False
+        self._rebind_pending = False
+        
+        self.viewport = tk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        
+        self.scrollbar = tk.CTkScrollbar(self,
+                                        command=self.yview,
+                                        button_color=theme['scrollbar'])
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.message_label = tk.CTkLabel(self.viewport,
+                                        text="",
+                                        font=("RobotoSerif", 16),
+                                        text_color=theme['text_secondary'],
+                                        justify="center")
+        
+        self.viewport.bind('<Configure>', lambda event: self.schedule_render())
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+    
+    def set_items(self, items: List[Dict]):
+        """Show a new list of games, visible cards are rebound instead of rebuilt"""
+        self.items = items
+        self.hide_message()
+        self.schedule_render(rebind=True)
+    
+    def update_item(self, game: Dict):
+        """Replace the data of one game, rebinding its card if it is visible"""
+        for i, item in enumerate(self.items):
+            if item['game_name'] == game['game_name']:
+                self.items[i] = game
+                card = self.cards.get(game['game_name'])
+                if card is not None:
+                    self.bind_card(card, game, i)
+                break
+    
+    def clear_pool(self):
+        """Destroy every card (e.g. after a theme change)"""
+        for card in list(self.cards.values()) + self.free_cards:
+            card.destroy()
+        self.cards.clear()
+        self.free_cards.clear()
+    
+    def show_message(self, text: str):
+        """Replace the grid with a centered message"""
+        self.items = []
+        self.render()
+        self.message_label.configure(text=text)
+        self.message_label.place(relx=0.5, rely=0.2, anchor="n")
+    
+    def hide_message(self):
+        self.message_label.place_forget()
+    
+    def _view_size(self) -> Tuple[float, float]:
+        """Viewport size in unscaled units (the ones place() and CARD_* use)"""
+        scaling = self._get_widget_scaling()
+        return (self.viewport.winfo_width() / scaling, self.viewport.winfo_height() / scaling)
+    
+    def _content_height(self) -> float:
+        rows = (len(self.items) + self.columns - 1) // self.columns
+        return rows * (self.CARD_HEIGHT + self.SPACING)
+    
+    def yview(self, *args):
+        """Scrollbar command: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        _, view_height = self._view_size()
+        if args[0] == 'moveto':
+            self.offset = float(args[1]) * self._content_height()
+        elif args[0] == 'scroll':
+            step = view_height * 0.9 if args[2] == 'pages' else self.SCROLL_STEP
+            self.offset += int(args[1]) * step
+        self.schedule_render()
+    
+    def _on_mousewheel(self, event):
+        # Only scroll when the pointer is over the grid
+        if not str(event.widget).startswith(str(self.viewport)):
+            return
+        if event.num == 4:
+            steps = -1
+        elif event.num == 5:
+            steps = 1
+        elif sys.platform == 'darwin':
+            steps = -event.delta
+        else:
+            steps = -event.delta / 120
+        self.offset += steps * self.SCROLL_STEP
+        self.schedule_render()
+    
+    def schedule_render(self, rebind: bool = False):
+        """Coalesce layout requests into one render per idle cycle"""
+        self._rebind_pending = self._rebind_pending or rebind
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._do_render)
+    
+    def _do_render(self):
+        self._render_pending = False
+        rebind = self._rebind_pending
+        self._rebind_pending = False
+        self.render(rebind)
+    
+    def render(self, rebind: bool = False):
+        """Place cards for the visible rows, recycling the ones that scrolled away"""
+        view_width, view_height = self._view_size()
+        cell_width = self.CARD_WIDTH + self.SPACING
+        cell_height = self.CARD_HEIGHT + self.SPACING
+        
+        # Use default if container not yet rendered
+        if view_width > 10:
+            self.columns = max(1, int((view_width - 40) / cell_width))
+        else:
+            self.columns = 3
+        
+        content_height = self._content_height()
+        self.offset = max(0.0, min(self.offset, content_height + self.SPACING - view_height))
+        
+        rows = (len(self.items) + self.columns - 1) // self.columns
+        first_row = max(0, int(self.offset // cell_height) - self.OVERSCAN_ROWS)
+        last_row = min(rows - 1, int((self.offset + view_height) // cell_height) + self.OVERSCAN_ROWS)
+        
+        wanted = {}
+        for i in range(first_row * self.columns, min(len(self.items), (last_row + 1) * self.columns)):
+            wanted[self.items[i]['game_name']] = i
+        
+        # Release cards that left the viewport
+        for name in [name for name in self.cards if name not in wanted]:
+            card = self.cards.pop(name)
+            card.place_forget()
+            self.free_cards.append(card)
+        
+        for name, i in wanted.items():
+            game = self.items[i]
+            card = self.cards.get(name)
+            if card is None:
+                if self.free_cards:
+                    card = self.free_cards.pop()
+                    self.bind_card(card, game, i)
+                else:
+                    card = self.create_card(self.viewport, game, i)
+                self.cards[name] = card
+            elif rebind:
+                self.bind_card(card, game, i)
+            
+            row, col = divmod(i, self.columns)
+            card.place(x=10 + col * cell_width, y=10 + row * cell_height - self.offset)
+        
+        if content_height > 0:
+            self.scrollbar.set(self.offset / content_height, min(1.0, (self.offset + view_height) / content_height))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
 class App(tk.CTk):
     game_open: bool = False
     game_open_name: str = ""
     game_open_thread: Thread = None
     game_process: subprocess.Popen = None
+    quiesced: bool = False  # The launcher steps back while a game runs
+    revalidate_deferred: bool = False
+    PROGRESS_TICK_MS = 50  # Download progress reaches the UI at most 20 times per second
+    QUIESCED_TICK_MS = 500  # ... and twice per second while a game runs
+    BANDWIDTH_OPTIONS = {"Unlimited": 0, "256 KB/s": 256, "512 KB/s": 512, "1 MB/s": 1024, "5 MB/s": 5120, "10 MB/s": 10240}
+    RESOURCE_SAMPLE_OPTIONS = {"Off": 0, "0.5 s": 500, "1 s": 1000, "2 s": 2000, "5 s": 5000}
+    GAME_PRIORITY_OPTIONS = {"Normal": 'normal', "Above Normal": 'above_normal', "High": 'high'}
+    GAME_IO_PRIORITY_OPTIONS = {"Normal": 'normal', "High": 'high'}
+    GAME_AFFINITY_OPTIONS = {"All Cores": 'all', "Leave One to Launcher": 'reserve'}
     def __init__(self):
         super().__init__()
         self.ensure_correct_directory()
+        self.load_settings()
+        
+        # One pooled HTTP client shared by catalog, icon and archive requests
+        self.http = HttpClient.from_settings(self.settings)
+        
         # Set appearance
         theme_preference = self.load_theme_preference()
         self.current_theme = theme_preference
@@ -768,20 +1139,50 @@ class App(tk.CTk):
         self.geometry('1300x850')
         self.minsize(1000, 650)
         
-        # Theme and data initialization
-        self.game_data: dict = {}
-        self.game_cards = []
+        # Theme and data initialization, self.game_data is the shared catalog's data.json
+        self.catalog = Catalog()
+        self.catalog.subscribe(self.on_catalog_changed)
+        
+        # Filter data
+        self.all_tags = set()
+        self.all_authors = set()
+        self.all_categories = set()
+        
+        # Remote catalog is painted from cache/ and revalidated in the background
+        self.catalog_cache = CatalogCache(Path.cache, Path.data_remote, self.http)
+        self.catalog_loaded = False
+        self.catalog_revalidating = False
         
         # Load game data FIRST
         self.get_game_data()
         
-        # Initialize downloader with game data
-        self.downloader = Downloader(self.game_data)
+        # Icons are cached on disk, capped by settings['icon_cache_max_mb']
+        self.icon_cache = IconCache(Path.cache, self.http, max_bytes=self.get_icon_cache_limit())
         
-        # Download queue system
-        self.download_queue = []
-        self.current_download = None
-        self.download_progress = {}
+        # Initialize downloader with game data
+        self.downloader = Downloader(self.catalog, http=self.http, icon_cache=self.icon_cache)
+        
+        # Icons are resolved and decoded off the Tk thread
+        self.icon_loader = IconLoader(lambda game: self.downloader.get_game_icon(game, is_local=run_mode))
+        
+        # The frozen launcher runs games with an external Python, found once in the background and cached
+        self.interpreters = InterpreterCache(os.path.join(Path.config, 'interpreter.json'), this_path)
+        if getattr(sys, 'frozen', False):
+            self.interpreters.warm()
+        
+        # Optional pre-warmed runtime games are forked from (Linux), and the click-to-window time of every launch
+        self.zygote: Optional[GameZygote] = None
+        self.launch_metrics: Dict[str, Dict] = {}
+        if self.settings.get('game_zygote', False):
+            self.start_zygote()
+        
+        # Download queue system: by priority, up to settings['download_workers'] run in parallel under a shared bandwidth limit
+        self.download_scheduler = DownloadScheduler()
+        self.active_downloads = {}
+        self.update_bandwidth_limit()
+        # Download threads publish here, a single tick (PROGRESS_TICK_MS) applies the latest values to the UI
+        self.progress_channel = ProgressChannel()
+        self.progress_tick_id = None
         
         # Filter state
         self.current_filters = {
@@ -793,13 +1194,6 @@ class App(tk.CTk):
             'installation': 'all'
         }
         
-        # Filter data
-        self.all_tags = set()
-        self.all_authors = set()
-        self.all_categories = set()
-        
-        self.load_settings()
-        
         # Create UI FIRST
         self.create_menu()
         self.create_progress_display()
@@ -807,9 +1201,36 @@ class App(tk.CTk):
         # Now load initial data and populate UI
         self.load_initial_data()
         
-        # Game Monitoring
-        self.monitor_thread = None
-        self.game_monitoring = False
+        # Check the remote catalog for changes without blocking the first paint
+        self.revalidate_game_data()
+        
+        # Game exits are reported once, as soon as they happen, on the Tk thread
+        self.supervisor = ProcessSupervisor(lambda game_name, return_code: self.after(0, self._game_ended, game_name, return_code))
+        # Output of the last session of each game (ring buffer + logs/<game>/<timestamp>.log)
+        self.game_logs: Dict[str, GameLog] = {}
+        # CPU/memory sampling of the running games, a summary of each session goes to config/game_sessions.json
+        self.resource_monitors: Dict[str, ResourceMonitor] = {}
+        # Frame times reported by the games (luna_telemetry), aggregated per session
+        try:
+            self.telemetry: Optional[TelemetryServer] = TelemetryServer()
+        except OSError as e:
+            print(f"Game telemetry disabled: {e}")
+            self.telemetry = None
+        self.telemetry_sessions: Dict[str, str] = {}
+        # Lowered while a game runs (settings['quiesce_while_playing'])
+        self.launcher_priority = LauncherPriority()
+    
+    @property
+    def game_data(self) -> dict:
+        return self.catalog.data
+    
+    @game_data.setter
+    def game_data(self, data: dict):
+        self.catalog.set_data(data)
+    
+    def on_catalog_changed(self, catalog: Catalog):
+        """A new catalog was set, refresh the filter choices it provides"""
+        self.extract_filter_data()
     
     def get_game_data(self):
         """Load game data from local or remote"""
@@ -836,6 +1257,7 @@ class App(tk.CTk):
                         except Exception as e:
                             print(f"Error loading {data_path}: {e}")
                 
+                self.catalog_loaded = True
                 if not data_loaded:
                     print("Warning: Could not find data.json in local mode")
                     self.game_data = {
@@ -843,30 +1265,103 @@ class App(tk.CTk):
                         "games": []
                     }
             else:
-                try:
-                    print(f"Loading remote data from: {Path.data_remote}")
-                    response = requests.get(Path.data_remote, timeout=10)
-                    response.raise_for_status()
-                    self.game_data = response.json()
-                    print(f"Successfully loaded remote data")
-                except Exception as e:
-                    print(f"Error loading remote data: {e}")
-                    # Fallback to local data if remote fails
-                    local_path = os.path.join(original_dir, 'games', 'data.json')
-                    if os.path.exists(local_path):
-                        with open(local_path, 'r', encoding='utf-8') as f:
-                            self.game_data = json.load(f)
-                        print(f"Fell back to local data: {local_path}")
-                    else:
-                        self.game_data = {
-                            "info": {"version": "0.0.0", "author": "Unknown", "total_games": 0},
-                            "games": []
-                        }
+                # Paint from the last good catalog, revalidate_game_data() fetches changes
+                cached_data = self.catalog_cache.load()
+                if cached_data is not None:
+                    self.game_data = cached_data
+                    self.catalog_loaded = True
+                    print(f"Loaded cached data from: {self.catalog_cache.data_path}")
+                elif not self.game_data.get('games'):
+                    self.game_data = {
+                        "info": {"version": "0.0.0", "author": "Unknown", "total_games": 0},
+                        "games": []
+                    }
         finally:
             # Ensure we're back in the original directory
             if this_path != original_dir:
                 os.chdir(original_dir)
         
+    def revalidate_game_data(self):
+        """Check the remote catalog in the background (conditional GET)"""
+        if run_mode != '--remote' or self.catalog_revalidating:
+            return
+        if self.quiesced:
+            # Checked once the game exits
+            self.revalidate_deferred = True
+            return
+        self.catalog_revalidating = True
+        Thread(target=self._revalidate_game_data_thread, daemon=True).start()
+    
+    def _revalidate_game_data_thread(self):
+        """Thread function to revalidate the remote catalog"""
+        new_data = None
+        try:
+            print(f"Revalidating remote data: {Path.data_remote}")
+            changed, data = self.catalog_cache.revalidate()
+            if changed:
+                new_data = data
+                print("Remote data changed")
+            else:
+                print("Remote data not modified")
+        except Exception as e:
+            print(f"Error loading remote data: {e}")
+            if not self.catalog_loaded:
+                # Fallback to local data if remote fails and nothing is cached
+                local_path = os.path.join(this_path, 'games', 'data.json')
+                if os.path.exists(local_path):
+                    try:
+                        with open(local_path, 'r', encoding='utf-8') as f:
+                            new_data = json.load(f)
+                        print(f"Fell back to local data: {local_path}")
+                    except Exception as e:
+                        print(f"Error loading {local_path}: {e}")
+        
+        # The search index is built here too, the Tk thread only swaps it in
+        index = CatalogIndex(new_data.get('games', [])) if new_data is not None else None
+        self.after(0, self._on_game_data_revalidated, new_data, index)
+    
+    def _on_game_data_revalidated(self, new_data: Optional[dict], index: Optional[CatalogIndex] = None):
+        """Apply a revalidated catalog in the main thread, rebuilding only what changed"""
+        self.catalog_revalidating = False
+        first_load = not self.catalog_loaded
+        self.catalog_loaded = True
+        
+        if new_data is None:
+            if first_load:
+                # Nothing cached and nothing fetched, show the empty state
+                self.apply_filters()
+            return
+        
+        old_games = self.catalog.by_name
+        old_filter_data = (set(self.all_tags), set(self.all_authors), set(self.all_categories))
+        
+        # Subscribers (filter data) are refreshed by the catalog
+        self.catalog.set_data(new_data, index)
+        new_games = self.catalog.by_name
+        
+        filter_data_changed = old_filter_data != (self.all_tags, self.all_authors, self.all_categories)
+        if first_load or filter_data_changed or old_games.keys() != new_games.keys() or self.filters_active():
+            # Games were added/removed or filtering may change, full refresh
+            if filter_data_changed or first_load:
+                self.update_filter_widgets()
+            self.apply_filters()
+            return
+        
+        # Same games: a change of the sorted field reorders the grid, anything else only rebinds the changed cards
+        sort_field = FilterManager.SORT_FIELDS.get(self.current_filters['sort_by'].removesuffix('_desc'))
+        changed = [game for name, game in new_games.items() if old_games.get(name) != game]
+        if sort_field and any(old_games[game['game_name']].get(sort_field) != game.get(sort_field) for game in changed):
+            self.apply_filters()
+            return
+        for game in changed:
+            self.games_grid.update_item(game)
+    
+    def filters_active(self) -> bool:
+        """True when the current filters could hide some games"""
+        return bool(self.current_filters['search'] or self.current_filters['tags'] or
+                    self.current_filters['category'] != 'all' or self.current_filters['author'] != 'all' or
+                    self.current_filters['installation'] != 'all')
+    
     def ensure_correct_directory(self):
         """Ensure we're in the correct launcher directory"""
         expected_dir = os.path.dirname(os.path.abspath(os.path.abspath(sys.argv[0])))
@@ -905,28 +1400,17 @@ class App(tk.CTk):
     def apply_filters(self):
         """Apply filters and refresh display"""
         # Check if UI is initialized
-        if not hasattr(self, 'games_container'):
+        if not hasattr(self, 'games_grid'):
             print("UI not initialized yet, skipping apply_filters")
             return
         
-        # Remove loading label if exists
-        if hasattr(self, 'loading_label'):
-            self.loading_label.destroy()
-            del self.loading_label
-        
-        # Clear current cards
-        for card in self.game_cards:
-            card.destroy()
-        self.game_cards.clear()
+        # On a cold start keep the loading label until the catalog arrives
+        if not self.catalog_loaded:
+            return
         
         # Check if we have games data
         if "games" not in self.game_data or len(self.game_data['games']) == 0:
-            empty_label = tk.CTkLabel(self.games_container,
-                                    text="No games found\nTry refreshing or check your connection",
-                                    font=("RobotoSerif", 16),
-                                    text_color=self.theme_config['text_secondary'],
-                                    justify="center")
-            empty_label.pack(pady=100, fill="both", expand=True)
+            self.games_grid.show_message("No games found\nTry refreshing or check your connection")
             
             if hasattr(self, 'games_header'):
                 self.games_header.configure(text="No Games Available")
@@ -940,59 +1424,23 @@ class App(tk.CTk):
         filtered_games = FilterManager.filter_games(
             self.game_data.get('games', []),
             self.current_filters,
-            self.downloader
+            self.downloader,
+            self.catalog
         )
         
         # Sort games
         sorted_games = FilterManager.sort_games(
             filtered_games, 
             self.current_filters['sort_by'],
-            self.downloader
+            self.downloader,
+            self.catalog
         )
         
         # Update count
         self.update_game_count(len(sorted_games), len(self.game_data.get('games', [])))
         
-        # Create container frame for cards using grid
-        if hasattr(self, 'cards_container'):
-            self.cards_container.destroy()
-        
-        self.cards_container = tk.CTkFrame(self.games_container, fg_color="transparent")
-        self.cards_container.pack(fill="both", expand=True)
-        
-        # Calculate number of columns based on container width
-        container_width = self.games_container.winfo_width()
-        card_width = 280
-        spacing = 20
-        
-        # Use default if container not yet rendered
-        if container_width > 10:
-            num_columns = max(1, int((container_width - 40) / (card_width + spacing)))
-        else:
-            num_columns = 3
-        
-        # Create cards using grid
-        for i, game in enumerate(sorted_games):
-            row = i // num_columns
-            col = i % num_columns
-            
-            card = ResponsiveGameCard(
-                self.cards_container, 
-                game, 
-                i, 
-                self.theme_config,
-                self.downloader,
-                self.refresh_games,
-                width=card_width, 
-                height=340
-            )
-            card.mom = self
-            self.game_cards.append(card)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky="nw")
-        
-        # Configure grid columns to be equal width
-        for col in range(num_columns):
-            self.cards_container.grid_columnconfigure(col, weight=1, uniform="card_col")
+        # Only the visible cards are (re)bound, the rest stay virtual
+        self.games_grid.set_items(sorted_games)
         
         # Update stats
         installed_count = len(self.downloader.get_all_installed_games())
@@ -1000,27 +1448,22 @@ class App(tk.CTk):
         
         if hasattr(self, 'stats_label'):
             self.stats_label.configure(text=f"Installed: {installed_count}/{total_games}")
-        
-        # Bind resize event
-        self.games_container.bind('<Configure>', self.on_container_resize)
     
-    def on_container_resize(self, event=None):
-        """Handle container resize to adjust grid columns"""
-        if hasattr(self, 'cards_container') and hasattr(self, 'game_cards') and self.game_cards:
-            container_width = self.games_container.winfo_width()
-            card_width = 280
-            spacing = 20
-            num_columns = max(1, int((container_width - 40) / (card_width + spacing)))
-            
-            # Re-grid existing cards
-            for i, card in enumerate(self.game_cards):
-                row = i // num_columns
-                col = i % num_columns
-                card.grid(row=row, column=col, padx=10, pady=10, sticky="nw")
-            
-            # Reconfigure grid columns
-            for col in range(num_columns):
-                self.cards_container.grid_columnconfigure(col, weight=1, uniform="card_col")
+    def create_game_card(self, master, game: dict, index: int) -> ResponsiveGameCard:
+        """Card factory for the virtual grid"""
+        card = ResponsiveGameCard(
+            master, 
+            game, 
+            index, 
+            self.theme_config,
+            self.downloader,
+            self.refresh_games,
+            icon_loader=self.icon_loader,
+            width=VirtualGameGrid.CARD_WIDTH, 
+            height=VirtualGameGrid.CARD_HEIGHT
+        )
+        card.mom = self
+        return card
     
     def update_game_count(self, filtered_count: int, total_count: int):
         """Update game count display"""
@@ -1081,10 +1524,14 @@ class App(tk.CTk):
         tk.set_appearance_mode("light" if theme_name == "light" else "dark")
         self.configure(fg_color=self.theme_config['bg'])
         
+        # Cards keep their theme colors, rebuild them
+        self.games_grid.clear_pool()
+        
         # Refresh display
         self.apply_filters()
 
     def load_settings(self):
+        os.makedirs(Path.config, exist_ok=True)
         config_path = os.path.join(Path.config, 'settings.json')
         self.settings = {}
         if os.path.exists(config_path):
@@ -1093,6 +1540,7 @@ class App(tk.CTk):
         else:
             self.settings['theme'] = 'dark'
             self.settings['games_fullscreen'] = True
+            self.settings['download_workers'] = 3
             with open(config_path, 'w') as f:
                 json.dump(self.settings, f)
                 f.close()
@@ -1154,12 +1602,12 @@ class App(tk.CTk):
     def refresh_games(self):
         """Refresh all game data"""
         self.get_game_data()
-        self.downloader.games_data = self.game_data
-        self.downloader.get_games()
         
-        self.extract_filter_data()
         self.update_filter_widgets()
         self.apply_filters()
+        
+        # Remote changes arrive later through _on_game_data_revalidated
+        self.revalidate_game_data()
     
     def update_filter_widgets(self):
         """Update filter widgets with current data"""
@@ -1214,9 +1662,8 @@ class App(tk.CTk):
     
     def create_progress_display(self):
         """Create progress bar and queue display"""
-        # Progress bar at the bottom
+        # Progress panel at the bottom, one row per active download
         self.progress_frame = tk.CTkFrame(self.main_container, 
-                                         height=60, 
                                          fg_color=self.theme_config['card_bg'],
                                          border_width=1,
                                          border_color=self.theme_config['card_border'])
@@ -1224,19 +1671,10 @@ class App(tk.CTk):
         # Initially hidden
         self.progress_frame.grid_remove()
         
-        # Progress content
-        self.progress_label = tk.CTkLabel(self.progress_frame,
-                                         text="",
-                                         font=("RobotoMono", 11),
-                                         text_color=self.theme_config['text_primary'])
-        self.progress_label.pack(pady=(10, 5), padx=20, anchor="w")
-        
-        self.progress_bar = tk.CTkProgressBar(self.progress_frame,
-                                             height=6,
-                                             fg_color=self.theme_config['input_bg'],
-                                             progress_color=self.theme_config['button_primary'])
-        self.progress_bar.pack(fill="x", padx=20, pady=(0, 10))
-        self.progress_bar.set(0)
+        # Container for the per-download rows
+        self.progress_rows_frame = tk.CTkFrame(self.progress_frame, fg_color="transparent")
+        self.progress_rows_frame.pack(fill="x", pady=(5, 0))
+        self.progress_rows = {}
         
         # Queue label
         self.queue_label = tk.CTkLabel(self.progress_frame,
@@ -1245,95 +1683,255 @@ class App(tk.CTk):
                                       text_color=self.theme_config['text_secondary'])
         self.queue_label.pack(pady=(0, 10), padx=20, anchor="w")
     
+    def create_progress_row(self, game_name: str, text: str):
+        """Create the progress row (label, pause/cancel buttons + bar) for one active download"""
+        row = tk.CTkFrame(self.progress_rows_frame, fg_color="transparent")
+        row.pack(fill="x")
+        
+        header = tk.CTkFrame(row, fg_color="transparent")
+        header.pack(fill="x", padx=20, pady=(5, 2))
+        
+        label = tk.CTkLabel(header,
+                           text=text,
+                           font=("RobotoMono", 11),
+                           text_color=self.theme_config['text_primary'])
+        label.pack(side="left")
+        
+        cancel_button = tk.CTkButton(header,
+                                    text="Cancel",
+                                    width=70,
+                                    height=24,
+                                    fg_color=self.theme_config['danger'],
+                                    hover_color="#ff5252",
+                                    command=lambda: self.cancel_download(game_name))
+        cancel_button.pack(side="right")
+        
+        pause_button = tk.CTkButton(header,
+                                   text="Pause",
+                                   width=70,
+                                   height=24,
+                                   fg_color=self.theme_config['button_secondary'],
+                                   hover_color=self.theme_config['button_secondary_hover'],
+                                   command=lambda: self.toggle_pause_download(game_name))
+        pause_button.pack(side="right", padx=(0, 5))
+        
+        bar = tk.CTkProgressBar(row,
+                               height=6,
+                               fg_color=self.theme_config['input_bg'],
+                               progress_color=self.theme_config['button_primary'])
+        bar.pack(fill="x", padx=20, pady=(0, 5))
+        bar.set(0)
+        
+        self.progress_rows[game_name] = {'frame': row, 'label': label, 'bar': bar, 'pause_button': pause_button}
+    
+    def remove_progress_row(self, game_name: str):
+        """Destroy the progress row of a finished download"""
+        row = self.progress_rows.pop(game_name, None)
+        if row:
+            row['frame'].destroy()
+    
+    def get_icon_cache_limit(self) -> int:
+        """Icon cache size in bytes (settings['icon_cache_max_mb'])"""
+        try:
+            return max(1, int(self.settings.get('icon_cache_max_mb', 32))) * 1024 * 1024
+        except (TypeError, ValueError):
+            return 32 * 1024 * 1024
+    
+    def get_download_workers(self) -> int:
+        """Number of downloads allowed to run at the same time"""
+        try:
+            return max(1, int(self.settings.get('download_workers', 3)))
+        except (TypeError, ValueError):
+            return 3
+    
+    def get_bandwidth_limit(self) -> int:
+        """Download limit in bytes per second (0 = unlimited), the lower 'while playing' limit applies while a game runs"""
+        game_running = self.game_process is not None and self.game_process.poll() is None
+        key, default = ('game_running_limit_kbps', 512) if game_running else ('download_limit_kbps', 0)
+        try:
+            return max(0, int(self.settings.get(key, default))) * 1024
+        except (TypeError, ValueError):
+            return default * 1024
+    
+    def update_bandwidth_limit(self):
+        """Apply the bandwidth limit to every download, called when a game starts/ends and on settings changes"""
+        self.download_scheduler.bucket.set_rate(self.get_bandwidth_limit())
+    
     def add_to_download_queue(self, game_data, action='install'):
-        """Add a game to the download queue"""
-        self.download_queue.append({
+        """Add a game to the download queue, installs run before background updates"""
+        game_name = game_data['game_name']
+        if game_name in self.active_downloads:
+            print(f"{game_name} is already downloading")
+            return
+        
+        if game_name in self.download_scheduler.paused:
+            self.resume_download(game_name)
+            return
+        
+        if self.download_scheduler.find(game_name) is not None:
+            # Asked for again: run it next
+            self.download_scheduler.set_priority(game_name, PRIORITY_HIGH)
+            print(f"{game_name} moved to the front of the download queue")
+            self.update_queue_display()
+            return
+        
+        self.download_scheduler.push({
             'game': game_data,
             'action': action,
-            'status': 'pending',
             'progress': 0
-        })
-        print(f"Added {game_data['game_name']} to download queue")
+        }, PRIORITY_NORMAL if action == 'install' else PRIORITY_LOW)
+        print(f"Added {game_name} to download queue")
         
-        # Start processing if not already downloading
-        if not self.current_download:
-            self.process_download_queue()
+        # Start processing if a worker is free
+        self.process_download_queue()
         
         self.update_queue_display()
     
     def process_download_queue(self):
-        """Process the next item in the download queue"""
-        if not self.download_queue:
-            self.current_download = None
+        """Start queued items until every download worker is busy"""
+        # A single download at a time while a game runs
+        workers = 1 if self.quiesced else self.get_download_workers()
+        while len(self.download_scheduler) and len(self.active_downloads) < workers:
+            # Get the next item
+            item = self.download_scheduler.pop()
+            item['status'] = 'downloading'
+            game_name = item['game']['game_name']
+            self.active_downloads[game_name] = item
+            
+            # Show progress frame with proper positioning
+            self.show_progress()
+            
+            # Update display
+            action_text = "Installing" if item['action'] == 'install' else "Updating"
+            self.create_progress_row(game_name, f"{action_text}: {game_name}")
+            
+            # Start the actual download
+            self.start_download(item)
+            self.schedule_progress_tick()
+        
+        if not self.active_downloads and not len(self.download_scheduler) and not self.download_scheduler.paused:
             self.hide_progress()
-            return
         
-        # Get the next item
-        item = self.download_queue[0]
-        self.current_download = item
-        
-        # Show progress frame with proper positioning
-        self.show_progress()
-        
-        # Update display
-        action_text = "Installing" if item['action'] == 'install' else "Updating"
-        self.progress_label.configure(text=f"{action_text}: {item['game']['game_name']}")
         self.update_queue_display()
+    
+    def toggle_pause_download(self, game_name: str):
+        if game_name in self.download_scheduler.paused:
+            self.resume_download(game_name)
+        else:
+            self.pause_download(game_name)
+    
+    def pause_download(self, game_name: str):
+        """Stop a running download after its current chunk, it keeps its partial file and its row"""
+        item = self.active_downloads.get(game_name)
+        if item:
+            item['control'].pause()
+            row = self.progress_rows.get(game_name)
+            if row:
+                row['pause_button'].configure(state="disabled")
+    
+    def resume_download(self, game_name: str):
+        """Queue a paused download again, it continues from its partial file"""
+        if not self.download_scheduler.resume(game_name):
+            return
+        self.remove_progress_row(game_name)
+        print(f"Resuming {game_name}")
+        self.process_download_queue()
+    
+    def cancel_download(self, game_name: str):
+        """Cancel a running or paused download and delete its partial file"""
+        item = self.active_downloads.get(game_name)
+        if item:
+            # The download thread stops after its current chunk and cleans up
+            item['control'].cancel()
+            return
         
-        # Start the actual download
-        self.start_download(item)
+        item = self.download_scheduler.remove(game_name)
+        if item:
+            self.downloader.discard_download(game_name, item['game']['game_version'])
+            self.remove_progress_row(game_name)
+            print(f"Cancelled {game_name}")
+        self.process_download_queue()
     
     def start_download(self, item):
         """Start downloading a game from the queue"""
-        def progress_callback(percent, status):
-            self.on_download_progress(item['game']['game_name'], percent, status)
+        def progress_callback(percent, status, downloaded=None, total=None):
+            self.on_download_progress(item['game']['game_name'], percent, status, downloaded, total)
         
-        # Start the download in a separate thread
-        thread = Thread(
-            target=lambda: self.downloader.download_game(
+        def download():
+            outcome = self.downloader.download_game(
                 item['game'], 
                 progress_callback=progress_callback,
-                is_local = run_mode
-            ),
-            daemon=True
-        )
+                is_local = run_mode,
+                control=item['control']
+            )
+            self.after(0, self.on_download_finished, item['game']['game_name'], outcome)
+        
+        # Start the download in a separate thread
+        thread = Thread(target=download, daemon=True)
         thread.start()
     
-    def on_download_progress(self, game_name, percent, status):
-        """Handle download progress updates"""
-        # This must run in the main thread
-        self.after(0, self._update_progress_ui, game_name, percent, status)
+    def on_download_progress(self, game_name, percent, status, downloaded=None, total=None):
+        """Handle download progress updates (download thread), only the latest value reaches the UI"""
+        self.progress_channel.publish(game_name, percent, status, downloaded, total)
+    
+    def schedule_progress_tick(self):
+        """Start the periodic progress tick if it is not running"""
+        if self.progress_tick_id is None:
+            self.progress_tick_id = self.after(self.QUIESCED_TICK_MS if self.quiesced else self.PROGRESS_TICK_MS, self._progress_tick)
     
-    def _update_progress_ui(self, game_name, percent, status):
+    def _progress_tick(self):
+        """Apply the coalesced progress of every download, runs while downloads are active"""
+        self.progress_tick_id = None
+        for state in self.progress_channel.drain():
+            self._update_progress_ui(state.key, state.percent, state.status, format_rate(state))
+        if self.active_downloads or self.progress_channel.has_pending():
+            self.schedule_progress_tick()
+    
+    def _update_progress_ui(self, game_name, percent, status, rate_text=''):
         """Update progress UI in the main thread"""
-        if self.current_download and self.current_download['game']['game_name'] == game_name:
-            self.progress_bar.set(percent / 100)
-            self.current_download['progress'] = percent
+        item = self.active_downloads.get(game_name)
+        if not item:
+            return
+        
+        item['progress'] = percent
+        row = self.progress_rows.get(game_name)
+        if row:
+            row['bar'].set(percent / 100)
             
             # Update status text
-            self.progress_label.configure(
-                text=f"{status} - {game_name} ({percent:.1f}%)"
-            )
-            
-            if percent >= 100:
-                # Download complete
-                if self.download_queue:
-                    self.download_queue.pop(0)
-                
-                # Force reload installed games registry
-                self.downloader.installed_games = self.downloader.load_installed_games()
-                
-                # Process next in queue
-                self.progress_bar.set(0)
-                self.current_download = None
-                self.process_download_queue()
-                
-                # Refresh UI
-                self.get_game_data()
-                self.downloader.games_data = self.game_data
-                self.extract_filter_data()
-                self.update_filter_widgets()
-                self.apply_filters()
+            text = f"{status} - {game_name} ({percent:.1f}%)"
+            if rate_text:
+                text += f" - {rate_text}"
+            row['label'].configure(text=text)
+    
+    def on_download_finished(self, game_name, outcome):
+        """A download thread ended (main thread), outcome is one of the scheduler's DOWNLOAD_* values"""
+        item = self.active_downloads.pop(game_name, None)
+        if not item:
+            return
+        
+        # Free the worker slot, a progress update still pending is stale
+        self.progress_channel.discard(game_name)
+        if outcome == DOWNLOAD_PAUSED:
+            # The row stays with a resume button
+            self.download_scheduler.hold(item)
+            row = self.progress_rows.get(game_name)
+            if row:
+                row['label'].configure(text=f"Paused - {game_name} ({item['progress']:.1f}%)")
+                row['pause_button'].configure(text="Resume", state="normal")
+        else:
+            self.remove_progress_row(game_name)
+        
+        # Force reload installed games registry
+        self.downloader.reload_installed_games()
+        
+        # Process next in queue
+        self.process_download_queue()
+        
+        # Refresh UI
+        self.get_game_data()
+        self.update_filter_widgets()
+        self.apply_filters()
     
     def show_progress(self):
         """Show progress display with correct positioning"""
@@ -1343,7 +1941,6 @@ class App(tk.CTk):
         else:
             # If no game is open, show at row 1
             self.progress_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 10))
-        self.progress_frame.grid_propagate(False)
     
     def hide_progress(self):
         """Hide progress display"""
@@ -1351,24 +1948,32 @@ class App(tk.CTk):
     
     def update_queue_display(self):
         """Update queue status display"""
-        if self.download_queue:
-            total = len(self.download_queue)
-            current = 1 if self.current_download else 0
-            remaining = total - current
-            
-            queue_text = f"Queue: {current}/{total}"
-            if remaining > 0:
-                queue_text += f" ({remaining} waiting)"
+        active = len(self.active_downloads)
+        waiting = len(self.download_scheduler)
+        paused = len(self.download_scheduler.paused)
+        if active or waiting or paused:
+            queue_text = f"Downloading: {active}/{self.get_download_workers()} workers"
+            if waiting > 0:
+                queue_text += f" ({waiting} waiting)"
+            if paused > 0:
+                queue_text += f" ({paused} paused)"
+            limit = self.download_scheduler.bucket.rate
+            if limit:
+                queue_text += f" - limited to {limit // 1024}KB/s"
             
             self.queue_label.configure(text=queue_text)
         else:
             self.queue_label.configure(text="")
     
     def clear_download_queue(self):
-        """Clear the download queue"""
-        self.download_queue.clear()
-        self.current_download = None
-        self.hide_progress()
+        """Clear the pending and paused downloads, running ones are left to finish"""
+        for item in self.download_scheduler.clear():
+            if item['status'] == 'paused':
+                self.downloader.discard_download(item['game']['game_name'], item['game']['game_version'])
+                self.remove_progress_row(item['game']['game_name'])
+        if not self.active_downloads:
+            self.hide_progress()
+        self.update_queue_display()
     
     def create_menu(self):
         """Create the main interface"""
@@ -1578,28 +2183,24 @@ class App(tk.CTk):
                                         command=self.show_settings)
         self.settings_btn.pack(side="right", padx=(0, 30))
         
-        # Games container
-        self.games_container = tk.CTkScrollableFrame(self.content_frame,
-                                                    fg_color=self.theme_config['bg'],
-                                                    scrollbar_button_color=self.theme_config['scrollbar'])
-        self.games_container.pack(fill="both", expand=True)
+        # Games grid, only the visible cards exist
+        self.games_grid = VirtualGameGrid(self.content_frame,
+                                         self.create_game_card,
+                                         lambda card, game, index: card.bind_game(game, index),
+                                         self.theme_config,
+                                         fg_color=self.theme_config['bg'])
+        self.games_grid.pack(fill="both", expand=True)
         
         # Show loading message
-        self.loading_label = tk.CTkLabel(self.games_container,
-                                        text="Loading games...",
-                                        font=("RobotoSerif", 16),
-                                        text_color=self.theme_config['text_secondary'])
-        self.loading_label.pack(pady=100)
+        self.games_grid.show_message("Loading games...")
 
     def start_game(self, game_name: str):
         """Start a game in a separate thread"""
+        # Click-to-window is measured from here
+        launch_time = time.time()
         try:
             # Get game info
-            game_info = None
-            for game in self.game_data.get('games', []):
-                if game['game_name'] == game_name:
-                    game_info = game
-                    break
+            game_info = self.catalog.get(game_name)
             
             if not game_info:
                 messagebox.showerror("Error", f"Game '{game_name}' not found")
@@ -1652,14 +2253,11 @@ class App(tk.CTk):
             # Create and start thread
             self.game_open_thread = Thread(
                 target=self._run_game_thread,
-                args=(game_name, game_path, game_folder),
+                args=(game_name, game_path, game_folder, launch_time),
                 daemon=True
             )
             self.game_open_thread.start()
             
-            # Start monitoring thread
-            self.start_game_monitoring()
-            
             # Show game status
             self.show_game_status()
             
@@ -1673,9 +2271,10 @@ class App(tk.CTk):
             self.game_open = False
             self.game_open_name = ""
 
-    def _run_game_thread(self, game_name: str, game_path: str, game_folder: str):
-        """Thread function to run the game"""
+    def _run_game_thread(self, game_name: str, game_path: str, game_folder: str, launch_time: float = 0.0):
+        """Thread function to start the game, its exit is reported by the supervisor"""
         original_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+        process = None
         
         try:
             print(f"Launching game: {game_name}")
@@ -1685,137 +2284,86 @@ class App(tk.CTk):
             # Change to game directory
             os.chdir(game_folder)
             
-            # Check if we're running as an EXE or as a Python script
-            is_exe = getattr(sys, 'frozen', False)
-            
-            # Get the launcher directory
-            launcher_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
-            
-            # Strategy: We need to find a Python interpreter that can run the game
-            # 1. First, try to use a bundled Python interpreter (if we distributed one with the launcher)
-            # 2. Then, try to use the system Python interpreter
-            # 3. Finally, show an error if neither is available
-            
-            python_exe = None
-            
-            if is_exe:
-                print("Running as an EXE - need to find Python interpreter")
-                
-                # Method 1: Look for a bundled Python interpreter
-                # This would be in a 'python' folder next to the launcher EXE
-                bundled_python_paths = [
-                    os.path.join(launcher_dir, 'python', 'pythonw.exe'),
-                    os.path.join(launcher_dir, 'python', 'python.exe'),
-                    os.path.join(os.path.dirname(sys.executable), 'python', 'pythonw.exe'),
-                    os.path.join(os.path.dirname(sys.executable), 'python', 'python.exe'),
-                ]
+            # Frozen: bundled or system Python, discovered at startup and cached in config/interpreter.json
+            # Script: the interpreter running the launcher
+            command = self.game_interpreter_command()
+            if command is None:
+                # No Python interpreter found
+                print("ERROR: No Python interpreter found!")
+                print("To run games, you need:")
+                print("1. Python installed and in PATH, OR")
+                print("2. A bundled Python distribution in a 'python' folder next to the launcher")
                 
-                for python_path in bundled_python_paths:
-                    if os.path.exists(python_path):
-                        python_exe = python_path
-                        print(f"Found bundled Python at: {python_exe}")
-                        break
-                
-                # Method 2: Try to find system Python
-                if not python_exe:
-                    print("No bundled Python found, trying system Python...")
-                    
-                    # On Windows, try pythonw.exe first (no console window)
-                    if sys.platform == 'win32':
-                        system_paths = ['pythonw.exe', 'python.exe']
-                    else:
-                        system_paths = ['python3', 'python']
-                    
-                    for python_cmd in system_paths:
-                        try:
-                            # Check if this Python command exists by running a simple command
-                            result = subprocess.run(
-                                [python_cmd, '--version'],
-                                capture_output=True,
-                                timeout=2,
-                                shell=True
-                            )
-                            if result.returncode == 0 or result.returncode == 1:
-                                python_exe = python_cmd
-                                print(f"Found system Python: {python_exe}")
-                                break
-                        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                            continue
-                    
-                    # Method 3: Try using 'py' launcher on Windows
-                    if not python_exe and sys.platform == 'win32':
-                        try:
-                            result = subprocess.run(
-                                ['py', '--version'],
-                                capture_output=True,
-                                timeout=2,
-                                shell=True
-                            )
-                            if result.returncode == 0 or result.returncode == 1:
-                                python_exe = 'py'
-                                print(f"Found py launcher: {python_exe}")
-                        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-                            pass
-                
-                if not python_exe:
-                    # No Python interpreter found
-                    print("ERROR: No Python interpreter found!")
-                    print("To run games, you need:")
-                    print("1. Python installed and in PATH, OR")
-                    print("2. A bundled Python distribution in a 'python' folder next to the launcher")
-                    
-                    # Show error message in main thread
-                    self.after(0, lambda: messagebox.showerror(
-                        "Python Not Found",
-                        f"Could not find Python interpreter to run '{game_name}'.\n\n"
-                        "Please ensure Python is installed and available in your PATH, "
-                        "or contact the launcher developer for a version with bundled Python."
-                    ))
-                    self.after(0, self._game_ended, game_name, -1)
-                    return
-            
-            else:
-                # Running as a Python script - use current interpreter
-                print("Running as Python script")
-                python_exe = sys.executable
-            
-            # Build the command to run the game
-            # If using the 'py' launcher on Windows, we need to pass -3 flag for Python 3
-            if python_exe == 'py':
-                cmd = [python_exe, '-3', game_path]
-            else:
-                cmd = [python_exe, game_path]
+                # Show error message in main thread
+                self.after(0, lambda: messagebox.showerror(
+                    "Python Not Found",
+                    f"Could not find Python interpreter to run '{game_name}'.\n\n"
+                    "Please ensure Python is installed and available in your PATH, "
+                    "or contact the launcher developer for a version with bundled Python."
+                ))
+                return
             
             # Add fullscreen/windowed flag if the game supports it
             # (You might need to adjust this based on how your games handle arguments)
-            if self.settings.get('games_fullscreen', True):
-                cmd.append('--fullscreen')
-            else:
-                cmd.append('--windowed')
-            
-            print(f"Running command: {' '.join(cmd)}")
-            print(f"In directory: {game_folder}")
-            
-            # Check if we need to use shell=True for system Python commands
-            use_shell = not is_exe or python_exe in ['pythonw.exe', 'python.exe', 'python3', 'python', 'py']
-            
-            # Run the game using subprocess
-            self.game_process = subprocess.Popen(
-                cmd,
-                cwd=game_folder,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                shell=use_shell
-            )
+            game_args = ['--fullscreen' if self.settings.get('games_fullscreen', True) else '--windowed']
+            # Lets the game report its click-to-window time
+            game_env = {'LUNA_LAUNCH_T0': repr(launch_time)} if launch_time else {}
+            # And its frame times, scene changes and load times (luna_telemetry.connect_from_env in the game)
+            if self.telemetry is not None:
+                token, telemetry_env = self.telemetry.open_session(game_name)
+                self.telemetry_sessions[game_name] = token
+                game_env.update(telemetry_env)
+            
+            process = None
+            launch_mode = 'spawned'
+            zygote = self.zygote
+            if zygote is not None and zygote.available:
+                try:
+                    process = zygote.spawn(game_path, game_folder, game_args, game_env)
+                    launch_mode = 'pre-warmed'
+                    print(f"Forked {game_name} from the pre-warmed runtime (pid {process.pid})")
+                except OSError as e:
+                    print(f"Pre-warmed runtime unavailable, spawning the game: {e}")
+            
+            if process is None:
+                # The bootstrap runs main.py unchanged and reports the launch metrics
+                bootstrap = [BOOTSTRAP_SCRIPT] if os.path.exists(BOOTSTRAP_SCRIPT) else []
+                cmd = command + bootstrap + [game_path] + game_args
+                print(f"Running command: {' '.join(cmd)}")
+                print(f"In directory: {game_folder}")
+                
+                # Run the game using subprocess, the interpreter path is absolute so no shell is needed
+                process = subprocess.Popen(
+                    cmd,
+                    cwd=game_folder,
+                    env={**os.environ, **game_env},
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    bufsize=1,
+                    universal_newlines=True
+                )
+            self.game_process = process
+            
+            # Background downloads drop to the 'while playing' bandwidth limit
+            self.after(0, self.update_bandwidth_limit)
+            # Game priority and cores from the settings, the launcher steps back while it runs
+            self.apply_game_launch_options(process.pid)
+            self.after(0, self.quiesce)
+            
+            # Game output goes to memory and a log file written in batches, never to the console line by line
+            game_log = GameLog(Path.logs, game_name)
+            self.game_logs[game_name] = game_log
+            print(f"Game output: {game_log.path}")
             
             # Read output in real-time
             def read_output(pipe, output_type):
                 for line in iter(pipe.readline, ''):
-                    if line.strip():
-                        print(f"[{game_name} {output_type}]: {line.strip()}")
+                    metric = parse_metric(line.strip())
+                    if metric:
+                        self.after(0, self.record_launch_metric, game_name, launch_mode, *metric)
+                    elif line.strip():
+                        game_log.write(output_type, line.rstrip())
                 pipe.close()
             
             # Create threads to read stdout and stderr
@@ -1828,16 +2376,17 @@ class App(tk.CTk):
             stdout_thread.start()
             stderr_thread.start()
             
-            # Wait for process to complete
-            return_code = self.game_process.wait()
+            # The log is closed once both pipes are drained
+            Thread(target=lambda: (stdout_thread.join(), stderr_thread.join(), game_log.close()), daemon=True).start()
             
-            print(f"Game '{game_name}' exited with code: {return_code}")
+            # One exit event, whoever stops the game
+            self.supervisor.watch(game_name, process)
+            self.start_resource_monitor(game_name, process.pid)
             
         except Exception as e:
             print(f"Error in game thread: {e}")
             import traceback
             traceback.print_exc()
-            return_code = -1
         finally:
             # ALWAYS restore to the launcher directory
             try:
@@ -1851,11 +2400,170 @@ class App(tk.CTk):
                 except:
                     pass
             
-            # Reset game state in main thread
-            self.after(0, self._game_ended, game_name, return_code)
+            if process is None:
+                # The game did not start, reset game state in main thread
+                self.after(0, self._game_ended, game_name, -1)
+    
+    def game_interpreter_command(self) -> Optional[List[str]]:
+        """Interpreter command games run with: the cached external Python when frozen, the launcher's own otherwise"""
+        if getattr(sys, 'frozen', False):
+            interpreter = self.interpreters.get()
+            if interpreter is None:
+                return None
+            print(f"Using Python {interpreter['version']}: {interpreter['path']}")
+            return InterpreterCache.command(interpreter)
+        return [sys.executable]
+    
+    def start_zygote(self):
+        """Start the pre-warmed game runtime in the background, games are spawned normally until it is ready"""
+        if self.zygote is not None or not GameZygote.supported():
+            return
+        
+        def start():
+            command = self.game_interpreter_command()
+            if command:
+                zygote = GameZygote(command)
+                zygote.start()
+                self.zygote = zygote
+        
+        Thread(target=start, daemon=True).start()
+    
+    def stop_zygote(self):
+        if self.zygote is not None:
+            self.zygote.stop()
+            self.zygote = None
+    
+    def record_launch_metric(self, game_name: str, launch_mode: str, name: str, value: float):
+        """Store a launch time reported by a game (window_ms, first_frame_ms) in config/launch_metrics.json"""
+        print(f"{game_name}: {name} = {value:.0f} ms ({launch_mode})")
+        metrics_path = os.path.join(Path.config, 'launch_metrics.json')
+        try:
+            with open(metrics_path, 'r') as f:
+                history = json.load(f)
+        except Exception:
+            history = []
+        
+        # window_ms opens the entry of a launch, first_frame_ms completes it
+        if name == 'window_ms' or not history or history[-1].get("game") != game_name:
+            history.append({"game": game_name, "mode": launch_mode, "date": time.strftime("%Y-%m-%d %H:%M:%S")})
+        entry = history[-1]
+        entry[name] = round(value, 1)
+        self.launch_metrics[game_name] = entry
+        
+        try:
+            with open(metrics_path, 'w') as f:
+                json.dump(history[-100:], f, indent=2)
+        except OSError as e:
+            print(f"Error saving launch metrics: {e}")
+        
+        if name == 'window_ms' and self.game_open and self.game_open_name == game_name and hasattr(self, 'game_status_label'):
+            self.game_status_label.configure(text=f"🎮 Playing: {game_name} (window in {value:.0f} ms, {launch_mode})")
+    
+    def apply_game_launch_options(self, pid: int):
+        """Priority, I/O priority and cores of a game that just started (settings game_priority, game_io_priority, game_affinity)"""
+        cpus = reserved_cpus() if self.settings.get('game_affinity', 'all') == 'reserve' else None
+        apply_game_priority(pid,
+                            self.settings.get('game_priority', 'normal'),
+                            self.settings.get('game_io_priority', 'normal'),
+                            cpus[1] if cpus else None)
+    
+    def quiesce(self):
+        """While a game runs: lower launcher priority, hold icon and catalog work, one download at a time, slower UI ticks"""
+        if self.quiesced or not self.settings.get('quiesce_while_playing', True):
+            return
+        self.quiesced = True
+        # With 'Leave One to Launcher' the launcher keeps to the core the game does not use
+        cpus = reserved_cpus() if self.settings.get('game_affinity', 'all') == 'reserve' else None
+        self.launcher_priority.lower(cpus[0] if cpus else None)
+        self.icon_loader.pause()
+        print("Launcher quiesced while the game runs")
+    
+    def unquiesce(self):
+        """Back to normal once no game runs anymore"""
+        if not self.quiesced:
+            return
+        self.quiesced = False
+        self.launcher_priority.restore()
+        self.icon_loader.resume()
+        if self.revalidate_deferred:
+            self.revalidate_deferred = False
+            self.revalidate_game_data()
+        # The other download workers may start again
+        self.process_download_queue()
+        print("Launcher back to normal priority")
+    
+    def get_resource_sample_ms(self) -> int:
+        """Resource sampling interval in milliseconds (settings['resource_sample_ms'], 0 = disabled)"""
+        try:
+            return max(0, int(self.settings.get('resource_sample_ms', 1000)))
+        except (TypeError, ValueError):
+            return 1000
+    
+    def start_resource_monitor(self, game_name: str, pid: int):
+        """Sample the game's CPU and memory every settings['resource_sample_ms'] (0 disables it)"""
+        interval_ms = self.get_resource_sample_ms()
+        if not interval_ms or not ResourceMonitor.supported():
+            return
+        monitor = ResourceMonitor(pid, interval_ms / 1000,
+                                  on_sample=lambda sample: self.after(0, self.update_resource_display, game_name, sample))
+        self.resource_monitors[game_name] = monitor
+        monitor.start()
+    
+    def update_resource_display(self, game_name: str, sample: Dict):
+        monitor = self.resource_monitors.get(game_name)
+        if monitor is None or game_name != self.game_open_name or not hasattr(self, 'game_resource_label'):
+            return
+        mb = 1024 * 1024
+        text = f"CPU {sample['cpu']:.0f}%  ·  RAM {sample['rss'] / mb:.0f} MB (peak {monitor.peak_rss / mb:.0f} MB)  ·  {sample['threads']} threads"
+        token = self.telemetry_sessions.get(game_name)
+        frames = self.telemetry.live(token) if token and self.telemetry else None
+        if frames and frames['frames']:
+            text += f"  ·  {frames['fps_avg']:.0f} fps, p95 {frames['p95_ms']:.0f} ms"
+        self.game_resource_label.configure(text=text)
+    
+    def record_game_session(self, game_name: str, return_code: int):
+        """Append the summary of an ended game session (resources, frame times) to config/game_sessions.json"""
+        summary = {}
+        monitor = self.resource_monitors.pop(game_name, None)
+        if monitor is not None:
+            summary.update(monitor.stop())
+            print(f"{game_name} session: CPU avg {summary['cpu_avg']}% (max {summary['cpu_max']}%), "
+                  f"RAM peak {summary['rss_peak_mb']} MB, trend {summary['rss_trend_mb_per_min']} MB/min")
+        
+        token = self.telemetry_sessions.pop(game_name, None)
+        frames = self.telemetry.close_session(token) if token and self.telemetry else None
+        if frames and frames['frames']:
+            summary['frame_times'] = frames
+            print(f"{game_name} frame times: p50 {frames['p50_ms']} ms, p95 {frames['p95_ms']} ms, "
+                  f"p99 {frames['p99_ms']} ms, {frames['hitches']} hitches over 33 ms")
+        
+        if not summary:
+            return
+        
+        sessions_path = os.path.join(Path.config, 'game_sessions.json')
+        try:
+            with open(sessions_path, 'r') as f:
+                sessions = json.load(f)
+        except Exception:
+            sessions = []
+        sessions.append({"game": game_name, "date": time.strftime("%Y-%m-%d %H:%M:%S"), "exit_code": return_code, **summary})
+        try:
+            with open(sessions_path, 'w') as f:
+                json.dump(sessions[-100:], f, indent=2)
+        except OSError as e:
+            print(f"Error saving game session: {e}")
     
     def _game_ended(self, game_name: str, return_code: int):
-        """Called when game ends"""
+        """Called once when a game ends (or failed to start)"""
+        print(f"Game '{game_name}' exited with code: {return_code}")
+        self.record_game_session(game_name, return_code)
+        if not self.supervisor.running():
+            self.unquiesce()
+        if game_name != self.game_open_name:
+            # Not the game shown in the status bar
+            self.refresh_games()
+            return
+        
         # Ensure we're in the correct launcher directory
         try:
             launcher_dir = os.path.dirname(os.path.abspath(os.path.abspath(sys.argv[0])))
@@ -1871,6 +2579,10 @@ class App(tk.CTk):
         self.game_open_thread = None
         self.game_process = None
         
+        # Downloads get their normal bandwidth back
+        self.update_bandwidth_limit()
+        self.update_queue_display()
+        
         # Hide game status
         if hasattr(self, 'game_status_frame'):
             self.game_status_frame.grid_remove()
@@ -1885,33 +2597,6 @@ class App(tk.CTk):
         # Refresh UI to update game cards
         self.refresh_games()
 
-    def start_game_monitoring(self):
-        """Start a thread to monitor game status"""
-        if self.game_monitoring:
-            return
-        
-        self.game_monitoring = True
-        self.monitor_thread = Thread(target=self._monitor_games, daemon=True)
-        self.monitor_thread.start()
-
-    def _monitor_games(self):
-        """Monitor game processes"""
-        while self.game_monitoring:
-            if self.game_open and self.game_process:
-                # Check if process is still running
-                if self.game_process.poll() is not None:
-                    # Process has ended
-                    self.after(0, self._game_ended, self.game_open_name, self.game_process.returncode)
-            
-            time.sleep(1)  # Check every second
-
-    def stop_game_monitoring(self):
-        """Stop the game monitoring thread"""
-        self.game_monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2)
-            self.monitor_thread = None
-
     def kill_game(self):
         """Forcefully stop the running game"""
         if not self.game_open or not self.game_process:
@@ -1920,23 +2605,20 @@ class App(tk.CTk):
         try:
             print(f"Attempting to kill game: {self.game_open_name}")
             
-            # Try to terminate gracefully first
+            # Try to terminate gracefully first, the supervisor reports the exit
             self.game_process.terminate()
             
-            # Wait a bit
-            time.sleep(2)
-            
-            # If still running, kill it
-            if self.game_process.poll() is None:
-                self.game_process.kill()
-                print(f"Game '{self.game_open_name}' forcefully killed")
-            
-            # Clean up
-            self._game_ended(self.game_open_name, 0)
+            # If still running after a bit, kill it
+            self.after(2000, self._kill_if_running, self.game_open_name, self.game_process)
             
         except Exception as e:
             print(f"Error killing game: {e}")
 
+    def _kill_if_running(self, game_name: str, process):
+        if process.poll() is None:
+            process.kill()
+            print(f"Game '{game_name}' forcefully killed")
+
     def show_game_status(self):
         """Show game status bar"""
         if not hasattr(self, 'game_status_frame'):
@@ -1960,6 +2642,15 @@ class App(tk.CTk):
             )
             self.game_status_label.pack(side="left", padx=20, pady=15)
             
+            # Live CPU / memory of the game
+            self.game_resource_label = tk.CTkLabel(
+                self.game_status_frame,
+                text="",
+                font=("RobotoMono", 11),
+                text_color=self.theme_config['text_secondary']
+            )
+            self.game_resource_label.pack(side="left", pady=15)
+            
             # Kill game button
             self.kill_game_btn = tk.CTkButton(
                 self.game_status_frame,
@@ -1972,11 +2663,24 @@ class App(tk.CTk):
                 command=self.kill_game
             )
             self.kill_game_btn.pack(side="right", padx=20, pady=10)
+            
+            # Game output viewer
+            tk.CTkButton(
+                self.game_status_frame,
+                text="Logs",
+                fg_color=self.theme_config['button_secondary'],
+                hover_color=self.theme_config['button_secondary_hover'],
+                font=("RobotoMono", 11),
+                height=30,
+                width=70,
+                command=lambda: self.show_game_log(self.game_open_name)
+            ).pack(side="right", pady=10)
         
         # Update status text
         self.game_status_label.configure(
             text=f"🎮 Playing: {self.game_open_name}"
         )
+        self.game_resource_label.configure(text="")
         
         # Show the frame (at row 1)
         self.game_status_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=10, pady=(0, 10))
@@ -1985,6 +2689,46 @@ class App(tk.CTk):
         if hasattr(self, 'progress_frame') and self.progress_frame.winfo_viewable():
             self.show_progress()  # This will move it to row 2
 
+    def show_game_log(self, game_name: str):
+        """Window following the log file of the game's current (or last) session"""
+        game_log = self.game_logs.get(game_name)
+        if game_log is None or not game_log.path:
+            messagebox.showinfo("Game Log", f"No output recorded for '{game_name}' yet")
+            return
+        
+        log_window = tk.CTkToplevel(self)
+        log_window.title(f"{game_name} - Log")
+        log_window.geometry("800x500")
+        log_window.configure(fg_color=self.theme_config['bg'])
+        
+        textbox = tk.CTkTextbox(log_window,
+                                font=("RobotoMono", 11),
+                                fg_color=self.theme_config['card_bg'],
+                                text_color=self.theme_config['text_primary'],
+                                wrap="none")
+        textbox.pack(fill="both", expand=True, padx=10, pady=10)
+        textbox.configure(state="disabled")
+        tail = LogTail(game_log)
+        
+        def refresh():
+            if not log_window.winfo_exists():
+                return
+            text, restarted = tail.read()
+            if text or restarted:
+                textbox.configure(state="normal")
+                if restarted:
+                    textbox.delete("1.0", "end")
+                textbox.insert("end", text)
+                # Keep the widget small, the file has everything
+                lines = int(textbox.index("end-1c").split('.')[0])
+                if lines > 5000:
+                    textbox.delete("1.0", f"{lines - 5000}.0")
+                textbox.configure(state="disabled")
+                textbox.see("end")
+            log_window.after(500, refresh)
+        
+        refresh()
+
     def hide_game_status(self):
         """Hide game status bar"""
         if hasattr(self, 'game_status_frame'):
@@ -1998,6 +2742,52 @@ class App(tk.CTk):
         self.settings['games_fullscreen'] = self.start_fullscreen_var.get()
         self.save_settings()
 
+    def update_game_zygote(self, *args):
+        self.settings['game_zygote'] = self.game_zygote_var.get()
+        self.save_settings()
+        if self.settings['game_zygote']:
+            self.start_zygote()
+        else:
+            self.stop_zygote()
+
+    def update_download_workers(self, choice):
+        self.settings['download_workers'] = int(choice)
+        self.save_settings()
+        # More workers may have become available
+        self.process_download_queue()
+
+    def update_bandwidth_setting(self, key: str, choice: str):
+        self.settings[key] = self.BANDWIDTH_OPTIONS[choice]
+        self.save_settings()
+        self.update_bandwidth_limit()
+        self.update_queue_display()
+
+    def update_launch_option(self, key: str, options: Dict[str, str], choice: str):
+        # Applies from the next game launched
+        self.settings[key] = options[choice]
+        self.save_settings()
+
+    def update_quiesce(self, *args):
+        self.settings['quiesce_while_playing'] = self.quiesce_var.get()
+        self.save_settings()
+        if not self.settings['quiesce_while_playing']:
+            self.unquiesce()
+        elif self.game_open:
+            self.quiesce()
+
+    def update_resource_sampling(self, choice: str):
+        # Applies from the next game launched
+        self.settings['resource_sample_ms'] = self.RESOURCE_SAMPLE_OPTIONS[choice]
+        self.save_settings()
+
+    def bandwidth_label(self, key: str, default: int) -> str:
+        """Option menu label of a bandwidth setting"""
+        value = self.settings.get(key, default)
+        for label, kbps in self.BANDWIDTH_OPTIONS.items():
+            if kbps == value:
+                return label
+        return f"{value} KB/s"
+
     def show_settings(self):
         """Show settings dialog"""
         settings_dialog = tk.CTkToplevel(self)
@@ -2034,6 +2824,119 @@ class App(tk.CTk):
                                                         corner_radius=8)
         self.start_fullscreen_checkbox.pack(anchor="w", pady=(0, 10))
         
+        # Pre-warmed game runtime, games are forked from it (Linux only)
+        if GameZygote.supported():
+            self.game_zygote_var = tk.BooleanVar(value=self.settings.get('game_zygote', False))
+            self.game_zygote_var.trace_add("write", self.update_game_zygote)
+            tk.CTkCheckBox(scroll_frame,
+                           text="Pre-warm Game Runtime (faster game start)",
+                           variable=self.game_zygote_var,
+                           onvalue=True,
+                           offvalue=False,
+                           text_color=self.theme_config['text_primary'],
+                           fg_color=self.theme_config['card_bg'],
+                           border_color=self.theme_config['card_border'],
+                           border_width=1,
+                           corner_radius=8).pack(anchor="w", pady=(0, 10))
+        
+        # Parallel downloads
+        workers_frame = tk.CTkFrame(scroll_frame, fg_color="transparent")
+        workers_frame.pack(fill="x", pady=(0, 20))
+        
+        tk.CTkLabel(workers_frame,
+                text="Parallel Downloads:",
+                font=("RobotoMono", 12),
+                text_color=self.theme_config['text_primary']).pack(side="left", padx=(0, 20))
+        
+        self.download_workers_var = tk.StringVar(value=str(self.get_download_workers()))
+        tk.CTkOptionMenu(workers_frame,
+                        variable=self.download_workers_var,
+                        values=[str(n) for n in range(1, 7)],
+                        command=self.update_download_workers,
+                        fg_color=self.theme_config['input_bg'],
+                        button_color=self.theme_config['button_secondary'],
+                        button_hover_color=self.theme_config['button_secondary_hover'],
+                        width=80).pack(side="left")
+        
+        # Bandwidth limits, the second one applies while a game is running
+        for key, default, text in (('download_limit_kbps', 0, "Download Limit:"),
+                                   ('game_running_limit_kbps', 512, "Limit While Playing:")):
+            limit_frame = tk.CTkFrame(scroll_frame, fg_color="transparent")
+            limit_frame.pack(fill="x", pady=(0, 20))
+            
+            tk.CTkLabel(limit_frame,
+                    text=text,
+                    font=("RobotoMono", 12),
+                    text_color=self.theme_config['text_primary']).pack(side="left", padx=(0, 20))
+            
+            tk.CTkOptionMenu(limit_frame,
+                            variable=tk.StringVar(value=self.bandwidth_label(key, default)),
+                            values=list(self.BANDWIDTH_OPTIONS),
+                            command=lambda choice, key=key: self.update_bandwidth_setting(key, choice),
+                            fg_color=self.theme_config['input_bg'],
+                            button_color=self.theme_config['button_secondary'],
+                            button_hover_color=self.theme_config['button_secondary_hover'],
+                            width=120).pack(side="left")
+        
+        # Launch options: game priority, I/O priority and cores
+        launch_options = [('game_priority', "Game Priority:", self.GAME_PRIORITY_OPTIONS)]
+        if io_priority_supported():
+            launch_options.append(('game_io_priority', "Game I/O Priority:", self.GAME_IO_PRIORITY_OPTIONS))
+        if affinity_supported() and reserved_cpus():
+            launch_options.append(('game_affinity', "Game CPU Cores:", self.GAME_AFFINITY_OPTIONS))
+        for key, text, options in launch_options:
+            option_frame = tk.CTkFrame(scroll_frame, fg_color="transparent")
+            option_frame.pack(fill="x", pady=(0, 20))
+            
+            tk.CTkLabel(option_frame,
+                    text=text,
+                    font=("RobotoMono", 12),
+                    text_color=self.theme_config['text_primary']).pack(side="left", padx=(0, 20))
+            
+            value = self.settings.get(key, next(iter(options.values())))
+            tk.CTkOptionMenu(option_frame,
+                            variable=tk.StringVar(value=next((label for label, v in options.items() if v == value), value)),
+                            values=list(options),
+                            command=lambda choice, key=key, options=options: self.update_launch_option(key, options, choice),
+                            fg_color=self.theme_config['input_bg'],
+                            button_color=self.theme_config['button_secondary'],
+                            button_hover_color=self.theme_config['button_secondary_hover'],
+                            width=180).pack(side="left")
+        
+        # Lower launcher priority, hold background work and throttle downloads while playing
+        self.quiesce_var = tk.BooleanVar(value=self.settings.get('quiesce_while_playing', True))
+        self.quiesce_var.trace_add("write", self.update_quiesce)
+        tk.CTkCheckBox(scroll_frame,
+                       text="Quiet Launcher While Playing",
+                       variable=self.quiesce_var,
+                       onvalue=True,
+                       offvalue=False,
+                       text_color=self.theme_config['text_primary'],
+                       fg_color=self.theme_config['card_bg'],
+                       border_color=self.theme_config['card_border'],
+                       border_width=1,
+                       corner_radius=8).pack(anchor="w", pady=(0, 20))
+        
+        # Game CPU/memory sampling rate
+        if ResourceMonitor.supported():
+            sampling_frame = tk.CTkFrame(scroll_frame, fg_color="transparent")
+            sampling_frame.pack(fill="x", pady=(0, 20))
+            
+            tk.CTkLabel(sampling_frame,
+                    text="Game Resource Sampling:",
+                    font=("RobotoMono", 12),
+                    text_color=self.theme_config['text_primary']).pack(side="left", padx=(0, 20))
+            
+            sample_ms = self.get_resource_sample_ms()
+            tk.CTkOptionMenu(sampling_frame,
+                            variable=tk.StringVar(value=next((label for label, ms in self.RESOURCE_SAMPLE_OPTIONS.items() if ms == sample_ms), f"{sample_ms} ms")),
+                            values=list(self.RESOURCE_SAMPLE_OPTIONS),
+                            command=self.update_resource_sampling,
+                            fg_color=self.theme_config['input_bg'],
+                            button_color=self.theme_config['button_secondary'],
+                            button_hover_color=self.theme_config['button_secondary_hover'],
+                            width=120).pack(side="left")
+        
         # Theme Selection
         tk.CTkLabel(scroll_frame,
                 text="Theme",
@@ -2166,6 +3069,11 @@ class App(tk.CTk):
             if os.path.exists(cache_path):
                 shutil.rmtree(cache_path)
                 os.makedirs(cache_path)
+                # Forget the cached icons too
+                with self.icon_cache.lock:
+                    self.icon_cache.index.clear()
+                    self.icon_cache.validated.clear()
+                self.icon_loader.forget()
                 print("Cache cleared successfully")
                 
                 # Show success message
@@ -2262,7 +3170,19 @@ class App(tk.CTk):
         
     def __del__(self):
         """Cleanup when app closes"""
-        self.stop_game_monitoring()
+        if hasattr(self, 'supervisor'):
+            self.supervisor.close()
+        if getattr(self, 'telemetry', None):
+            self.telemetry.close()
+        if hasattr(self, 'launcher_priority'):
+            self.launcher_priority.restore()
+        
+        if hasattr(self, 'icon_loader'):
+            self.icon_loader.shutdown()
+        if hasattr(self, 'http'):
+            self.http.close()
+        if hasattr(self, 'zygote'):
+            self.stop_zygote()
         
         # Kill any running game
         if self.game_open and self.game_process:
@@ -2274,7 +3194,35 @@ class App(tk.CTk):
             except:
                 pass
 
+def verify_games_cli(game_names: List[str]) -> int:
+    """
+    launcher.py --verify [game ...]: check installed games against their file manifest, all of them by default.
+    Prints one line per game (OK with its file count, not installed, no manifest) and lists the corrupted or missing
+    files. Returns the process exit code: 1 if a game is not installed or has bad files, 0 otherwise.
+    """
+    downloader = Downloader(Catalog())
+    exit_code = 0
+    for game_name in game_names or downloader.get_all_installed_games():
+        if not downloader.is_game_installed(game_name):
+            print(f"{game_name}: not installed")
+            exit_code = 1
+            continue
+        result = downloader.verify_installed_game(game_name)
+        if result is None:
+            print(f"{game_name}: no manifest, skipped")
+        elif result[1]:
+            exit_code = 1
+            print(f"{game_name}: {len(result[1])}/{result[0]} files corrupted or missing")
+            for path in result[1]:
+                print(f"  {path}")
+        else:
+            print(f"{game_name}: OK ({result[0]} files)")
+    return exit_code
+
 if __name__ == '__main__':
+    if '--verify' in sys.argv:
+        sys.exit(verify_games_cli(sys.argv[sys.argv.index('--verify') + 1:]))
+    
     app = App()
     try:
         app.iconbitmap(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),'assets','icons', 'launcher.ico'))
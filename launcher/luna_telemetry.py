@@ -0,0 +1,265 @@
+"""
+Frame-time telemetry from the games to the launcher.
+Game side: `luna_telemetry.connect_from_env(engine)` in main(). It does nothing unless the game was started by the
+launcher, which sets LUNA_TELEMETRY (127.0.0.1:<port>) and LUNA_TELEMETRY_SESSION. The time between two presented
+frames, scene changes and load times are then sent as small UDP datagrams that never block the game.
+Launcher side: TelemetryServer receives them and aggregates each session into frame-time histograms.
+"""
+import os, time, socket, struct, atexit, secrets, threading
+from typing import Dict, List, Optional, Tuple
+
+ENV_ADDRESS = 'LUNA_TELEMETRY'
+ENV_SESSION = 'LUNA_TELEMETRY_SESSION'
+HITCH_MS = 33.0  # Two frames missed at 60 fps
+TOKEN_SIZE = 8
+# Datagram: <session token><kind><payload>
+KIND_FRAMES = b'F'  # little-endian uint16 frame times in 0.1 ms
+KIND_SCENE = b'S'   # '<scene name>\t<switch ms>'
+KIND_LOAD = b'L'    # '<name>\t<ms>'
+
+class TelemetryClient:
+    """Game side, frame times are batched and sent every flush_interval seconds"""
+    def __init__(self, address: Tuple[str, int], session: str, flush_interval: float = 0.5, max_frames: int = 256):
+        self.address = address
+        self.header = session.encode('ascii')
+        self.flush_interval = flush_interval
+        self.max_frames = max_frames
+        self.frames: List[int] = []
+        self.last_flush = time.perf_counter()
+        self.last_present: Optional[float] = None
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+
+    def _send(self, kind: bytes, payload: bytes):
+        try:
+            self.sock.sendto(self.header + kind + payload, self.address)
+        except OSError:
+            # Launcher gone or socket buffer full, telemetry is best effort
+            pass
+
+    def frame(self, ms: float):
+        self.frames.append(min(int(ms * 10), 0xFFFF))
+        now = time.perf_counter()
+        if len(self.frames) >= self.max_frames or now - self.last_flush >= self.flush_interval:
+            self.flush(now)
+
+    def present(self):
+        """Called after each presented frame, records the time since the previous one"""
+        now = time.perf_counter()
+        if self.last_present is not None:
+            self.frame((now - self.last_present) * 1000)
+        self.last_present = now
+
+    def scene(self, name: str, ms: float = 0.0):
+        # The frames so far belong to the previous scene
+        self.flush()
+        self._send(KIND_SCENE, f"{name}\t{ms:.1f}".encode('utf-8', 'replace'))
+
+    def load(self, name: str, ms: float):
+        self._send(KIND_LOAD, f"{name}\t{ms:.1f}".encode('utf-8', 'replace'))
+
+    def flush(self, now: Optional[float] = None):
+        self.last_flush = now if now is not None else time.perf_counter()
+        if self.frames:
+            frames, self.frames = self.frames, []
+            self._send(KIND_FRAMES, struct.pack(f'<{len(frames)}H', *frames))
+
+_client: Optional[TelemetryClient] = None
+
+def get_client() -> Optional[TelemetryClient]:
+    """Client configured by the launcher's environment variables, None when not started by the launcher"""
+    global _client
+    if _client is None:
+        address, session = os.environ.get(ENV_ADDRESS, ''), os.environ.get(ENV_SESSION, '')
+        host, _, port = address.rpartition(':')
+        if not host or not port.isdigit() or len(session) != TOKEN_SIZE:
+            return None
+        _client = TelemetryClient((host, int(port)), session)
+        atexit.register(_client.flush)
+    return _client
+
+def _wrap_present(client: TelemetryClient):
+    import pygame
+    display = pygame.display
+    for name in ('flip', 'update'):
+        original = getattr(display, name)
+        if getattr(original, '_luna_telemetry', False):
+            # Already reporting (connect_from_env called again)
+            continue
+
+        def present(*args, _original=original, **kwargs):
+            result = _original(*args, **kwargs)
+            client.present()
+            return result
+
+        present._luna_telemetry = True
+        setattr(display, name, present)
+
+def connect_from_env(engine=None) -> Optional[TelemetryClient]:
+    """
+    Called by a game's main() with its LunaEngine: report the frame times, scene changes and load times.
+    Does nothing and returns None unless the launcher started the game with LUNA_TELEMETRY set.
+    """
+    client = get_client()
+    if client is None or getattr(engine, '_luna_telemetry', False):
+        return client
+    try:
+        _wrap_present(client)
+    except ImportError:
+        return client
+    if engine is None:
+        return client
+    engine._luna_telemetry = True
+
+    def timed(method, report):
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            report((time.perf_counter() - start) * 1000, *args)
+            return result
+        return wrapper
+
+    if hasattr(engine, 'set_scene'):
+        engine.set_scene = timed(engine.set_scene, lambda ms, name, *args: client.scene(str(name), ms))
+    if hasattr(engine, 'initialize'):
+        engine.initialize = timed(engine.initialize, lambda ms, *args: client.load('initialize', ms))
+    if hasattr(engine, 'run'):
+        original_run = engine.run
+
+        def run(*args, **kwargs):
+            # Everything main() loaded before the game loop, from the Play click when known
+            launch_time = float(os.environ.get('LUNA_LAUNCH_T0') or 0)
+            if launch_time:
+                client.load('startup', (time.time() - launch_time) * 1000)
+            return original_run(*args, **kwargs)
+
+        engine.run = run
+    return client
+
+class FrameHistogram:
+    """Frame times in bucket_ms buckets up to max_ms (and one overflow bucket), percentiles are bucket upper bounds"""
+    def __init__(self, bucket_ms: float = 0.5, max_ms: float = 250.0):
+        self.bucket_ms = bucket_ms
+        self.buckets = [0] * (int(max_ms / bucket_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.hitches = 0
+
+    def add(self, ms: float):
+        self.buckets[min(int(ms / self.bucket_ms), len(self.buckets) - 1)] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if ms > HITCH_MS:
+            self.hitches += 1
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                return min((index + 1) * self.bucket_ms, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict:
+        return {'frames': self.count,
+                'fps_avg': round(self.count / (self.total_ms / 1000), 1) if self.total_ms else 0.0,
+                'p50_ms': round(self.percentile(50), 1),
+                'p95_ms': round(self.percentile(95), 1),
+                'p99_ms': round(self.percentile(99), 1),
+                'max_ms': round(self.max_ms, 1),
+                'hitches': self.hitches}
+
+class TelemetrySession:
+    def __init__(self, game_name: str):
+        self.game_name = game_name
+        self.frames = FrameHistogram()
+        self.scenes: Dict[str, FrameHistogram] = {}
+        self.scene: Optional[str] = None
+        self.loads: List[Dict] = []
+
+    def summary(self) -> Dict:
+        return {**self.frames.summary(),
+                'scenes': {name: histogram.summary() for name, histogram in self.scenes.items()},
+                'loads': self.loads[-50:]}
+
+class TelemetryServer:
+    """Launcher side: one UDP socket on 127.0.0.1 for every game session, read by a background thread"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions: Dict[bytes, TelemetrySession] = {}
+        self._closed = False
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._receive_loop, daemon=True, name='telemetry')
+        self._thread.start()
+
+    def open_session(self, game_name: str) -> Tuple[str, Dict[str, str]]:
+        """(session token, environment variables for the game)"""
+        token = secrets.token_hex(TOKEN_SIZE // 2)
+        with self.lock:
+            self.sessions[token.encode('ascii')] = TelemetrySession(game_name)
+        return token, {ENV_ADDRESS: f"127.0.0.1:{self.port}", ENV_SESSION: token}
+
+    def live(self, token: str) -> Optional[Dict]:
+        """Frame-time summary of a running session"""
+        with self.lock:
+            session = self.sessions.get(token.encode('ascii'))
+            return session.frames.summary() if session else None
+
+    def close_session(self, token: str) -> Optional[Dict]:
+        """Stop collecting a session and return its summary"""
+        with self.lock:
+            session = self.sessions.pop(token.encode('ascii'), None)
+            return session.summary() if session else None
+
+    def _receive_loop(self):
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except OSError:
+                break
+            if self._closed:
+                break
+            try:
+                self._handle(data)
+            except (ValueError, struct.error, UnicodeDecodeError):
+                # Malformed datagram
+                pass
+
+    def _handle(self, data: bytes):
+        token, kind, payload = data[:TOKEN_SIZE], data[TOKEN_SIZE:TOKEN_SIZE + 1], data[TOKEN_SIZE + 1:]
+        with self.lock:
+            session = self.sessions.get(token)
+            if session is None:
+                return
+            if kind == KIND_FRAMES:
+                scene = session.scenes.get(session.scene) if session.scene else None
+                for value in struct.unpack(f'<{len(payload) // 2}H', payload[:len(payload) // 2 * 2]):
+                    ms = value / 10
+                    session.frames.add(ms)
+                    if scene is not None:
+                        scene.add(ms)
+            elif kind == KIND_SCENE:
+                name, _, ms = payload.decode('utf-8').partition('\t')
+                session.scene = name
+                session.scenes.setdefault(name, FrameHistogram())
+                session.loads.append({'name': f"scene:{name}", 'ms': float(ms or 0)})
+            elif kind == KIND_LOAD:
+                name, _, ms = payload.decode('utf-8').partition('\t')
+                session.loads.append({'name': name, 'ms': float(ms)})
+
+    def close(self):
+        self._closed = True
+        try:
+            # Wake the receiving thread up, closing the socket alone does not
+            self.sock.sendto(b'', ('127.0.0.1', self.port))
+            self._thread.join(timeout=1)
+            self.sock.close()
+        except OSError:
+            pass
@@ -0,0 +1,154 @@
+import os, sys
+from typing import List, Optional, Tuple
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+LINUX = sys.platform.startswith('linux')
+ERRORS = (OSError, psutil.Error) if psutil is not None else (OSError,)
+# Nice values on POSIX, priority classes on Windows (through psutil)
+GAME_NICE = {'normal': 0, 'above_normal': -5, 'high': -10}
+GAME_CLASSES = {'normal': 'NORMAL_PRIORITY_CLASS', 'above_normal': 'ABOVE_NORMAL_PRIORITY_CLASS', 'high': 'HIGH_PRIORITY_CLASS'}
+
+def affinity_supported() -> bool:
+    return hasattr(os, 'sched_setaffinity') or (psutil is not None and hasattr(psutil.Process, 'cpu_affinity'))
+
+def io_priority_supported() -> bool:
+    return psutil is not None and hasattr(psutil.Process, 'ionice')
+
+def available_cpus() -> List[int]:
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    if psutil is not None and hasattr(psutil.Process, 'cpu_affinity'):
+        return sorted(psutil.Process().cpu_affinity())
+    return list(range(os.cpu_count() or 1))
+
+def reserved_cpus() -> Optional[Tuple[List[int], List[int]]]:
+    """(launcher cores, game cores) leaving the first core to the launcher, None with a single core"""
+    cpus = available_cpus()
+    if len(cpus) < 2:
+        return None
+    return cpus[:1], cpus[1:]
+
+def _set_affinity(pid: int, cpus: List[int]):
+    if hasattr(os, 'sched_setaffinity'):
+        # On Linux this is the thread 'pid', the threads it starts afterwards inherit it
+        os.sched_setaffinity(pid, cpus)
+    else:
+        psutil.Process(pid).cpu_affinity(cpus)
+
+def apply_game_priority(pid: int, priority: str = 'normal', io_priority: str = 'normal', cpus: Optional[List[int]] = None):
+    """
+    Set the priority ('normal', 'above_normal', 'high'), I/O priority ('normal', 'high') and cores of a game that
+    just started, before it starts its own threads. Raising the priority needs privileges on Linux, what cannot
+    be applied is reported and skipped.
+    """
+    if priority != 'normal':
+        try:
+            if sys.platform == 'win32' and psutil is not None:
+                psutil.Process(pid).nice(getattr(psutil, GAME_CLASSES[priority]))
+            elif hasattr(os, 'setpriority'):
+                os.setpriority(os.PRIO_PROCESS, pid, GAME_NICE[priority])
+        except ERRORS as e:
+            print(f"Could not set game priority to {priority}: {e}")
+
+    if io_priority == 'high' and io_priority_supported():
+        try:
+            if sys.platform == 'win32':
+                psutil.Process(pid).ionice(psutil.IOPRIO_HIGH)
+            else:
+                # Highest best-effort level, allowed without privileges
+                psutil.Process(pid).ionice(psutil.IOPRIO_CLASS_BE, value=0)
+        except ERRORS as e:
+            print(f"Could not set game I/O priority: {e}")
+
+    if cpus and affinity_supported():
+        try:
+            _set_affinity(pid, cpus)
+        except ERRORS as e:
+            print(f"Could not set game CPU affinity: {e}")
+
+class LauncherPriority:
+    """
+    Lowers the launcher's own scheduling while a game runs and restores it afterwards. Only changes that can be
+    undone without privileges are made: on Linux every launcher thread goes to SCHED_BATCH, and to nice 10 only
+    when RLIMIT_NICE allows setting it back. Elsewhere the process gets the below normal class (psutil).
+    Optionally the launcher is pinned to the given cores.
+    """
+    BACKGROUND_NICE = 10
+
+    def __init__(self):
+        self.saved: Optional[dict] = None
+
+    @property
+    def lowered(self) -> bool:
+        return self.saved is not None
+
+    @staticmethod
+    def _threads() -> List[int]:
+        try:
+            return [int(tid) for tid in os.listdir('/proc/self/task')]
+        except OSError:
+            return [0]
+
+    @staticmethod
+    def _can_restore_nice(nice: int) -> bool:
+        if os.geteuid() == 0:
+            return True
+        import resource
+        # Unprivileged, the nice value can only go back down to 20 - RLIMIT_NICE
+        soft, _ = resource.getrlimit(resource.RLIMIT_NICE)
+        return soft == resource.RLIM_INFINITY or 20 - soft <= nice
+
+    def lower(self, cpus: Optional[List[int]] = None):
+        if self.lowered:
+            return
+        try:
+            if LINUX:
+                self.saved = {'policy': os.sched_getscheduler(0), 'nice': os.getpriority(os.PRIO_PROCESS, 0),
+                              'affinity': sorted(os.sched_getaffinity(0))}
+                self.saved['renice'] = self._can_restore_nice(self.saved['nice'])
+                self._apply(os.SCHED_BATCH if self.saved['policy'] == os.SCHED_OTHER else None,
+                            self.saved['nice'] + self.BACKGROUND_NICE if self.saved['renice'] else None, cpus)
+            elif psutil is not None:
+                process = psutil.Process()
+                self.saved = {'nice': process.nice()}
+                if sys.platform == 'win32':
+                    process.nice(psutil.BELOW_NORMAL_PRIORITY_CLASS)
+                if cpus and hasattr(process, 'cpu_affinity'):
+                    self.saved['affinity'] = process.cpu_affinity()
+                    process.cpu_affinity(cpus)
+        except ERRORS as e:
+            print(f"Could not lower launcher priority: {e}")
+
+    def _apply(self, policy: Optional[int], nice: Optional[int], cpus: Optional[List[int]]):
+        """Linux: scheduling is per thread, apply it to every thread of the launcher"""
+        for tid in self._threads():
+            try:
+                if policy is not None:
+                    os.sched_setscheduler(tid, policy, os.sched_param(0))
+                if nice is not None:
+                    os.setpriority(os.PRIO_PROCESS, tid, nice)
+                if cpus:
+                    os.sched_setaffinity(tid, cpus)
+            except OSError:
+                # The thread exited meanwhile
+                pass
+
+    def restore(self):
+        if not self.lowered:
+            return
+        saved, self.saved = self.saved, None
+        try:
+            if LINUX:
+                # Threads started meanwhile inherited the lowered scheduling, every one is restored
+                self._apply(saved['policy'], saved['nice'] if saved['renice'] else None, saved['affinity'])
+            elif psutil is not None:
+                process = psutil.Process()
+                process.nice(saved['nice'])
+                if 'affinity' in saved:
+                    process.cpu_affinity(saved['affinity'])
+        except ERRORS as e:
+            print(f"Could not restore launcher priority: {e}")
@@ -0,0 +1,92 @@
+import threading, time
+from typing import Dict, List, Optional
+
+class ProgressState:
+    """Latest progress of one download plus its smoothed throughput"""
+    __slots__ = ('key', 'percent', 'status', 'downloaded', 'total', 'rate', '_last_bytes', '_last_time')
+
+    def __init__(self, key: str):
+        self.key = key
+        self.percent = 0.0
+        self.status = ''
+        self.downloaded: Optional[int] = None
+        self.total: Optional[int] = None
+        self.rate = 0.0  # Bytes per second, exponential moving average
+        self._last_bytes: Optional[int] = None
+        self._last_time = 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Seconds left at the current rate, None when unknown"""
+        if not self.rate or not self.total or self.downloaded is None:
+            return None
+        return max(0.0, (self.total - self.downloaded) / self.rate)
+
+class ProgressChannel:
+    """
+    Progress events from the download threads to the Tk thread.
+    publish() only stores the latest value of a download (a burst of chunk callbacks costs one dict write each),
+    the UI calls drain() from a single periodic tick and gets at most one update per download, with the
+    throughput smoothed over the ticks (exponential moving average) for the speed and ETA display.
+    """
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing
+        self.lock = threading.Lock()
+        self.pending: Dict[str, tuple] = {}
+        self.states: Dict[str, ProgressState] = {}
+
+    def publish(self, key: str, percent: float, status: str, downloaded: Optional[int] = None, total: Optional[int] = None):
+        """Called from any thread, replaces the previous value not drained yet"""
+        with self.lock:
+            self.pending[key] = (percent, status, downloaded, total)
+
+    def drain(self) -> List[ProgressState]:
+        """Called from the UI thread, returns the downloads that changed since the last call"""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+
+        now = time.monotonic()
+        updates = []
+        for key, (percent, status, downloaded, total) in pending.items():
+            state = self.states.get(key)
+            if state is None:
+                state = self.states[key] = ProgressState(key)
+            state.percent, state.status = percent, status
+
+            if downloaded is None:
+                # Extraction, verification...: no bytes to measure
+                state.rate, state._last_bytes = 0.0, None
+            elif state._last_bytes is None or downloaded < state._last_bytes:
+                # First sample, or the download restarted
+                state.rate, state._last_bytes, state._last_time = 0.0, downloaded, now
+            elif now > state._last_time:
+                sample = (downloaded - state._last_bytes) / (now - state._last_time)
+                state.rate = sample if not state.rate else self.smoothing * sample + (1 - self.smoothing) * state.rate
+                state._last_bytes, state._last_time = downloaded, now
+            state.downloaded, state.total = downloaded, total
+
+            if percent >= 100:
+                self.states.pop(key, None)
+            updates.append(state)
+        return updates
+
+    def discard(self, key: str):
+        """Forget a finished download, an update not drained yet is dropped"""
+        with self.lock:
+            self.pending.pop(key, None)
+        self.states.pop(key, None)
+
+    def has_pending(self) -> bool:
+        with self.lock:
+            return bool(self.pending)
+
+def format_rate(state: ProgressState) -> str:
+    """'1.25MB/s, 0:42 left' for a download with a known rate, '' otherwise"""
+    if not state.rate:
+        return ''
+    text = f"{state.rate / (1024 ** 2):.2f}MB/s"
+    eta = state.eta
+    if eta is not None:
+        minutes, seconds = divmod(int(eta), 60)
+        text += f", {minutes}:{seconds:02d} left"
+    return text
@@ -0,0 +1,158 @@
+import os, sys, threading, time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PROC_AVAILABLE = sys.platform.startswith('linux') and os.path.isdir('/proc/self')
+
+class ResourceMonitor:
+    """
+    Samples the CPU, resident memory and thread count of a game every interval seconds from a background thread.
+    On Linux it reads /proc/<pid>/stat, statm and status (a few small reads, no process spawned), elsewhere it
+    uses psutil when installed. The last history samples are kept, on_sample(sample) is called for each one and
+    summary() describes the whole session.
+    """
+    def __init__(self, pid: int, interval: float = 1.0, history: int = 600,
+                 on_sample: Optional[Callable[[Dict], None]] = None):
+        self.pid = pid
+        self.interval = interval
+        self.on_sample = on_sample
+        self.samples: Deque[Dict] = deque(maxlen=history)
+        self.started = time.time()
+        self.peak_rss = 0
+        self.max_threads = 0
+        self.max_cpu = 0.0
+        self._cpu_total = 0.0
+        self._count = 0
+        self._first_rss: Optional[int] = None
+        self._last_cpu: Optional[tuple] = None
+        self._start_time: Optional[bytes] = None
+        self._process = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def supported() -> bool:
+        return PROC_AVAILABLE or psutil is not None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._loop, daemon=True, name=f'resmon-{self.pid}')
+        self._thread.start()
+
+    def _read_proc(self) -> Optional[Dict]:
+        """(cpu seconds, rss, threads, peak rss) from /proc, None once the process is gone"""
+        try:
+            with open(f'/proc/{self.pid}/stat', 'rb') as f:
+                # The command name may contain spaces and parentheses, the fields start after the last ')'
+                fields = f.read().rsplit(b')', 1)[1].split()
+            with open(f'/proc/{self.pid}/statm', 'rb') as f:
+                resident_pages = int(f.read().split()[1])
+            peak = 0
+            with open(f'/proc/{self.pid}/status', 'rb') as f:
+                for line in f:
+                    if line.startswith(b'VmHWM:'):
+                        peak = int(line.split()[1]) * 1024
+                        break
+        except (OSError, IndexError, ValueError):
+            return None
+        # A zombie has exited, another start time means the pid was reused
+        if fields[0] == b'Z' or self._start_time not in (None, fields[19]):
+            return None
+        self._start_time = fields[19]
+        ticks = os.sysconf('SC_CLK_TCK')
+        return {'cpu_time': (int(fields[11]) + int(fields[12])) / ticks,
+                'rss': resident_pages * os.sysconf('SC_PAGE_SIZE'),
+                'threads': int(fields[17]),
+                'peak': peak}
+
+    def _read_psutil(self) -> Optional[Dict]:
+        try:
+            if self._process is None:
+                self._process = psutil.Process(self.pid)
+            with self._process.oneshot():
+                times = self._process.cpu_times()
+                memory = self._process.memory_info()
+                threads = self._process.num_threads()
+        except psutil.Error:
+            return None
+        return {'cpu_time': times.user + times.system,
+                'rss': memory.rss,
+                'threads': threads,
+                # Windows reports the peak working set
+                'peak': getattr(memory, 'peak_wset', 0)}
+
+    def sample(self) -> Optional[Dict]:
+        """Take one sample: {'time', 'cpu' (% of one core), 'rss', 'threads'}, None once the process is gone"""
+        raw = self._read_proc() if PROC_AVAILABLE else self._read_psutil()
+        if raw is None:
+            return None
+        now = time.monotonic()
+        cpu = 0.0
+        if self._last_cpu is not None:
+            elapsed = now - self._last_cpu[0]
+            if elapsed > 0:
+                cpu = max(0.0, (raw['cpu_time'] - self._last_cpu[1]) / elapsed * 100)
+        self._last_cpu = (now, raw['cpu_time'])
+
+        sample = {'time': time.time(), 'cpu': cpu, 'rss': raw['rss'], 'threads': raw['threads']}
+        self.samples.append(sample)
+        self.peak_rss = max(self.peak_rss, raw['rss'], raw['peak'])
+        self.max_threads = max(self.max_threads, raw['threads'])
+        if self._first_rss is None:
+            self._first_rss = raw['rss']
+        else:
+            # The first sample has no CPU interval
+            self.max_cpu = max(self.max_cpu, cpu)
+            self._cpu_total += cpu
+            self._count += 1
+        return sample
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            sample = self.sample()
+            if sample is None:
+                break
+            if self.on_sample is not None:
+                try:
+                    self.on_sample(sample)
+                except Exception as e:
+                    print(f"Error in resource monitor callback: {e}")
+            self._stopped.wait(self.interval)
+
+    def stop(self) -> Dict:
+        """Stop sampling and return the session summary"""
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        return self.summary()
+
+    def rss_trend(self) -> float:
+        """Resident memory growth over the kept history in bytes per minute (least squares), a steady rise is a leak"""
+        samples = list(self.samples)
+        if len(samples) < 10:
+            return 0.0
+        t0 = samples[0]['time']
+        xs = [(s['time'] - t0) / 60 for s in samples]
+        ys = [s['rss'] for s in samples]
+        mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+        variance = sum((x - mean_x) ** 2 for x in xs)
+        if variance == 0:
+            return 0.0
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+    def summary(self) -> Dict:
+        last = self.samples[-1] if self.samples else None
+        mb = 1024 * 1024
+        return {'duration_s': round(time.time() - self.started, 1),
+                'samples': self._count + (1 if self._first_rss is not None else 0),
+                'cpu_avg': round(self._cpu_total / self._count, 1) if self._count else 0.0,
+                'cpu_max': round(self.max_cpu, 1),
+                'rss_start_mb': round((self._first_rss or 0) / mb, 1),
+                'rss_end_mb': round(last['rss'] / mb, 1) if last else 0.0,
+                'rss_peak_mb': round(self.peak_rss / mb, 1),
+                'rss_trend_mb_per_min': round(self.rss_trend() / mb, 2),
+                'threads_max': self.max_threads}
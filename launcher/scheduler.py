@@ -0,0 +1,162 @@
+import heapq, itertools, threading, time
+from typing import Dict, Iterator, List, Optional
+
+# Download priorities, higher runs first
+PRIORITY_LOW = 0      # Background updates
+PRIORITY_NORMAL = 1   # Installs
+PRIORITY_HIGH = 2     # Asked for again while queued
+
+# How a download thread ended
+DOWNLOAD_DONE = 'done'
+DOWNLOAD_PAUSED = 'paused'
+DOWNLOAD_CANCELLED = 'cancelled'
+DOWNLOAD_FAILED = 'failed'
+
+class DownloadInterrupted(Exception):
+    """A download stopped on request, raised from the download thread"""
+
+class DownloadPaused(DownloadInterrupted):
+    """Paused: the partial file is kept and the download resumes from it"""
+
+class DownloadCancelled(DownloadInterrupted):
+    """Cancelled: the partial file is deleted"""
+
+class TokenBucket:
+    """
+    Bandwidth limit shared by every download, in bytes per second (0 = unlimited).
+    consume() takes the bytes just received and sleeps the calling thread for as long as it went over the rate,
+    bursts are limited to burst_seconds worth of bytes.
+    """
+    def __init__(self, rate: int = 0, burst_seconds: float = 0.25):
+        self.burst_seconds = burst_seconds
+        self.lock = threading.Lock()
+        self.rate = 0
+        self.tokens = 0.0
+        self.last = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: int):
+        with self.lock:
+            if rate != self.rate:
+                self.rate = max(0, int(rate))
+                self.tokens = 0.0
+                self.last = time.monotonic()
+
+    def consume(self, nbytes: int):
+        with self.lock:
+            if not self.rate:
+                return
+            now = time.monotonic()
+            capacity = self.rate * self.burst_seconds
+            self.tokens = min(capacity, self.tokens + (now - self.last) * self.rate) - nbytes
+            self.last = now
+            # In debt: wait until the rate pays it back
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+class DownloadControl:
+    """Pause/cancel requests and bandwidth limit of one download, checked by the download thread between chunks"""
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        self.paused = False
+        self.cancelled = False
+
+    def pause(self):
+        self.paused = True
+
+    def cancel(self):
+        self.cancelled = True
+
+    def checkpoint(self, nbytes: int = 0):
+        """Raise if the download must stop, then throttle for the bytes just received"""
+        if self.cancelled:
+            raise DownloadCancelled("download cancelled")
+        if self.paused:
+            raise DownloadPaused("download paused")
+        if nbytes:
+            self.bucket.consume(nbytes)
+
+class DownloadScheduler:
+    """
+    Pending downloads of the launcher, used from the Tk thread.
+    Queued items run by priority (FIFO among equal priorities), paused items are held apart until resumed.
+    Every item gets a DownloadControl sharing the scheduler's TokenBucket.
+    """
+    def __init__(self):
+        self.bucket = TokenBucket()
+        self._heap: List[tuple] = []
+        self._counter = itertools.count()
+        self.paused: Dict[str, Dict] = {}
+
+    def push(self, item: Dict, priority: int = PRIORITY_NORMAL):
+        item['priority'] = priority
+        item['status'] = 'pending'
+        if 'control' not in item:
+            item['control'] = DownloadControl(self.bucket)
+        heapq.heappush(self._heap, (-priority, next(self._counter), item))
+
+    def pop(self) -> Optional[Dict]:
+        """Highest priority queued item, None when the queue is empty"""
+        if not self._heap:
+            return None
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Queued items in the order they will run"""
+        return (entry[2] for entry in sorted(self._heap))
+
+    def find(self, game_name: str) -> Optional[Dict]:
+        """Queued or paused item of a game"""
+        if game_name in self.paused:
+            return self.paused[game_name]
+        for entry in self._heap:
+            if entry[2]['game']['game_name'] == game_name:
+                return entry[2]
+        return None
+
+    def remove(self, game_name: str) -> Optional[Dict]:
+        """Take a game out of the queue (or out of the paused items)"""
+        if game_name in self.paused:
+            return self.paused.pop(game_name)
+        for index, entry in enumerate(self._heap):
+            if entry[2]['game']['game_name'] == game_name:
+                self._heap.pop(index)
+                heapq.heapify(self._heap)
+                return entry[2]
+        return None
+
+    def set_priority(self, game_name: str, priority: int) -> bool:
+        """Change the priority of a queued game, False if it is not queued"""
+        if game_name in self.paused:
+            self.paused[game_name]['priority'] = priority
+            return True
+        item = self.remove(game_name)
+        if item is None:
+            return False
+        self.push(item, priority)
+        return True
+
+    def hold(self, item: Dict):
+        """Keep a paused download until resume()"""
+        item['status'] = 'paused'
+        self.paused[item['game']['game_name']] = item
+
+    def resume(self, game_name: str) -> bool:
+        """Queue a paused download again, it resumes from its partial file"""
+        item = self.paused.pop(game_name, None)
+        if item is None:
+            return False
+        item['control'].paused = False
+        self.push(item, item['priority'])
+        return True
+
+    def clear(self) -> List[Dict]:
+        """Drop every queued and paused item, returns them"""
+        items = [entry[2] for entry in self._heap] + list(self.paused.values())
+        self._heap.clear()
+        self.paused.clear()
+        return items
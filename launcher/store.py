@@ -0,0 +1,184 @@
+import os, json, stat, errno, shutil, threading
+from typing import Dict, Iterable, List, Set
+from archive import safe_join
+
+# Linking is not possible here (other volume, filesystem without hardlinks, link limit): the file is copied
+LINK_ERRORS = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP)}
+WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+def remove_tree(path: str, ignore_errors: bool = False):
+    """shutil.rmtree that also deletes read-only files (Windows refuses to), for folders holding links to store blobs"""
+    def retry_writable(function, failed_path, exc_info):
+        try:
+            os.chmod(failed_path, stat.S_IWRITE | stat.S_IREAD)
+            function(failed_path)
+        except OSError:
+            if not ignore_errors:
+                raise
+
+    shutil.rmtree(path, onerror=retry_writable)
+
+class ContentStore:
+    """
+    Content-addressed file store (store/<sha256>) shared by every installed game.
+    Game folders are made of hardlinks to the blobs (copies where the filesystem cannot link), so a file shipped
+    by several games or versions is stored and downloaded once. Blobs and their links are read-only, and
+    store/index.json keeps the size and modification time of every blob: a blob written in place anyway no
+    longer matches them and is not used again. The index also lists the blobs each game references,
+    a blob is deleted when no game references it anymore.
+    """
+    def __init__(self, root: str):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.json')
+        self.lock = threading.RLock()
+        self.index: Dict[str, Dict] = self._load_index()
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+            if isinstance(index.get('games'), dict):
+                if not isinstance(index.get('blobs'), dict):
+                    # Blobs stored before their stamps were recorded are not trusted
+                    index['blobs'] = {}
+                return index
+        except Exception:
+            pass
+        return {'games': {}, 'blobs': {}}
+
+    def _save_index(self):
+        """Write the index (caller holds the lock)"""
+        os.makedirs(self.root, exist_ok=True)
+        temp_path = self.index_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump(self.index, f, indent=2)
+        os.replace(temp_path, self.index_path)
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256)
+
+    @staticmethod
+    def _stamp(path: str) -> List[int]:
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def has(self, sha256: str, size: int = -1) -> bool:
+        """True if the blob is stored unchanged since it was added (and has the given size)"""
+        with self.lock:
+            stamp = self.index['blobs'].get(sha256)
+            if stamp is None or (size >= 0 and stamp[0] != size):
+                return False
+            try:
+                return self._stamp(self.blob_path(sha256)) == stamp
+            except OSError:
+                return False
+
+    def _drop_blob(self, sha256: str):
+        """Delete a blob and its stamp (caller holds the lock)"""
+        self.index['blobs'].pop(sha256, None)
+        path = self.blob_path(sha256)
+        try:
+            # Read-only, Windows refuses to delete it as is
+            os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _protect(path: str):
+        """Make a blob (and every link to it) read-only"""
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+        if mode & WRITE_BITS:
+            os.chmod(path, mode & ~WRITE_BITS)
+
+    @staticmethod
+    def _link_or_copy(source: str, target: str):
+        """Hardlink source to target, replacing target, copying where hardlinks are not possible"""
+        if os.path.exists(target) and os.path.samefile(source, target):
+            # Already linked (a rename between two links of the same file would do nothing)
+            return
+        temp_path = target + '.link'
+        try:
+            os.link(source, temp_path)
+        except OSError as e:
+            if e.errno not in LINK_ERRORS:
+                raise
+            shutil.copyfile(source, temp_path)
+        os.replace(temp_path, target)
+
+    def materialize(self, sha256: str, target: str, size: int = -1) -> bool:
+        """Create target from a stored blob, False if the blob is missing or changed since it was stored"""
+        with self.lock:
+            if not self.has(sha256, size):
+                return False
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            try:
+                self._protect(self.blob_path(sha256))
+                self._link_or_copy(self.blob_path(sha256), target)
+                return True
+            except OSError as e:
+                print(f"Error materializing {target} from the store: {e}")
+                return False
+
+    def _store(self, source: str, sha256: str):
+        """Make a verified file of a game folder the blob sha256, linked (copied where it cannot be) and read-only"""
+        blob = self.blob_path(sha256)
+        self._protect(source)
+        # Deleted first, a read-only file cannot be replaced on Windows
+        self._drop_blob(sha256)
+        self._link_or_copy(source, blob)
+        self._protect(blob)
+        self.index['blobs'][sha256] = self._stamp(blob)
+
+    def adopt(self, game_name: str, folder: str, manifest: List[Dict], keep: Iterable[str] = ()):
+        """
+        Deduplicate the files of folder, already verified against manifest by the caller (nothing is hashed again):
+        a file with an intact blob is replaced by a link to it, any other becomes the blob.
+        The game then references the blobs of manifest plus keep (e.g. its previous version).
+        """
+        with self.lock:
+            os.makedirs(self.root, exist_ok=True)
+            for entry in manifest:
+                path = safe_join(folder, entry['path'])
+                if path is None or not os.path.isfile(path):
+                    continue
+                try:
+                    if self.has(entry['sha256'], entry['size']):
+                        # Identical bytes already stored, keep one copy on disk
+                        self._protect(self.blob_path(entry['sha256']))
+                        self._link_or_copy(self.blob_path(entry['sha256']), path)
+                    else:
+                        # New, or a blob changed since it was stored: replaced by this verified file
+                        self._store(path, entry['sha256'])
+                except OSError as e:
+                    print(f"Error storing {entry['path']}: {e}")
+
+            self._set_references(game_name, {entry['sha256'] for entry in manifest} | set(keep))
+
+    def release(self, game_name: str):
+        """Drop every reference of an uninstalled game, deleting the blobs no other game uses"""
+        with self.lock:
+            self._set_references(game_name, set())
+
+    def references(self, game_name: str) -> Set[str]:
+        with self.lock:
+            return set(self.index['games'].get(game_name, []))
+
+    def _set_references(self, game_name: str, hashes: Set[str]):
+        """Replace the references of a game and collect the blobs nobody references (caller holds the lock)"""
+        dropped = set(self.index['games'].get(game_name, [])) - hashes
+        if hashes:
+            self.index['games'][game_name] = sorted(hashes)
+        else:
+            self.index['games'].pop(game_name, None)
+
+        if dropped:
+            referenced = set()
+            for game_hashes in self.index['games'].values():
+                referenced.update(game_hashes)
+            for sha256 in dropped - referenced:
+                try:
+                    self._drop_blob(sha256)
+                except OSError as e:
+                    print(f"Error deleting blob {sha256}: {e}")
+        self._save_index()
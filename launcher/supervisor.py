@@ -0,0 +1,99 @@
+import os, select, subprocess, threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+class ProcessSupervisor:
+    """
+    Waits for the exit of any number of processes and calls on_exit(key, return_code) exactly once for each,
+    from a supervisor thread. Nothing polls: on Linux one thread blocks in select() on the pidfd of every
+    supervised subprocess.Popen, elsewhere (and for Popen-like handles such as ForkedGame) a thread per process
+    blocks in wait().
+    """
+    def __init__(self, on_exit: Callable[[str, int], None]):
+        self.on_exit = on_exit
+        self.lock = threading.Lock()
+        # id(process) -> (key, process, pidfd or None)
+        self._watched: Dict[int, Tuple[str, object, Optional[int]]] = {}
+        self._pidfd_thread: Optional[threading.Thread] = None
+        self._wake_read, self._wake_write = os.pipe() if hasattr(os, 'pidfd_open') else (None, None)
+        self._closed = False
+
+    def watch(self, key: str, process):
+        """Supervise a started process, on_exit(key, code) follows its exit (even if it already exited)"""
+        pidfd = None
+        if isinstance(process, subprocess.Popen) and self._wake_read is not None:
+            try:
+                # The child is not reaped before wait(), so this works even if it already exited
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+
+        with self.lock:
+            self._watched[id(process)] = (key, process, pidfd)
+            if pidfd is not None and self._pidfd_thread is None:
+                self._pidfd_thread = threading.Thread(target=self._pidfd_loop, daemon=True, name='process-supervisor')
+                self._pidfd_thread.start()
+
+        if pidfd is not None:
+            # Make the select() pick up the new pidfd
+            os.write(self._wake_write, b'\0')
+        else:
+            threading.Thread(target=self._wait_thread, args=(process,), daemon=True, name=f'supervise-{key}').start()
+
+    def _pidfd_loop(self):
+        while True:
+            with self.lock:
+                if self._closed:
+                    break
+                pidfds = {pidfd: process for _, process, pidfd in self._watched.values() if pidfd is not None}
+            try:
+                readable, _, _ = select.select([self._wake_read, *pidfds], [], [])
+            except (OSError, ValueError):
+                # A pidfd was closed by close() meanwhile
+                continue
+            for fd in readable:
+                if fd == self._wake_read:
+                    os.read(self._wake_read, 4096)
+                elif fd in pidfds:
+                    # Readable pidfd: the process exited, wait() only reaps it
+                    self._finish(pidfds[fd], pidfds[fd].wait())
+
+    def _wait_thread(self, process):
+        try:
+            return_code = process.wait()
+        except Exception as e:
+            print(f"Error waiting for process: {e}")
+            return_code = -1
+        self._finish(process, return_code)
+
+    def _finish(self, process, return_code: int):
+        with self.lock:
+            entry = self._watched.pop(id(process), None)
+        if entry is None:
+            # Already reported
+            return
+        key, _, pidfd = entry
+        if pidfd is not None:
+            os.close(pidfd)
+        try:
+            self.on_exit(key, return_code)
+        except Exception as e:
+            print(f"Error in process exit handler: {e}")
+
+    def running(self) -> List[str]:
+        """Keys of the processes still running"""
+        with self.lock:
+            return [key for key, _, _ in self._watched.values()]
+
+    def is_running(self, key: str) -> bool:
+        return key in self.running()
+
+    def close(self):
+        """Stop supervising, no exit event is emitted afterwards"""
+        with self.lock:
+            self._closed = True
+            watched, self._watched = self._watched, {}
+        for _, _, pidfd in watched.values():
+            if pidfd is not None:
+                os.close(pidfd)
+        if self._wake_write is not None:
+            os.write(self._wake_write, b'\0')
@@ -0,0 +1,247 @@
+"""
+Pre-warmed game runtime (Linux only).
+The zygote is started once with the game interpreter: `python zygote.py <socket>`. It imports pygame and the
+LunaEngine modules the games use, probes the SDL video driver, then forks a child for every game launched,
+so a game starts with everything already imported. The launcher side is GameZygote, a forked game is
+handled through ForkedGame, which behaves like the subprocess.Popen of a spawned game.
+"""
+import os, sys, json, shutil, struct, select, signal, socket, tempfile, subprocess, threading, traceback
+from typing import Dict, List, Optional
+
+LAUNCHER_DIR = os.path.dirname(os.path.abspath(__file__))
+ZYGOTE_SCRIPT = os.path.join(LAUNCHER_DIR, 'zygote.py')
+BOOTSTRAP_SCRIPT = os.path.join(LAUNCHER_DIR, 'game_bootstrap.py')
+WARM_MODULES = ('pygame', 'lunaengine.core', 'lunaengine.ui', 'lunaengine.graphics')
+
+class ForkedGame:
+    """subprocess.Popen-like handle (stdout, stderr, poll, wait, terminate, kill) of a game forked by the zygote"""
+    def __init__(self, pid: int, conn: socket.socket, reader, stdout, stderr):
+        self.pid = pid
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode: Optional[int] = None
+        self._conn = conn
+        self._reader = reader
+        self._exited = threading.Event()
+        threading.Thread(target=self._wait_exit, daemon=True).start()
+
+    def _wait_exit(self):
+        """The zygote reaps the game and sends 'exit <code>' on the request connection"""
+        try:
+            with self._conn, self._reader:
+                line = self._reader.readline().split()
+            self.returncode = int(line[1]) if len(line) == 2 and line[0] == 'exit' else -1
+        except (OSError, ValueError):
+            self.returncode = -1
+        self._exited.set()
+
+    def poll(self) -> Optional[int]:
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if not self._exited.wait(timeout):
+            raise subprocess.TimeoutExpired(f"forked game {self.pid}", timeout)
+        return self.returncode
+
+    def send_signal(self, sig: int):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+class GameZygote:
+    """
+    Launcher side of the zygote: starts it in the background and asks it to fork games.
+    Without socket_path the socket goes in a private directory (0700) created for this zygote.
+    """
+    def __init__(self, command: List[str], socket_path: Optional[str] = None):
+        self.command = command
+        self.socket_dir = None if socket_path else tempfile.mkdtemp(prefix='luna-zygote-')
+        self.socket_path = socket_path or os.path.join(self.socket_dir, 'zygote.sock')
+        self.process: Optional[subprocess.Popen] = None
+        self.ready = threading.Event()
+
+    @staticmethod
+    def supported() -> bool:
+        return sys.platform.startswith('linux') and hasattr(socket, 'send_fds') and os.path.exists(ZYGOTE_SCRIPT)
+
+    def start(self):
+        """Start the zygote, it is available once its modules are imported"""
+        os.makedirs(os.path.dirname(self.socket_path), mode=0o700, exist_ok=True)
+        # The zygote exits when its stdin closes, i.e. with the launcher
+        self.process = subprocess.Popen([*self.command, ZYGOTE_SCRIPT, self.socket_path],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+
+        def wait_ready():
+            for line in self.process.stdout:
+                if line.strip() == 'ready':
+                    self.ready.set()
+                    print(f"Game runtime pre-warmed (pid {self.process.pid})")
+                    break
+            self.process.stdout.close()
+
+        threading.Thread(target=wait_ready, daemon=True).start()
+
+    @property
+    def available(self) -> bool:
+        return self.process is not None and self.process.poll() is None and self.ready.is_set()
+
+    def spawn(self, main_path: str, cwd: str, args: List[str], env: Dict[str, str]) -> ForkedGame:
+        """Fork a game from the zygote, its stdout/stderr are pipes read like those of a spawned game"""
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+        stdin = os.open(os.devnull, os.O_RDONLY)
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(self.socket_path)
+            request = json.dumps({'main': main_path, 'cwd': cwd, 'args': args, 'env': env}).encode()
+            socket.send_fds(conn, [request], [stdin, stdout_write, stderr_write])
+            # Kept for the exit line, which may already be buffered with the pid
+            reader = conn.makefile('r')
+            pid = int(reader.readline())
+        except (OSError, ValueError):
+            conn.close()
+            os.close(stdout_read)
+            os.close(stderr_read)
+            raise
+        finally:
+            # The child holds its own copies
+            for fd in (stdin, stdout_write, stderr_write):
+                os.close(fd)
+        return ForkedGame(pid, conn, reader, os.fdopen(stdout_read, 'r'), os.fdopen(stderr_read, 'r'))
+
+    def stop(self):
+        if self.process is not None and self.process.poll() is None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                self.process.kill()
+        self.process = None
+        self.ready.clear()
+        if self.socket_dir is not None:
+            shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+def warm():
+    """Import what the games import and load the SDL video driver, leaving no display connection open to fork"""
+    import importlib
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"zygote: could not preload {name}: {e}", file=sys.stderr)
+    try:
+        import pygame
+        pygame.font.init()
+        # Loads the video driver libraries, the display itself is opened again by the game after the fork
+        pygame.display.init()
+        print(f"zygote: SDL video driver {pygame.display.get_driver()}", file=sys.stderr)
+        pygame.display.quit()
+    except Exception as e:
+        print(f"zygote: SDL probe failed: {e}", file=sys.stderr)
+
+def _run_child(request: Dict, fds: List[int]):
+    """In the forked child: take over the launcher's pipes and run the game"""
+    os.setsid()
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    sys.stdout.reconfigure(line_buffering=True)
+    os.chdir(request['cwd'])
+    os.environ.update(request.get('env', {}))
+
+    import atexit, game_bootstrap
+    code = 0
+    try:
+        game_bootstrap.run(request['main'], request['args'])
+    except SystemExit as e:
+        if isinstance(e.code, int) or e.code is None:
+            code = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    # Clean shutdown (pygame.quit...) as on a normal interpreter exit
+    atexit._run_exitfuncs()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+def _peer_uid(conn: socket.socket) -> int:
+    """User id of the process connected to the socket (SO_PEERCRED: pid, uid, gid)"""
+    _, uid, _ = struct.unpack('3i', conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+    return uid
+
+def serve(socket_path: str):
+    """Zygote main loop, single threaded so nothing holds a lock when forking"""
+    warm()
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    # Only our own user may ask for a fork, whatever the directory and umask
+    os.chmod(socket_path, 0o600)
+    server.listen(4)
+    print('ready', flush=True)
+
+    children: Dict[int, socket.socket] = {}
+    try:
+        while True:
+            readable, _, _ = select.select([server, sys.stdin], [], [], 0.5)
+            if sys.stdin in readable and not os.read(sys.stdin.fileno(), 1024):
+                # The launcher is gone
+                break
+            if server in readable:
+                conn, _ = server.accept()
+                try:
+                    if _peer_uid(conn) != os.getuid():
+                        raise PermissionError("connection from another user refused")
+                    message, fds, _, _ = socket.recv_fds(conn, 1 << 16, 3)
+                    request = json.loads(message.decode())
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+                    pid = os.fork()
+                    if pid == 0:
+                        server.close()
+                        conn.close()
+                        _run_child(request, fds)
+                    for fd in fds:
+                        os.close(fd)
+                    conn.sendall(f"{pid}\n".encode())
+                    children[pid] = conn
+                except (OSError, ValueError) as e:
+                    print(f"zygote: launch failed: {e}", file=sys.stderr)
+                    conn.close()
+
+            # Report the games that exited
+            while children:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                conn = children.pop(pid, None)
+                if conn is not None:
+                    try:
+                        conn.sendall(f"exit {os.waitstatus_to_exitcode(status)}\n".encode())
+                    except OSError:
+                        pass
+                    conn.close()
+    finally:
+        server.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+if __name__ == '__main__':
+    serve(sys.argv[1])
@@ -0,0 +1,46 @@
+import time
+from catalog import Catalog, CatalogIndex, bits_to_ids
+
+def make_catalog(count):
+    games = []
+    for i in range(count):
+        games.append({'game_name': f'Game {i}', 'game_description': f'Description of puzzle number {i}',
+                      'game_author': f'Author {i % 50}', 'game_category': ('Arcade', 'Puzzle', 'Action')[i % 3],
+                      'game_tags': ['2d', f'tag{i % 20}'], 'game_version': f'0.{i % 7}.{i % 11}',
+                      'total_size': i * 10, 'total_files': i % 30, 'game_compact_file': f'Game-{i}'})
+    return {'games': games}
+
+def test_index_is_built_with_the_catalog_not_on_first_search():
+    index = CatalogIndex(make_catalog(100)['games'])
+    assert index._gram_bits
+    grams = index._gram_bits
+    index.search('puz')
+    assert index._gram_bits is grams
+
+def test_index_is_built_off_the_calling_thread():
+    catalog = Catalog(make_catalog(2000))
+    index = catalog.wait_index(timeout=30)
+    assert index is not None and index.games is catalog.games
+
+def test_prebuilt_index_is_used_as_is():
+    data = make_catalog(10)
+    index = CatalogIndex(data['games'])
+    catalog = Catalog()
+    catalog.set_data(data, index)
+    assert catalog.index is index
+
+def test_stale_index_is_not_returned():
+    catalog = Catalog(make_catalog(10))
+    old = catalog.wait_index(timeout=30)
+    catalog.set_data(make_catalog(20))
+    assert catalog.index is not old
+    assert catalog.wait_index(timeout=30).size == 20
+
+def test_first_search_on_a_large_catalog_is_fast():
+    index = CatalogIndex(make_catalog(10000)['games'])
+    start = time.perf_counter()
+    bits = index.search('puzzle number 4242')
+    elapsed = time.perf_counter() - start
+    assert [index.games[i]['game_name'] for i in bits_to_ids(bits)] == ['Game 4242']
+    # Building the grams alone takes about a second at this size
+    assert elapsed < 0.2
@@ -0,0 +1,71 @@
+import os, stat, hashlib
+from store import ContentStore, remove_tree
+
+def make_game(folder, files):
+    """Write a game folder and return its manifest"""
+    manifest = []
+    for path, content in files.items():
+        target = os.path.join(folder, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, 'wb') as f:
+            f.write(content)
+        manifest.append({'path': path, 'size': len(content), 'sha256': hashlib.sha256(content).hexdigest()})
+    return manifest
+
+def test_identical_files_share_one_inode(tmp_path):
+    store = ContentStore(str(tmp_path / 'store'))
+    font = b'shared font bytes' * 100
+    first = make_game(str(tmp_path / 'A'), {'assets/font.ttf': font, 'main.py': b'print("a")'})
+    second = make_game(str(tmp_path / 'B'), {'fonts/font.ttf': font, 'main.py': b'print("b")'})
+    store.adopt('A', str(tmp_path / 'A'), first)
+    store.adopt('B', str(tmp_path / 'B'), second)
+
+    a, b = os.stat(tmp_path / 'A' / 'assets' / 'font.ttf'), os.stat(tmp_path / 'B' / 'fonts' / 'font.ttf')
+    blob = os.stat(store.blob_path(first[0]['sha256']))
+    assert a.st_ino == b.st_ino == blob.st_ino
+    assert blob.st_nlink == 3
+    # Links are read-only so a game cannot change the blob through its copy
+    assert not stat.S_IMODE(blob.st_mode) & (stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH)
+    assert os.stat(tmp_path / 'A' / 'main.py').st_ino != os.stat(tmp_path / 'B' / 'main.py').st_ino
+
+def test_materialize_links_the_blob(tmp_path):
+    store = ContentStore(str(tmp_path / 'store'))
+    manifest = make_game(str(tmp_path / 'A'), {'data.bin': b'x' * 4096})
+    store.adopt('A', str(tmp_path / 'A'), manifest)
+    target = str(tmp_path / 'staging' / 'data.bin')
+    assert store.materialize(manifest[0]['sha256'], target, manifest[0]['size'])
+    assert os.path.samefile(target, store.blob_path(manifest[0]['sha256']))
+
+def test_blob_written_in_place_is_not_reused(tmp_path):
+    store = ContentStore(str(tmp_path / 'store'))
+    manifest = make_game(str(tmp_path / 'A'), {'data.bin': b'x' * 4096})
+    store.adopt('A', str(tmp_path / 'A'), manifest)
+    sha = manifest[0]['sha256']
+    blob = store.blob_path(sha)
+    os.chmod(blob, stat.S_IREAD | stat.S_IWRITE)
+    with open(blob, 'r+b') as f:
+        f.write(b'y')
+    # Moved on explicitly, a write within the filesystem's timestamp resolution may keep the old mtime
+    os.utime(blob, ns=(0, os.stat(blob).st_mtime_ns + 1))
+    assert not store.has(sha, 4096)
+    assert not store.materialize(sha, str(tmp_path / 'staging' / 'data.bin'), 4096)
+
+    # A verified copy from the next install replaces it
+    replacement = make_game(str(tmp_path / 'B'), {'data.bin': b'x' * 4096})
+    store.adopt('B', str(tmp_path / 'B'), replacement)
+    assert store.has(sha, 4096)
+
+def test_release_deletes_unreferenced_blobs(tmp_path):
+    store = ContentStore(str(tmp_path / 'store'))
+    shared = b'shared' * 10
+    first = make_game(str(tmp_path / 'A'), {'shared.bin': shared, 'a.bin': b'a'})
+    second = make_game(str(tmp_path / 'B'), {'shared.bin': shared})
+    store.adopt('A', str(tmp_path / 'A'), first)
+    store.adopt('B', str(tmp_path / 'B'), second)
+
+    remove_tree(str(tmp_path / 'A'))
+    store.release('A')
+    assert not os.path.exists(store.blob_path(first[1]['sha256']))
+    assert store.has(first[0]['sha256'], len(shared))
+    # Reloaded from store/index.json
+    assert ContentStore(str(tmp_path / 'store')).has(first[0]['sha256'], len(shared))